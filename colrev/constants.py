@@ -188,6 +188,7 @@ class LocalIndexFields:
     ID = "id"
     CITATION_KEY = "citation_key"
     BIBTEX = "bibtex"
+    RECORD_JSON = "record_json"
     TEI = "tei"
     DBLP_KEY = "dblp_key"
     TOC_KEY = "toc_key"
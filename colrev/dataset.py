@@ -2,8 +2,10 @@
 """Functionality for data/records.bib and git repository."""
 from __future__ import annotations
 
+import hashlib
+import io
 import os
-import tempfile
+import pickle
 import time
 import typing
 from pathlib import Path
@@ -13,7 +15,9 @@ import git
 from git import GitCommandError
 from git import InvalidGitRepositoryError
 
+import colrev
 import colrev.exceptions as colrev_exceptions
+import colrev.history_cache
 import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.ops.check
@@ -21,11 +25,11 @@ import colrev.process.operation
 import colrev.record.record
 import colrev.record.record_id_setter
 import colrev.record.record_prep
+import colrev.writer.bib
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import FileSets
 from colrev.constants import RecordState
-from colrev.writer.write_utils import to_string
 
 # pylint: disable=too-many-public-methods
 
@@ -37,6 +41,9 @@ class Dataset:
 
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         self.review_manager = review_manager
+        # Serialized records (reused for unchanged records when saving)
+        self._record_strings_cache: dict = {}
+        self._history_cache: typing.Optional[colrev.history_cache.HistoryCache] = None
 
         try:
             # In most cases, the repo should exist
@@ -82,13 +89,8 @@ class Dataset:
 
         current_origin_states_dict = {}
         if records_string != "":
-            with tempfile.NamedTemporaryFile(
-                mode="wb", delete=False, suffix=".bib"
-            ) as temp_file:
-                temp_file.write(records_string.encode("utf-8"))
-                temp_file_path = Path(temp_file.name)
             bib_loader = colrev.loader.bib.BIBLoader(
-                filename=temp_file_path,
+                file_object=io.StringIO(records_string),
                 logger=self.review_manager.logger,
                 unique_id_field="ID",
             )
@@ -152,18 +154,36 @@ class Dataset:
                 reached_target_commit = True
 
             # Read and parse the records file from the current commit
-            filecontents = (
+            records_dict = self.load_records_from_blob(
                 current_commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-            ).data_stream.read()
-
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8", "replace"),
-                implementation="bib",
-                logger=self.review_manager.logger,
             )
             if records_dict:
                 yield records_dict
 
+    def _get_history_cache(self) -> colrev.history_cache.HistoryCache:
+        if self._history_cache is None:
+            self._history_cache = colrev.history_cache.HistoryCache(
+                path=self.review_manager.paths.history_cache,
+                logger=self.review_manager.logger,
+            )
+        return self._history_cache
+
+    def load_records_from_blob(self, blob: git.Blob) -> dict:
+        """Load the records from a version of the records file (git blob)
+
+        The parsed versions are cached (per blob SHA).
+        """
+        return self._get_history_cache().get_records(blob)
+
+    def load_record_from_blob(
+        self, blob: git.Blob, record_id: str
+    ) -> typing.Optional[dict]:
+        """Load a record from a version of the records file (git blob)
+
+        Returns None if the record is not in the version.
+        """
+        return self._get_history_cache().get_record(blob, record_id)
+
     def load_records_dict(
         self,
         *,
@@ -196,85 +216,86 @@ class Dataset:
             return bib_loader.get_record_header_items()
 
         if self.review_manager.paths.records.is_file():
-
-            records_dict = colrev.loader.load_utils.load(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
+            records_dict = self._load_cached_records_dict()
+            if records_dict is None:
+                records_dict = colrev.loader.load_utils.load(
+                    filename=self.review_manager.paths.records,
+                    logger=self.review_manager.logger,
+                    unique_id_field="ID",
+                )
+                self._cache_records_dict(records_dict)
 
         else:
             records_dict = {}
 
         return records_dict
 
+    def _get_records_cache_key(self) -> tuple:
+        # The git blob hash of the records file (and the CoLRev version)
+        contents = self.review_manager.paths.records.read_bytes()
+        blob_sha = hashlib.sha1(b"blob %d\0" % len(contents) + contents).hexdigest()
+        return (colrev.__version__, blob_sha)
+
+    def _load_cached_records_dict(self) -> typing.Optional[dict]:
+        """Load the parsed records from the cache (if the records file is unchanged)"""
+        try:
+            with open(self.review_manager.paths.records_cache, "rb") as file:
+                # Note : the key is pickled separately to validate it cheaply
+                if pickle.load(file) != self._get_records_cache_key():
+                    return None
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None  # e.g., if the cache is corrupted
+
+    def _cache_records_dict(self, records_dict: dict) -> None:
+        cache_file = self.review_manager.paths.records_cache
+        tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with open(tmp_file, "wb") as file:
+                pickle.dump(self._get_records_cache_key(), file)
+                pickle.dump(records_dict, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:  # pragma: no cover
+            pass  # the cache is optional
+
     def save_records_dict_to_file(self, records: dict) -> None:
         """Save the records dict"""
         # Note : this classmethod function can be called by CoLRev scripts
         # operating outside a CoLRev repo (e.g., sync)
 
-        bibtex_str = to_string(records_dict=records, implementation="bib")
+        if len(self._record_strings_cache) > 2 * len(records):
+            self._record_strings_cache.clear()  # drop outdated records
 
         with open(self.review_manager.paths.records, "w", encoding="utf-8") as out:
-            out.write(bibtex_str + "\n")
+            out.writelines(
+                colrev.writer.bib.iter_strings(
+                    records_dict=records, cache=self._record_strings_cache
+                )
+            )
+            out.write("\n")
 
         self._add_record_changes()
 
     def _save_record_list_by_id(self, records: dict) -> None:
+        # Replace the records in a single pass and an atomic rename
+        # (instead of rewriting the remaining file for every record)
+        records_file = self.review_manager.paths.records
+        contents = b""
+        if records_file.is_file():
+            contents = records_file.read_bytes()
+        contents = colrev.writer.bib.splice_records(
+            contents=contents, records_dict=records, cache=self._record_strings_cache
+        )
 
-        parsed = to_string(records_dict=records, implementation="bib")
-        record_list = [
-            {
-                Fields.ID: item[item.find("{") + 1 : item.find(",")],
-                "record": "@" + item + "\n",
-            }
-            for item in parsed.split("\n@")
-        ]
-        # Correct the first item
-        record_list[0]["record"] = "@" + record_list[0]["record"][2:]
-
-        current_id_str = "NOTSET"
-        if self.review_manager.paths.records.is_file():
-            with open(self.review_manager.paths.records, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
-                        ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
-
-        if len(record_list) > 0:
-            with open(
-                self.review_manager.paths.records, "a", encoding="utf8"
-            ) as m_refs:
-                for item in record_list:
-                    m_refs.write(item["record"])
+        tmp_file = records_file.with_name(f".{records_file.name}.tmp")
+        with open(tmp_file, "wb") as file:
+            file.write(contents)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_file, records_file)
 
         self._add_record_changes()
 
@@ -18,6 +18,8 @@ class GrobidService:
 
     GROBID_URL = "http://localhost:8070"
     GROBID_IMAGE = "lfoppiano/grobid:0.8.0"
+    # Number of concurrent requests (GROBID handles 10 concurrent requests by default)
+    MAX_WORKERS = 8
 
     def __init__(
         self,
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import re
+import threading
+import typing
 
 import pycountry
+from lingua import LanguageDetector  # pylint: disable=no-name-in-module
 from lingua import LanguageDetectorBuilder  # pylint: disable=no-name-in-module
 
 import colrev.exceptions as colrev_exceptions
@@ -17,24 +20,43 @@ class LanguageService:
 
     _eng_false_negatives = ["editorial", "introduction"]
 
-    def __init__(self) -> None:
+    # Note : the language detector and the language code mapping are
+    # shared by all instances (process-wide) and loaded lazily (on first use)
+    # because they have a heavy memory footprint and take time to load.
+    _lingua_language_detector: typing.Optional[LanguageDetector] = None
+    _lang_code_mapping: dict = {}
+    _lock = threading.Lock()
+
+    @property
+    def lingua_language_detector(self) -> LanguageDetector:
+        """The (shared) Lingua language detector"""
         # Note : Lingua is tested/evaluated relative to other libraries:
         # https://github.com/pemistahl/lingua-py
         # It performs particularly well for short strings (single words/word pairs)
         # The langdetect library is non-deterministic, especially for short strings
         # https://pypi.org/project/langdetect/
-
-        self._lingua_language_detector = (
-            LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
-        )
-
+        if LanguageService._lingua_language_detector is None:
+            with LanguageService._lock:
+                if LanguageService._lingua_language_detector is None:
+                    LanguageService._lingua_language_detector = (
+                        LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
+                    )
+        return LanguageService._lingua_language_detector
+
+    @property
+    def lang_code_mapping(self) -> dict:
+        """The (shared) mapping of language names to ISO 639-3 codes"""
         # Language formats: ISO 639-1 standard language codes
         # https://pypi.org/project/langcodes/
         # https://github.com/flyingcircusio/pycountry
-
-        self._lang_code_mapping = {}
-        for country in pycountry.languages:
-            self._lang_code_mapping[country.name.lower()] = country.alpha_3
+        if not LanguageService._lang_code_mapping:
+            with LanguageService._lock:
+                if not LanguageService._lang_code_mapping:
+                    LanguageService._lang_code_mapping = {
+                        country.name.lower(): country.alpha_3
+                        for country in pycountry.languages
+                    }
+        return LanguageService._lang_code_mapping
 
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
@@ -82,14 +104,7 @@ class LanguageService:
             return "chi"
         return ""  # pragma: no cover
 
-    def compute_language(self, *, text: str) -> str:
-        """Compute the most likely language code"""
-
-        if text.lower() in self._eng_false_negatives:
-            return "eng"
-
-        language = self._lingua_language_detector.detect_language_of(text)
-
+    def _to_language_code(self, *, text: str, language: typing.Any) -> str:
         if language:
             # There are too many errors/classifying papers as latin
             if language.iso_code_639_3.name.lower() == "lat":
@@ -98,13 +113,49 @@ class LanguageService:
 
         return self._determine_alphabet(text)
 
+    def compute_language(self, *, text: str) -> str:
+        """Compute the most likely language code"""
+
+        if text.lower() in self._eng_false_negatives:
+            return "eng"
+
+        language = self.lingua_language_detector.detect_language_of(text)
+        return self._to_language_code(text=text, language=language)
+
+    def compute_languages(self, texts: typing.List[str]) -> typing.List[str]:
+        """Compute the most likely language codes of a list of texts
+
+        The texts are classified in parallel (by the Lingua detector),
+        which is much faster than calling compute_language() for each text.
+        """
+
+        to_detect = [
+            text for text in texts if text.lower() not in self._eng_false_negatives
+        ]
+        detected = dict(
+            zip(
+                to_detect,
+                self.lingua_language_detector.detect_languages_in_parallel_of(
+                    to_detect
+                ),
+            )
+        )
+        return [
+            (
+                self._to_language_code(text=text, language=detected[text])
+                if text in detected
+                else "eng"
+            )
+            for text in texts
+        ]
+
     def compute_language_confidence_values(self, *, text: str) -> list:
         """Computes the most likely languages of a string and their language codes"""
 
         if text.lower() in self._eng_false_negatives:
             return [("eng", 1.0)]
 
-        predictions = self._lingua_language_detector.compute_language_confidence_values(
+        predictions = self.lingua_language_detector.compute_language_confidence_values(
             text=text
         )
         predictions_unified = []
@@ -147,8 +198,8 @@ class LanguageService:
             record.data[Fields.LANGUAGE] = "deu"
 
         if len(record.data[Fields.LANGUAGE]) != 3:
-            if record.data[Fields.LANGUAGE].lower() in self._lang_code_mapping:
-                record.data[Fields.LANGUAGE] = self._lang_code_mapping[
+            if record.data[Fields.LANGUAGE].lower() in self.lang_code_mapping:
+                record.data[Fields.LANGUAGE] = self.lang_code_mapping[
                     record.data[Fields.LANGUAGE].lower()
                 ]
 
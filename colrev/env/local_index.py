@@ -5,7 +5,6 @@ from __future__ import annotations
 import sqlite3
 import typing
 from copy import deepcopy
-from multiprocessing import Lock
 from pathlib import Path
 
 import git
@@ -37,29 +36,56 @@ class LocalIndex:
         self.verbose_mode = verbose_mode
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
-        self.thread_lock = Lock()
+        # Read-only connections are reused across lookups (and threads)
+        self._sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+            read_only=True
+        )
+        self._sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC(
+            read_only=True
+        )
+        # Journal rankings (normalized journal_name: rankings), loaded on first use
+        self._journal_rankings: typing.Optional[dict] = None
+        # Records retrieved for a batch ((key, value): record, {} if not in the index)
+        self._prefetched_records: typing.Dict[typing.Tuple[str, str], dict] = {}
+
+    @classmethod
+    def _normalize_journal_name(cls, journal: str) -> str:
+        return " ".join(journal.lower().split())
+
+    def _load_journal_rankings(self) -> dict:
+        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings(
+            read_only=True
+        )
+        journal_rankings: dict = {}
+        for ranking in sqlite_index_ranking.select_all():
+            journal_rankings.setdefault(
+                self._normalize_journal_name(ranking["journal_name"]), []
+            ).append(ranking)
+        return journal_rankings
 
     def get_journal_rankings(self, journal: str) -> list:
-        """Get the journal rankings from the sqlite database"""
-        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
-        return sqlite_index_ranking.select(journal=journal)
+        """Get the journal rankings from the sqlite database
+
+        The rankings are loaded once and served from memory
+        (journal names are matched case- and whitespace-insensitively).
+        """
+        if self._journal_rankings is None:
+            self._journal_rankings = self._load_journal_rankings()
+        return self._journal_rankings.get(self._normalize_journal_name(journal), [])
 
     def _retrieve_based_on_colrev_id(
         self, cids_to_retrieve: list
     ) -> colrev.record.record.Record:
 
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
         for cid_to_retrieve in cids_to_retrieve:
             try:
-                retrieved_record = sqlite_index_record.get(
+                retrieved_record = self._sqlite_index_record.get(
                     key=Fields.COLREV_ID, value=cid_to_retrieve
                 )
                 return colrev.record.record.Record(retrieved_record)
 
             except colrev_exceptions.RecordNotInIndexException:
                 continue  # continue with the next cid_to_retrieve
-            finally:
-                sqlite_index_record.connection.close()
 
         raise colrev_exceptions.RecordNotInIndexException()
 
@@ -109,19 +135,14 @@ class LocalIndex:
     def search(self, query: str) -> list[colrev.record.record.Record]:
         """Run a search for records"""
 
+        records_to_return = []
         try:
-            self.thread_lock.acquire(timeout=60)
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            records_to_return = []
-            for record_dict in sqlite_index_record.search(query=query):
+            for record_dict in self._sqlite_index_record.search(query=query):
                 record = prepare_record_for_return(record_dict, include_file=False)
                 records_to_return.append(record)
 
         except sqlite3.OperationalError as exc:  # pragma: no cover
             print(exc)
-        finally:
-            sqlite_index_record.connection.close()
-            self.thread_lock.release()
 
         return records_to_return
 
@@ -129,18 +150,16 @@ class LocalIndex:
         """Determine the year of a paper based on its table-of-content (journal-volume-number)"""
 
         try:
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
             toc_key = colrev.record.record.Record(record_dict).get_toc_key()
             toc_items = []
             if self._toc_exists(toc_key):
-                toc_items = sqlite_index_toc.get_toc_items(toc_key=toc_key)
+                toc_items = self._sqlite_index_toc.get_toc_items(toc_key=toc_key)
 
             if not toc_items:
                 raise colrev_exceptions.TOCNotAvailableException()
 
             toc_records_colrev_id = toc_items[0]
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            record_dict = sqlite_index_record.get(
+            record_dict = self._sqlite_index_record.get(
                 key=Fields.COLREV_ID, value=toc_records_colrev_id
             )
 
@@ -153,32 +172,23 @@ class LocalIndex:
             colrev_exceptions.RecordNotInIndexException,
         ) as exc:
             raise colrev_exceptions.TOCNotAvailableException() from exc
-        finally:
-            sqlite_index_toc.connection.close()
 
     def _toc_exists(self, toc_item: str) -> bool:
         try:
-            self.thread_lock.acquire(timeout=60)
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
-            return sqlite_index_toc.exists(toc_item)
+            return self._sqlite_index_toc.exists(toc_item)
         except sqlite3.OperationalError:  # pragma: no cover
             pass  # return False
         except AttributeError:  # pragma: no cover
             # ie. no sqlite database available
             pass  # return False
-        finally:
-            sqlite_index_toc.connection.close()
-            self.thread_lock.release()
         return False
 
     def _get_toc_items(self, toc_key: str, *, search_across_tocs: bool) -> list:
-        sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
         toc_items = []
         if self._toc_exists(toc_key):
-            toc_items = sqlite_index_toc.get_toc_items(toc_key=toc_key)
+            toc_items = self._sqlite_index_toc.get_toc_items(toc_key=toc_key)
         else:
             if not search_across_tocs:
-                sqlite_index_toc.connection.close()
                 raise colrev_exceptions.RecordNotInIndexException()
 
         if not toc_items and search_across_tocs:
@@ -186,10 +196,9 @@ class LocalIndex:
 
                 partial_toc_key = toc_key.rsplit("|", 1)[0]
 
-                toc_items = sqlite_index_toc.get_toc_items(
+                toc_items = self._sqlite_index_toc.get_toc_items(
                     partial_toc_key=partial_toc_key
                 )
-                sqlite_index_toc.connection.close()
             except (
                 colrev_exceptions.NotTOCIdentifiableException,
                 KeyError,
@@ -217,11 +226,9 @@ class LocalIndex:
             raise colrev_exceptions.RecordNotInIndexException() from exc
 
         toc_items = self._get_toc_items(toc_key, search_across_tocs=search_across_tocs)
-        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
         try:
             for toc_records_colrev_id in toc_items:
-                record_dict = sqlite_index_record.get(
+                record_dict = self._sqlite_index_record.get(
                     key=Fields.COLREV_ID, value=toc_records_colrev_id
                 )
 
@@ -241,8 +248,6 @@ class LocalIndex:
         ):
             pass
 
-        sqlite_index_record.connection.close()
-
         raise colrev_exceptions.RecordNotInIndexException()
 
     def retrieve_based_on_colrev_pdf_id(
@@ -252,17 +257,52 @@ class LocalIndex:
         Convenience function to retrieve the indexed record_dict metadata
         based on a colrev_pdf_id
         """
-        try:
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            record_dict = sqlite_index_record.get(
-                key=Fields.PDF_ID, value=colrev_pdf_id
-            )
-            record_to_import = prepare_record_for_return(record_dict, include_file=True)
-            record_to_import.data.pop(Fields.FILE, None)
-        finally:
-            sqlite_index_record.connection.close()
+        record_dict = self._sqlite_index_record.get(
+            key=Fields.PDF_ID, value=colrev_pdf_id
+        )
+        record_to_import = prepare_record_for_return(record_dict, include_file=True)
+        record_to_import.data.pop(Fields.FILE, None)
         return record_to_import
 
+    def retrieve_many(
+        self,
+        *,
+        key: str,
+        values: typing.Iterable[str],
+        include_file: bool = False,
+        include_colrev_ids: bool = False,
+    ) -> typing.Dict[str, colrev.record.record.Record]:
+        """
+        Convenience function to retrieve the indexed records
+        based on a global key (e.g., doi) in a batch (value: record)
+        """
+        return {
+            value: prepare_record_for_return(
+                record_dict,
+                include_file=include_file,
+                include_colrev_ids=include_colrev_ids,
+            )
+            for value, record_dict in self._sqlite_index_record.get_many(
+                key=key, values=values
+            ).items()
+        }
+
+    def prefetch(self, *, key: str, values: typing.Iterable[str]) -> None:
+        """Retrieve the records of a batch based on a global key (e.g., doi)
+        in one query (replaces the previous batch, used by retrieve())"""
+        values = [value for value in values if value]
+        retrieved_records = self._sqlite_index_record.get_many(key=key, values=values)
+        self._prefetched_records = {
+            (key, value): retrieved_records.get(value, {}) for value in values
+        }
+
+    def _get_by_global_key(self, *, key: str, value: str) -> dict:
+        if (key, value) not in self._prefetched_records:
+            return self._sqlite_index_record.get(key=key, value=value)
+        if not self._prefetched_records[(key, value)]:
+            raise colrev_exceptions.RecordNotInIndexException()
+        return deepcopy(self._prefetched_records[(key, value)])
+
     def retrieve(
         self,
         record_dict: dict,
@@ -308,15 +348,7 @@ class LocalIndex:
                     or Fields.ID == key
                 ):
                     continue
-                try:
-                    sqlite_index_record = (
-                        colrev.env.local_index_sqlite.SQLiteIndexRecord()
-                    )
-                    retrieved_record_dict = sqlite_index_record.get(
-                        key=key, value=value
-                    )
-                finally:
-                    sqlite_index_record.connection.close()
+                retrieved_record_dict = self._get_by_global_key(key=key, value=value)
 
                 if key in retrieved_record_dict:
                     if retrieved_record_dict[key] == value:
@@ -4,21 +4,27 @@ from __future__ import annotations
 
 import collections
 import io
+import multiprocessing as mp
 import os
 import typing
 from copy import deepcopy
-from datetime import timedelta
+from functools import partial
 from multiprocessing import Lock
 from pathlib import Path
 from threading import Timer
 
+import git
 import pandas as pd
-import requests_cache
+from git.exc import GitCommandError
+from git.exc import InvalidGitRepositoryError
+from git.exc import NoSuchPathError
 from tqdm import tqdm
 
 import colrev.env.environment_manager
 import colrev.env.local_index_sqlite
 import colrev.env.resources
+import colrev.env.session_manager
+import colrev.env.tei_generator
 import colrev.env.tei_parser
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
@@ -26,6 +32,7 @@ import colrev.loader.load_utils
 import colrev.ops.check
 import colrev.record.record
 import colrev.review_manager
+import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
@@ -33,6 +40,7 @@ from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
 from colrev.constants import RecordState
 from colrev.env.local_index_prep import prepare_record_for_indexing
+from colrev.paths import PathManager
 from colrev.writer.write_utils import to_string
 
 
@@ -49,13 +57,31 @@ class LocalIndexBuilder:
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
         self.thread_lock = Lock()
+        # Note : progress bars of parallel processes would be garbled
+        self._show_record_progress = True
 
     def reinitialize_sqlite_db(self) -> None:
         """Reinitialize the SQLITE database ()"""
 
+        colrev.env.local_index_sqlite.connection_manager.close_all()
         Filepaths.LOCAL_INDEX_SQLITE_FILE.unlink(missing_ok=True)
+        # Note : the database uses WAL mode
+        for suffix in ["-wal", "-shm"]:
+            Path(f"{Filepaths.LOCAL_INDEX_SQLITE_FILE}{suffix}").unlink(missing_ok=True)
         colrev.env.local_index_sqlite.SQLiteIndexRecord(reinitialize=True)
         colrev.env.local_index_sqlite.SQLiteIndexTOC(reinitialize=True)
+        colrev.env.local_index_sqlite.SQLiteIndexWatermarks(reinitialize=True)
+
+    def migrate_sqlite_db(self) -> None:
+        """Migrate the SQLITE database created by previous versions"""
+
+        if not Filepaths.LOCAL_INDEX_SQLITE_FILE.is_file():
+            return
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        nr_migrated = sqlite_index_record.migrate()
+        sqlite_index_record.close()
+        if nr_migrated and self.verbose_mode:
+            print(f"Migrated {nr_migrated} records in the local index")
 
     def _outlets_duplicated(self) -> bool:
         print("Validate curated metadata")
@@ -119,47 +145,66 @@ class LocalIndexBuilder:
             for el in recs_to_index
         ]
         sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        stored_records = sqlite_index_record.get_many_by_id(
+            item.get(LocalIndexFields.ID, "") for item in list_to_add
+        )
+
+        # Note : records are inserted (and amended) in one transaction
+        items_to_upsert: typing.Dict[str, dict] = {}
         for item in list_to_add:
             for (
                 records_index_required_key
             ) in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS:
                 if records_index_required_key not in item:
                     item[records_index_required_key] = ""
-            if item[LocalIndexFields.ID] == "":
+            local_index_id = item[LocalIndexFields.ID]
+            if local_index_id == "":
                 print("NO ID IN RECORD")
                 continue
 
-            if not sqlite_index_record.exists(local_index_id=item[LocalIndexFields.ID]):
-                sqlite_index_record.insert(item)
+            if (
+                local_index_id not in stored_records
+                and local_index_id not in items_to_upsert
+            ):
+                items_to_upsert[local_index_id] = item
+                continue
+            if not curated_fields:
+                continue
+
+            if local_index_id in items_to_upsert:
+                upsert_item = items_to_upsert[local_index_id]
+                stored_record_dict = list(
+                    colrev.loader.load_utils.loads(
+                        load_string=upsert_item[LocalIndexFields.BIBTEX],
+                        implementation="bib",
+                        unique_id_field="ID",
+                    ).values()
+                )[0]
             else:
-                if not curated_fields:
-                    continue
-                try:
-                    stored_record = sqlite_index_record.get(
-                        key=Fields.COLREV_ID,
-                        value=item[Fields.COLREV_ID],
-                    )
+                upsert_item = item
+                stored_record_dict = stored_records[local_index_id]
 
-                    self._amend_record(
-                        sqlite_index_record=sqlite_index_record,
-                        stored_record_dict=stored_record,
-                        item_to_add=item,
-                        curated_fields=curated_fields,
-                    )
-                except colrev_exceptions.RecordNotInIndexException:  # pragma: no cover
-                    pass
+            bibtex = self._amend_record(
+                stored_record_dict=stored_record_dict,
+                item_to_add=item,
+                curated_fields=curated_fields,
+            )
+            upsert_item[LocalIndexFields.BIBTEX] = bibtex
+            upsert_item[LocalIndexFields.RECORD_JSON] = (
+                colrev.env.local_index_sqlite.get_record_json(bibtex)
+            )
+            items_to_upsert[local_index_id] = upsert_item
 
-        sqlite_index_record.commit()
+        sqlite_index_record.upsert_many(list(items_to_upsert.values()))
 
     def _amend_record(
         self,
         *,
-        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
         stored_record_dict: dict,
         item_to_add: dict,
         curated_fields: list,
-    ) -> None:
-        """Adds layered fields to amend existing records"""
+    ) -> str:
+        """Adds layered fields to amend existing records (returns the bibtex)"""
 
         item_record_dict = colrev.loader.load_utils.loads(
             load_string=item_to_add[LocalIndexFields.BIBTEX],
@@ -182,17 +227,13 @@ class LocalIndexBuilder:
                 source=item_record.get_field_provenance_source(curated_field),
             )
 
-        bibtex = to_string(
+        return to_string(
             records_dict={stored_record.data[Fields.ID]: stored_record.data},
             implementation="bib",
         )
 
-        sqlite_index_record.update(
-            local_index_id=item_to_add[LocalIndexFields.ID], bibtex=bibtex
-        )
-
     # pylint: disable=too-many-arguments
-    def index_records(
+    def _prepare_records(
         self,
         *,
         records: dict,
@@ -200,12 +241,12 @@ class LocalIndexBuilder:
         curation_url: str,
         curated_masterdata: bool,
         curated_fields: list,
-    ) -> None:
-        """Index a CoLRev project"""
-
+    ) -> typing.Tuple[list, dict]:
         recs_to_index = []
         toc_to_index: typing.Dict[str, str] = {}
-        for record_dict in tqdm(records.values()):
+        for record_dict in tqdm(
+            records.values(), disable=not self._show_record_progress
+        ):
             copy_for_toc_index = deepcopy(record_dict)
             try:
                 record_dict[Fields.METADATA_SOURCE_REPOSITORY_PATHS] = str(
@@ -230,6 +271,11 @@ class LocalIndexBuilder:
                     records_dict={record_dict[Fields.ID]: record_dict},
                     implementation="bib",
                 )
+                record_dict[LocalIndexFields.RECORD_JSON] = (
+                    colrev.env.local_index_sqlite.get_record_json(
+                        record_dict[LocalIndexFields.BIBTEX]
+                    )
+                )
                 record_dict = prepare_record_for_indexing(record_dict)
                 recs_to_index.append(record_dict)
 
@@ -247,6 +293,27 @@ class LocalIndexBuilder:
                     copy_for_toc_index=copy_for_toc_index,
                     curated_masterdata=curated_masterdata,
                 )
+        return recs_to_index, toc_to_index
+
+    # pylint: disable=too-many-arguments
+    def index_records(
+        self,
+        *,
+        records: dict,
+        repo_source_path: Path,
+        curation_url: str,
+        curated_masterdata: bool,
+        curated_fields: list,
+    ) -> None:
+        """Index a CoLRev project"""
+
+        recs_to_index, toc_to_index = self._prepare_records(
+            records=records,
+            repo_source_path=repo_source_path,
+            curation_url=curation_url,
+            curated_masterdata=curated_masterdata,
+            curated_fields=curated_fields,
+        )
         # Select fields and insert into index (sqlite)
 
         self._index_tei_document(recs_to_index)
@@ -275,74 +342,377 @@ class LocalIndexBuilder:
 
         return masterdata_curations
 
-    def index_colrev_project(self, repo_source_path: Path) -> None:  # pragma: no cover
-        """Index a CoLRev project"""
+    def _get_curation_settings(self, settings: colrev.settings.Settings) -> dict:
+        curation_endpoints = [
+            x
+            for x in settings.data.data_package_endpoints
+            if x["endpoint"] == "colrev.colrev_curation"
+        ]
+
+        curated_fields = []
+        curation_url = ""
+        if curation_endpoints:
+            curation_endpoint = curation_endpoints[0]
+            # Set masterdata_provenace to CURATED:{url}
+            curation_url = curation_endpoint["curation_url"]
+            if not settings.is_curated_masterdata_repo():
+                # Add curation_url to curated fields (provenance)
+                curated_fields = curation_endpoint["curated_fields"]
+
+        return {
+            "curated_fields": curated_fields,
+            "curation_url": curation_url,
+            "curated_masterdata": settings.is_curated_masterdata_repo(),
+        }
+
+    def _get_watermark_key(self, repo_source_path: Path) -> str:
+        return str(Path(repo_source_path).resolve())
+
+    def _set_watermark(self, repo_source_path: Path) -> None:
+        """Set the last indexed commit
+        ("" if the indexed records.bib differs from the commit)"""
+        repo = git.Repo(repo_source_path)
+        commit_sha = repo.head.commit.hexsha
+        if repo.is_dirty(path=PathManager.RECORDS_FILE_GIT):
+            commit_sha = ""
+        sqlite_index_watermarks = colrev.env.local_index_sqlite.SQLiteIndexWatermarks()
+        sqlite_index_watermarks.set(
+            self._get_watermark_key(repo_source_path), commit_sha
+        )
+        sqlite_index_watermarks.close()
+
+    def _get_changed_files(
+        self, *, repo_source_path: Path, watermark: str
+    ) -> typing.Optional[list]:
+        """Get the files that changed since the watermark
+        (None if changes cannot be determined, e.g., if the commit is not available,
+        if the records have uncommitted changes, or if the repository was removed)"""
+        if not watermark:
+            return None
         try:
-            if not Path(repo_source_path).is_dir():
-                print(f"Warning {repo_source_path} not a directory")
-                return
+            repo = git.Repo(repo_source_path)
+            if repo.is_dirty(path=PathManager.RECORDS_FILE_GIT):
+                return None
+            return repo.git.diff("--name-only", watermark, "HEAD").splitlines()
+        except (GitCommandError, NoSuchPathError, InvalidGitRepositoryError):
+            return None
+
+    def _load_records_at(self, *, repo: git.Repo, revision: str) -> dict:
+        try:
+            content = repo.git.show(f"{revision}:{PathManager.RECORDS_FILE_GIT}")
+        except GitCommandError:
+            return {}
+        return colrev.loader.load_utils.loads(
+            load_string=content,
+            implementation="bib",
+            unique_id_field="ID",
+        )
 
-            print(f"Index records from {repo_source_path}")
-            os.chdir(repo_source_path)
-            review_manager = colrev.review_manager.ReviewManager(
-                path_str=str(repo_source_path)
+    def _get_toc_key(self, record_dict: dict) -> str:
+        try:
+            return colrev.record.record.Record(record_dict).get_toc_key()
+        except colrev_exceptions.NotTOCIdentifiableException:
+            return ""
+
+    def _get_toc_changes(
+        self, *, changed_records: list, new_records: dict
+    ) -> typing.Tuple[set, dict]:
+        """Get the TOC items affected by the changed records
+        (and their colrev_ids based on the new records)"""
+        affected_toc_keys = {
+            self._get_toc_key(record_dict) for record_dict in changed_records
+        } - {""}
+        toc_to_index: typing.Dict[str, str] = {}
+        for record_dict in new_records.values():
+            if self._get_toc_key(record_dict) not in affected_toc_keys:
+                continue
+            self._drop_toc_item(
+                toc_to_index=toc_to_index,
+                copy_for_toc_index=deepcopy(record_dict),
+                curated_masterdata=True,
             )
+        return affected_toc_keys, toc_to_index
 
-            check_operation = colrev.ops.check.CheckOperation(review_manager)
-
-            if review_manager.dataset.get_repo().active_branch.name != "main":
-                print(
-                    f"{Colors.ORANGE}Warning: {repo_source_path} not on main branch{Colors.END}"
-                )
-
-            records_file = check_operation.review_manager.paths.records
-            if not records_file.is_file():
-                return
-            records = check_operation.review_manager.dataset.load_records_dict()
+    def _remove_indexed_records(self, *, recs_to_remove: list) -> None:
+        # Note : only records that were indexed from the repository are removed
+        # (records indexed from other repositories or amended by curated fields differ)
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        for record_dict in recs_to_remove:
+            local_index_id = record_dict[LocalIndexFields.ID]
+            if (
+                sqlite_index_record.get_bibtex(local_index_id=local_index_id)
+                == record_dict[LocalIndexFields.BIBTEX]
+            ):
+                sqlite_index_record.delete(local_index_id=local_index_id)
+        sqlite_index_record.commit()
+        sqlite_index_record.close()
 
-            curation_endpoints = [
-                x
-                for x in check_operation.review_manager.settings.data.data_package_endpoints
-                if x["endpoint"] == "colrev.colrev_curation"
-            ]
+    # pylint: disable=too-many-arguments
+    def _index_record_changes(
+        self,
+        *,
+        old_records: dict,
+        new_records: dict,
+        repo_source_path: Path,
+        curation_url: str,
+        curated_masterdata: bool,
+        curated_fields: list,
+    ) -> None:
+        """Index the records that changed between two versions of the records"""
+
+        removed_records = {
+            record_id: record_dict
+            for record_id, record_dict in old_records.items()
+            if new_records.get(record_id) != record_dict
+        }
+        added_records = {
+            record_id: record_dict
+            for record_id, record_dict in new_records.items()
+            if old_records.get(record_id) != record_dict
+        }
+        print(
+            f"Index changes ({len(removed_records)} records removed/changed, "
+            f"{len(added_records)} records added/changed)"
+        )
 
-            curated_fields = []
-            curation_url = ""
-            if curation_endpoints:
-                curation_endpoint = curation_endpoints[0]
-                # Set masterdata_provenace to CURATED:{url}
-                curation_url = curation_endpoint["curation_url"]
-                if (
-                    not check_operation.review_manager.settings.is_curated_masterdata_repo()
-                ):
-                    # Add curation_url to curated fields (provenance)
-                    curated_fields = curation_endpoint["curated_fields"]
-
-            curated_masterdata = (
-                check_operation.review_manager.settings.is_curated_masterdata_repo()
+        if curated_masterdata:
+            affected_toc_keys, toc_to_index = self._get_toc_changes(
+                changed_records=list(removed_records.values())
+                + list(added_records.values()),
+                new_records=new_records,
             )
 
-            self.index_records(
-                records=records,
+        self._remove_indexed_records(
+            recs_to_remove=self._prepare_records(
+                records=removed_records,
                 repo_source_path=repo_source_path,
-                curated_fields=curated_fields,
                 curation_url=curation_url,
                 curated_masterdata=curated_masterdata,
+                curated_fields=curated_fields,
+            )[0]
+        )
+
+        recs_to_index, _ = self._prepare_records(
+            records=added_records,
+            repo_source_path=repo_source_path,
+            curation_url=curation_url,
+            curated_masterdata=curated_masterdata,
+            curated_fields=curated_fields,
+        )
+        self._index_tei_document(recs_to_index)
+        self._add_index_records(
+            recs_to_index=recs_to_index, curated_fields=curated_fields
+        )
+
+        if curated_masterdata:
+            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc.delete(affected_toc_keys)
+            sqlite_index_toc.add(toc_to_index)
+
+    def _index_changes(self, repo_source_path: Path) -> bool:
+        """Index the changes since the last indexed commit (watermark)
+
+        Returns False if the changes cannot be indexed incrementally
+        (e.g., if the repository was not indexed before or if the settings changed).
+        Uncommitted changes are skipped (the watermark remains unchanged).
+        """
+
+        sqlite_index_watermarks = colrev.env.local_index_sqlite.SQLiteIndexWatermarks()
+        watermark = sqlite_index_watermarks.get(
+            self._get_watermark_key(repo_source_path)
+        )
+        sqlite_index_watermarks.close()
+        if watermark is None:
+            return False
+
+        try:
+            repo = git.Repo(repo_source_path)
+        except InvalidGitRepositoryError:
+            return False
+        # Note : indexed records are not removed when the project is indexed
+        # completely, i.e., uncommitted changes (in the index or in the
+        # records) require a reinitialization of the index (colrev env --index)
+        if watermark == "" or repo.is_dirty(path=PathManager.RECORDS_FILE_GIT):
+            print(
+                f"{Colors.ORANGE}Warning: {repo_source_path} has uncommitted changes "
+                f"(not indexed){Colors.END}"
+            )
+            return True
+        changed_files = self._get_changed_files(
+            repo_source_path=repo_source_path, watermark=watermark
+        )
+        if changed_files is None or str(PathManager.SETTINGS_FILE) in changed_files:
+            return False
+
+        if PathManager.RECORDS_FILE_GIT in changed_files:
+            settings = colrev.settings.load_settings(
+                settings_path=Path(repo_source_path) / PathManager.SETTINGS_FILE
             )
+            self._index_record_changes(
+                old_records=self._load_records_at(repo=repo, revision=watermark),
+                new_records=self._load_records_at(repo=repo, revision="HEAD"),
+                repo_source_path=repo_source_path,
+                **self._get_curation_settings(settings),
+            )
+        else:
+            print("No changes")
+
+        self._set_watermark(repo_source_path)
+        return True
+
+    def _can_index_incrementally(self, repo_source_paths: list) -> bool:
+        """Check whether the changes of all repositories can be indexed incrementally"""
+
+        if not Filepaths.LOCAL_INDEX_SQLITE_FILE.is_file():
+            return False
+        sqlite_index_watermarks = colrev.env.local_index_sqlite.SQLiteIndexWatermarks()
+        watermarks = sqlite_index_watermarks.get_all()
+        sqlite_index_watermarks.close()
+        if not watermarks:
+            return False
+
+        # Records of repositories that are no longer registered must be removed
+        if set(watermarks) - {self._get_watermark_key(p) for p in repo_source_paths}:
+            return False
+
+        for repo_source_path, watermark in watermarks.items():
+            changed_files = self._get_changed_files(
+                repo_source_path=Path(repo_source_path), watermark=watermark
+            )
+            if changed_files is None or str(PathManager.SETTINGS_FILE) in changed_files:
+                return False
+        return True
+
+    def prepare_colrev_project(
+        self, repo_source_path: Path
+    ) -> typing.Optional[dict]:  # pragma: no cover
+        """Load and prepare the records of a CoLRev project for indexing
+        (returns None if there are no records to index)"""
+
+        os.chdir(repo_source_path)
+        review_manager = colrev.review_manager.ReviewManager(
+            path_str=str(repo_source_path)
+        )
+
+        check_operation = colrev.ops.check.CheckOperation(review_manager)
+
+        if review_manager.dataset.get_repo().active_branch.name != "main":
+            print(
+                f"{Colors.ORANGE}Warning: {repo_source_path} not on main branch{Colors.END}"
+            )
+
+        records_file = check_operation.review_manager.paths.records
+        if not records_file.is_file():
+            return None
+        records = check_operation.review_manager.dataset.load_records_dict()
+
+        curation_settings = self._get_curation_settings(
+            check_operation.review_manager.settings
+        )
+        recs_to_index, toc_to_index = self._prepare_records(
+            records=records,
+            repo_source_path=repo_source_path,
+            **curation_settings,
+        )
+        return {
+            "repo_source_path": repo_source_path,
+            "recs_to_index": recs_to_index,
+            "toc_to_index": toc_to_index,
+            "curated_fields": curation_settings["curated_fields"],
+            "curated_masterdata": curation_settings["curated_masterdata"],
+        }
+
+    def _write_colrev_project(self, prepared_project: dict) -> None:
+        """Write the prepared records of a CoLRev project to the index"""
+
+        self._index_tei_document(prepared_project["recs_to_index"])
+        self._add_index_records(
+            recs_to_index=prepared_project["recs_to_index"],
+            curated_fields=prepared_project["curated_fields"],
+        )
+        if prepared_project["curated_masterdata"]:
+            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc.add(prepared_project["toc_to_index"])
+        self._set_watermark(prepared_project["repo_source_path"])
+
+    def _index_colrev_project_changes(self, repo_source_path: Path) -> bool:
+        """Index the changes of a CoLRev project (returns False if the
+        project has to be prepared and indexed completely)"""
+        if not Path(repo_source_path).is_dir():
+            print(f"Warning {repo_source_path} not a directory")
+            return True
+
+        print(f"Index records from {repo_source_path}")
+        self.migrate_sqlite_db()
+        return self._index_changes(repo_source_path)
+
+    def index_colrev_project(self, repo_source_path: Path) -> None:  # pragma: no cover
+        """Index a CoLRev project
+
+        If the project was indexed before, only the changes since the
+        last indexed commit (watermark) are indexed.
+        """
+        try:
+            if self._index_colrev_project_changes(repo_source_path):
+                return
+
+            prepared_project = self.prepare_colrev_project(repo_source_path)
+            if prepared_project is not None:
+                self._write_colrev_project(prepared_project)
 
         # TypeErrors are thrown when a repo is in interactive rebase mode
         except (colrev_exceptions.CoLRevException, TypeError) as exc:
             print(exc)
 
-    def index(self) -> None:  # pragma: no cover
-        """Index all registered CoLRev projects"""
+    def _index_colrev_projects_in_parallel(
+        self, repo_source_paths: list, *, processes: int
+    ) -> None:  # pragma: no cover
+        """Index CoLRev projects (records are prepared in parallel processes
+        and written by the main process, which owns the sqlite connection)"""
+
+        repo_source_paths_to_prepare = []
+        for repo_source_path in repo_source_paths:
+            try:
+                if not self._index_colrev_project_changes(repo_source_path):
+                    repo_source_paths_to_prepare.append(repo_source_path)
+            except (colrev_exceptions.CoLRevException, TypeError) as exc:
+                print(exc)
+
+        # Note : imap returns the projects in order (so that precedence
+        # of records in multiple projects corresponds to the sequential mode)
+        with mp.Pool(processes) as pool:
+            for repo_source_path, prepared_project in tqdm(
+                zip(
+                    repo_source_paths_to_prepare,
+                    pool.imap(
+                        partial(
+                            _prepare_colrev_project, verbose_mode=self.verbose_mode
+                        ),
+                        repo_source_paths_to_prepare,
+                    ),
+                ),
+                total=len(repo_source_paths_to_prepare),
+            ):
+                if prepared_project is None:
+                    continue
+                print(
+                    f"Write {len(prepared_project['recs_to_index'])} records "
+                    f"from {repo_source_path}"
+                )
+                self._write_colrev_project(prepared_project)
+
+    def index(
+        self, *, incremental: bool = True, processes: int = 1
+    ) -> None:  # pragma: no cover
+        """Index all registered CoLRev projects
+
+        If incremental, only the changes since the last indexed commits are indexed
+        (unless a full re-indexing is required, e.g., when repositories were removed).
+        With processes > 1, the records of the projects are prepared in parallel.
+        """
 
         # Note : this task takes long and does not need to run often
-        session = requests_cache.CachedSession(
-            str(Filepaths.PREP_REQUESTS_CACHE_FILE),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
-        )
+        session = colrev.env.session_manager.session_manager.get_cached_session()
         # Note : lambda is necessary to prevent immediate function call
         # pylint: disable=unnecessary-lambda
         Timer(0.1, lambda: session.remove_expired_responses()).start()
@@ -350,8 +720,6 @@ class LocalIndexBuilder:
         if self._outlets_duplicated():
             return
 
-        self.reinitialize_sqlite_db()
-
         repo_source_paths = [
             x["repo_source_path"] for x in self.environment_manager.local_repos()
         ]
@@ -368,16 +736,43 @@ class LocalIndexBuilder:
                 x["repo_source_path"] for x in self.environment_manager.local_repos()
             ]
 
+        self.migrate_sqlite_db()
+        if not incremental or not self._can_index_incrementally(repo_source_paths):
+            self.reinitialize_sqlite_db()
+
+        if processes > 1:
+            self._index_colrev_projects_in_parallel(
+                repo_source_paths, processes=processes
+            )
+            return
+
         for repo_source_path in repo_source_paths:
             self.index_colrev_project(repo_source_path)
 
     def _index_tei_document(self, recs_to_index: list) -> None:
         if not self._index_tei:
             return
-        for record_dict in recs_to_index:
-            if not Path(record_dict.get(Fields.FILE, "NA")).is_file():
-                continue
+        recs_to_index = [
+            r for r in recs_to_index if Path(r.get(Fields.FILE, "NA")).is_file()
+        ]
 
+        # Note : the TEIs are generated concurrently (and loaded from the files below)
+        tei_generator = colrev.env.tei_generator.TEIGenerator(
+            environment_manager=self.environment_manager
+        )
+        try:
+            tei_generator.generate(
+                {
+                    Path(r[Fields.FILE]): self._get_tei_index_file(
+                        local_index_id=r[LocalIndexFields.ID]
+                    )
+                    for r in recs_to_index
+                }
+            )
+        except colrev_exceptions.ServiceNotAvailableException:  # pragma: no cover
+            pass
+
+        for record_dict in recs_to_index:
             try:
                 tei_path = self._get_tei_index_file(
                     local_index_id=record_dict[LocalIndexFields.ID]
@@ -418,3 +813,18 @@ class LocalIndexBuilder:
             )
             sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
             sqlite_index_ranking.insert_df(data_frame)
+
+
+def _prepare_colrev_project(
+    repo_source_path: Path, *, verbose_mode: bool
+) -> typing.Optional[dict]:  # pragma: no cover
+    """Prepare a CoLRev project for indexing (in a worker process)"""
+    local_index_builder = LocalIndexBuilder(verbose_mode=verbose_mode)
+    # pylint: disable=protected-access
+    local_index_builder._show_record_progress = False
+    try:
+        return local_index_builder.prepare_colrev_project(repo_source_path)
+    # TypeErrors are thrown when a repo is in interactive rebase mode
+    except (colrev_exceptions.CoLRevException, TypeError) as exc:
+        print(exc)
+        return None
@@ -2,16 +2,20 @@
 """LocalIndex: sqlite."""
 from __future__ import annotations
 
+import json
 import sqlite3
+import threading
 import typing
 
 import pandas as pd
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
 import colrev.record.record
 from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
+from colrev.constants import RecordState
 
 # Note : records are indexed by id = hash(colrev_id)
 # to ensure that the indexing-ids do not exceed limits
@@ -42,38 +46,164 @@ from colrev.constants import LocalIndexFields
 #     return new_hex.decode("utf-8")
 
 
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    ret_dict = {}
+    for idx, col in enumerate(cursor.description):
+        ret_dict[col[0]] = row[idx]
+    return ret_dict
+
+
+class SQLiteConnectionManager:
+    """The SQLiteConnectionManager provides long-lived, read-only connections
+    to the sqlite database (one per thread).
+
+    Connections (and their cached prepared statements) are reused across lookups,
+    and threads do not have to wait for each other (the database uses WAL mode).
+    Connections of finished threads are closed when new connections are created.
+    """
+
+    def __init__(self) -> None:
+        self._thread_data = threading.local()
+        self._lock = threading.Lock()
+        self._connections: typing.Dict[threading.Thread, sqlite3.Connection] = {}
+        # Note : incremented by close_all() (to invalidate the connections of threads)
+        self._generation = 0
+
+    def _close_connections_of_finished_threads(self) -> None:
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            self._connections.pop(thread).close()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get the read-only connection of the current thread"""
+
+        # Note : the path may change (e.g., in tests)
+        db_path = Filepaths.LOCAL_INDEX_SQLITE_FILE
+        connection = getattr(self._thread_data, "connection", None)
+        if connection is not None:
+            if (
+                self._thread_data.db_path == db_path
+                and self._thread_data.generation == self._generation
+            ):
+                return connection
+            connection.close()
+
+        # May raise sqlite3.OperationalError (e.g., if the database does not exist)
+        connection = sqlite3.connect(
+            f"{db_path.absolute().as_uri()}?mode=ro",
+            uri=True,
+            timeout=90,
+            # Note : connections of finished threads are closed by other threads
+            check_same_thread=False,
+        )
+        connection.row_factory = _dict_factory
+        with self._lock:
+            self._close_connections_of_finished_threads()
+            self._connections[threading.current_thread()] = connection
+            self._thread_data.generation = self._generation
+        self._thread_data.connection = connection
+        self._thread_data.db_path = db_path
+        return connection
+
+    def close_all(self) -> None:
+        """Close the connections (e.g., before the database is replaced)
+
+        Connections of other running threads are closed by these threads
+        (when they request their connection the next time).
+        """
+        with self._lock:
+            self._generation += 1
+            current_thread = threading.current_thread()
+            for thread in list(self._connections):
+                if thread is current_thread or not thread.is_alive():
+                    self._connections.pop(thread).close()
+
+
+connection_manager = SQLiteConnectionManager()
+
+
+def get_record_json(bibtex: str) -> str:
+    """Get the serialized (pre-parsed) form of a record stored in the index"""
+
+    records_dict = colrev.loader.load_utils.loads(
+        load_string=bibtex,
+        implementation="bib",
+        unique_id_field="ID",
+    )
+    record_dict = list(records_dict.values())[0]
+    # Note : the colrev_status (RecordState) is the only non-str/list/dict value
+    return json.dumps(record_dict, default=str)
+
+
+def _load_record_json(record_json: str) -> dict:
+    record_dict = json.loads(record_json)
+    if Fields.STATUS in record_dict:
+        record_dict[Fields.STATUS] = RecordState[record_dict[Fields.STATUS]]
+    return record_dict
+
+
 # pylint: disable=too-few-public-methods
 class SQLiteIndex:
-    """The SQLiteIndex class implements indexing and retrieval of records locally"""
+    """The SQLiteIndex class implements indexing and retrieval of records locally
+
+    Read-only instances use the connections of the connection_manager,
+    which are shared and must not be closed.
+    """
 
-    connection: sqlite3.Connection
     CREATE_TABLE_QUERY: str
+    CREATE_INDEX_QUERY = (
+        "CREATE INDEX IF NOT EXISTS {index_name}_{column} ON {index_name} ({column})"
+    )
+    INDEXED_COLUMNS: typing.List[str] = []
 
     def __init__(
-        self, *, index_name: str, index_keys: list, reinitialize: bool
+        self,
+        *,
+        index_name: str,
+        index_keys: list,
+        reinitialize: bool,
+        read_only: bool = False,
     ) -> None:
         self.index_name = index_name
         self.index_keys = index_keys
-        self.connection = sqlite3.connect(
+        self.read_only = read_only
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        if read_only:
+            assert not reinitialize
+            return
+
+        self._connection = sqlite3.connect(
             str(Filepaths.LOCAL_INDEX_SQLITE_FILE), timeout=90
         )
-        self.connection.row_factory = self._dict_factory
+        self._connection.row_factory = _dict_factory
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Note : writable connections are used to build the index
+            # (with WAL, NORMAL is safe against corruption and avoids fsyncs per commit)
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.OperationalError:  # pragma: no cover
+            pass  # e.g., if the database is locked
         if reinitialize:
             self._reinitialize_db()
 
-    def _dict_factory(self, cursor: sqlite3.Cursor, row: dict) -> dict:
-        ret_dict = {}
-        for idx, col in enumerate(cursor.description):
-            ret_dict[col[0]] = row[idx]
-        return ret_dict
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The sqlite connection"""
+        if self._connection is None:
+            return connection_manager.get_connection()
+        return self._connection
+
+    def close(self) -> None:
+        """Close the connection (read-only connections remain open for reuse)"""
+        if self._connection is not None:
+            self._connection.close()
 
     def _get_cursor(self) -> sqlite3.Cursor:
         return self.connection.cursor()
 
     def commit(self) -> None:
         """Commit changes to the SQLITE database"""
-        if self.connection:
-            self.connection.commit()
+        if self._connection:
+            self._connection.commit()
 
     def _reinitialize_db(self) -> None:
         """Reinitialize the SQLITE database"""
@@ -81,11 +211,24 @@ class SQLiteIndex:
         cur = self._get_cursor()
         cur.execute(f"drop table if exists {self.index_name}")
         cur.execute(self.CREATE_TABLE_QUERY)
-        if self.connection:
-            self.connection.commit()
+        self._create_indices()
+        self.commit()
+
+    def _create_indices(self) -> None:
+        cur = self._get_cursor()
+        for column in self.INDEXED_COLUMNS:
+            cur.execute(
+                self.CREATE_INDEX_QUERY.format(
+                    index_name=self.index_name, column=column
+                )
+            )
 
     def _get_record_from_row(self, row: dict) -> dict:
 
+        if row.get(LocalIndexFields.RECORD_JSON):
+            return _load_record_json(row[LocalIndexFields.RECORD_JSON])
+
+        # Note : rows indexed before the record_json column was added
         records_dict = colrev.loader.load_utils.loads(
             load_string=row[LocalIndexFields.BIBTEX],
             implementation="bib",
@@ -114,6 +257,7 @@ class SQLiteIndexRecord(SQLiteIndex):
         LocalIndexFields.DBLP_KEY,  # Note : no dots in key names
         Fields.PDF_ID,
         LocalIndexFields.BIBTEX,
+        LocalIndexFields.RECORD_JSON,
     ]
 
     GLOBAL_KEYS = [
@@ -124,33 +268,70 @@ class SQLiteIndexRecord(SQLiteIndex):
         Fields.COLREV_ID,
     ]
 
+    # Columns storing the GLOBAL_KEYS (Note : no dots in column names)
+    GLOBAL_KEY_COLUMNS = {
+        Fields.DOI: Fields.DOI,
+        Fields.DBLP_KEY: LocalIndexFields.DBLP_KEY,
+        Fields.PDF_ID: Fields.PDF_ID,
+        Fields.URL: Fields.URL,
+        Fields.COLREV_ID: Fields.COLREV_ID,
+    }
+
     CREATE_TABLE_QUERY = (
         f"CREATE TABLE {INDEX_NAME} (id TEXT PRIMARY KEY," + ",".join(KEYS[1:]) + ")"
     )
 
+    INDEXED_COLUMNS = list(GLOBAL_KEY_COLUMNS.values())
+
     SELECT_ALL_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE"
 
     SELECT_KEY_QUERIES = {
         LocalIndexFields.ID: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.ID}=?",
         Fields.COLREV_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.COLREV_ID}=?",
         Fields.DOI: f"SELECT * FROM {INDEX_NAME} where {Fields.DOI}=?",
-        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.DBLP_KEY}=?",
+        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.DBLP_KEY}=?",
         Fields.PDF_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.PDF_ID}=?",
         Fields.URL: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.URL}=?",
     }
 
+    SELECT_MANY_QUERY = "SELECT * FROM " + INDEX_NAME + " WHERE {column} IN ({params})"
+    # Note : below the SQLITE_MAX_VARIABLE_NUMBER of older sqlite versions (999)
+    SELECT_MANY_CHUNK_SIZE = 900
+
     INSERT_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(:{', :'.join(KEYS)})"
+    # Note : existing records are only updated with the (amended) bibtex/record_json
+    UPSERT_QUERY = f"""
+            {INSERT_QUERY}
+            ON CONFLICT({LocalIndexFields.ID}) DO UPDATE SET
+            {LocalIndexFields.BIBTEX}=excluded.{LocalIndexFields.BIBTEX},
+            {LocalIndexFields.RECORD_JSON}=excluded.{LocalIndexFields.RECORD_JSON}"""
+
+    DELETE_QUERY = f"DELETE FROM {INDEX_NAME} WHERE {LocalIndexFields.ID}=?"
 
     UPDATE_RECORD_QUERY = f"""
             UPDATE {INDEX_NAME} SET
-            {LocalIndexFields.BIBTEX}=?
+            {LocalIndexFields.BIBTEX}=?,
+            {LocalIndexFields.RECORD_JSON}=?
             WHERE {LocalIndexFields.ID}=?"""
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    MIGRATE_ADD_RECORD_JSON_QUERY = (
+        f"ALTER TABLE {INDEX_NAME} ADD COLUMN {LocalIndexFields.RECORD_JSON}"
+    )
+    MIGRATE_SELECT_RECORD_JSON_QUERY = f"""
+            SELECT {LocalIndexFields.ID}, {LocalIndexFields.BIBTEX} FROM {INDEX_NAME}
+            WHERE {LocalIndexFields.RECORD_JSON} IS NULL
+            OR {LocalIndexFields.RECORD_JSON} = ''"""
+    MIGRATE_UPDATE_RECORD_JSON_QUERY = f"""
+            UPDATE {INDEX_NAME} SET
+            {LocalIndexFields.RECORD_JSON}=?
+            WHERE {LocalIndexFields.ID}=?"""
+
+    def __init__(self, *, reinitialize: bool = False, read_only: bool = False) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            read_only=read_only,
         )
 
     def exists(
@@ -176,6 +357,36 @@ class SQLiteIndexRecord(SQLiteIndex):
         cur.execute(self.INSERT_QUERY, item)
         self.commit()
 
+    def upsert_many(self, items: typing.List[dict]) -> None:
+        """Insert records into the index (in one transaction)
+
+        Records that are already in the index (same id) are updated
+        (bibtex and record_json fields).
+        """
+        cur = self._get_cursor()
+        cur.executemany(self.UPSERT_QUERY, items)
+        self.commit()
+
+    def get_many_by_id(self, local_index_ids: typing.Iterable[str]) -> dict:
+        """Get records from the index (returns a dict of local_index_id: record,
+        ids that are not in the index are omitted)"""
+        local_index_ids = list(dict.fromkeys(local_index_ids))
+        retrieved_records: typing.Dict[str, dict] = {}
+        cur = self._get_cursor()
+        for i in range(0, len(local_index_ids), self.SELECT_MANY_CHUNK_SIZE):
+            chunk = local_index_ids[i : i + self.SELECT_MANY_CHUNK_SIZE]
+            cur.execute(
+                self.SELECT_MANY_QUERY.format(
+                    column=LocalIndexFields.ID, params=",".join("?" * len(chunk))
+                ),
+                chunk,
+            )
+            for row in cur.fetchall():
+                retrieved_records[row[LocalIndexFields.ID]] = self._get_record_from_row(
+                    row
+                )
+        return retrieved_records
+
     def get(
         self,
         *,
@@ -230,10 +441,85 @@ class SQLiteIndexRecord(SQLiteIndex):
                 raise NotImplementedError
         return retrieved_record
 
+    def get_many(self, *, key: str, values: typing.Iterable[str]) -> dict:
+        """Get records from the index (returns a dict of value: record,
+        values that are not in the index are omitted)"""
+        assert key in self.GLOBAL_KEY_COLUMNS
+        values = list(dict.fromkeys(values))
+        retrieved_records: typing.Dict[str, dict] = {}
+        try:
+            cur = self._get_cursor()
+            for i in range(0, len(values), self.SELECT_MANY_CHUNK_SIZE):
+                chunk = values[i : i + self.SELECT_MANY_CHUNK_SIZE]
+                cur.execute(
+                    self.SELECT_MANY_QUERY.format(
+                        column=self.GLOBAL_KEY_COLUMNS[key],
+                        params=",".join("?" * len(chunk)),
+                    ),
+                    chunk,
+                )
+                for row in cur.fetchall():
+                    value = row[self.GLOBAL_KEY_COLUMNS[key]]
+                    if value in retrieved_records:
+                        continue
+                    retrieved_record = self._get_record_from_row(row)
+                    if key != Fields.COLREV_ID and retrieved_record.get(key) != value:
+                        continue
+                    retrieved_records[value] = retrieved_record
+        except sqlite3.OperationalError:  # pragma: no cover
+            pass
+
+        return retrieved_records
+
+    def get_bibtex(self, *, local_index_id: str) -> str:
+        """Get the bibtex of a record in the index ("" if it is not in the index)"""
+        cur = self._get_cursor()
+        cur.execute(self.SELECT_KEY_QUERIES[LocalIndexFields.ID], (local_index_id,))
+        selected_row = cur.fetchone()
+        if not selected_row:
+            return ""
+        return selected_row[LocalIndexFields.BIBTEX]
+
+    def delete(self, *, local_index_id: str) -> None:
+        """Delete a record from the index"""
+        cur = self._get_cursor()
+        cur.execute(self.DELETE_QUERY, (local_index_id,))
+
     def update(self, local_index_id: str, bibtex: str) -> None:
         """Update a record in the index"""
         cur = self._get_cursor()
-        cur.execute(self.UPDATE_RECORD_QUERY, (bibtex, local_index_id))
+        cur.execute(
+            self.UPDATE_RECORD_QUERY,
+            (bibtex, get_record_json(bibtex), local_index_id),
+        )
+
+    def migrate(self) -> int:
+        """Add the pre-parsed records (record_json) and the indices on the GLOBAL_KEYS
+        to databases created by previous versions (returns the number of migrated records)
+        """
+        cur = self._get_cursor()
+        cur.execute(f"PRAGMA table_info({self.INDEX_NAME})")
+        columns = [row["name"] for row in cur.fetchall()]
+        if not columns:
+            return 0
+        if LocalIndexFields.RECORD_JSON not in columns:
+            cur.execute(self.MIGRATE_ADD_RECORD_JSON_QUERY)
+        self._create_indices()
+
+        cur.execute(self.MIGRATE_SELECT_RECORD_JSON_QUERY)
+        rows = cur.fetchall()
+        cur.executemany(
+            self.MIGRATE_UPDATE_RECORD_JSON_QUERY,
+            [
+                (
+                    get_record_json(row[LocalIndexFields.BIBTEX]),
+                    row[LocalIndexFields.ID],
+                )
+                for row in rows
+            ],
+        )
+        self.commit()
+        return len(rows)
 
     def search(self, query: str) -> list:
         """Search for records in the index"""
@@ -255,15 +541,18 @@ class SQLiteIndexRankings(SQLiteIndex):
 
     INDEX_NAME = "rankings"
     KEYS: typing.List[str] = []
+    INDEXED_COLUMNS = ["journal_name"]
 
     CREATE_TABLE_QUERY = f"CREATE TABLE {INDEX_NAME} (id TEXT PRIMARY KEY)"
     SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE journal_name = ?"
+    SELECT_ALL_QUERY = f"SELECT * FROM {INDEX_NAME}"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(self, *, reinitialize: bool = False, read_only: bool = False) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            read_only=read_only,
         )
 
     def insert_df(self, data_frame: pd.DataFrame) -> None:
@@ -272,6 +561,9 @@ class SQLiteIndexRankings(SQLiteIndex):
         data_frame.to_sql(self.INDEX_NAME, conn, if_exists="replace", index=False)
         conn.commit()
         conn.close()
+        # Note : to_sql(if_exists="replace") drops the indices
+        self._create_indices()
+        self.commit()
 
     def select(self, journal: str) -> list:
         """Select journal rankings from the index"""
@@ -281,6 +573,13 @@ class SQLiteIndexRankings(SQLiteIndex):
         rankings = cur.fetchall()
         return rankings
 
+    def select_all(self) -> list:
+        """Select all journal rankings from the index"""
+
+        cur = self._get_cursor()
+        cur.execute(self.SELECT_ALL_QUERY)
+        return cur.fetchall()
+
 
 class SQLiteIndexTOC(SQLiteIndex):
     """The SQLiteIndexTOC class implements indexing and retrieval of TOC items locally"""
@@ -298,13 +597,19 @@ class SQLiteIndexTOC(SQLiteIndex):
         LocalIndexFields.TOC_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.TOC_KEY}=?",
     }
 
-    INSERT_MANY_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(?, ?)"
+    # Note : TOC items that are already in the index are not replaced
+    INSERT_MANY_QUERY = (
+        f"INSERT INTO {INDEX_NAME} VALUES(?, ?) "
+        f"ON CONFLICT({LocalIndexFields.TOC_KEY}) DO NOTHING"
+    )
+    DELETE_QUERY = f"DELETE FROM {INDEX_NAME} WHERE {LocalIndexFields.TOC_KEY}=?"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(self, *, reinitialize: bool = False, read_only: bool = False) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            read_only=read_only,
         )
 
     def exists(self, toc_item: str) -> bool:
@@ -359,3 +664,56 @@ class SQLiteIndexTOC(SQLiteIndex):
             print(exc)
         finally:
             self.commit()
+
+    def delete(self, toc_keys: typing.Iterable[str]) -> None:
+        """Delete TOC items from the index"""
+        cur = self._get_cursor()
+        cur.executemany(self.DELETE_QUERY, [(toc_key,) for toc_key in toc_keys])
+        self.commit()
+
+
+class SQLiteIndexWatermarks(SQLiteIndex):
+    """The SQLiteIndexWatermarks class stores the last indexed commit
+    of each repository (to index changes incrementally)"""
+
+    INDEX_NAME = "watermarks"
+    KEYS: typing.List[str] = []
+
+    CREATE_TABLE_QUERY = (
+        f"CREATE TABLE IF NOT EXISTS {INDEX_NAME} "
+        "(repo_source_path TEXT PRIMARY KEY, commit_sha TEXT)"
+    )
+    SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE repo_source_path=?"
+    SELECT_ALL_QUERY = f"SELECT * FROM {INDEX_NAME}"
+    UPSERT_QUERY = f"INSERT OR REPLACE INTO {INDEX_NAME} VALUES(?, ?)"
+
+    def __init__(self, *, reinitialize: bool = False) -> None:
+        super().__init__(
+            index_name=self.INDEX_NAME,
+            index_keys=self.KEYS,
+            reinitialize=reinitialize,
+        )
+        # Note : databases created by previous versions have no watermarks table
+        self._get_cursor().execute(self.CREATE_TABLE_QUERY)
+
+    def get(self, repo_source_path: str) -> typing.Optional[str]:
+        """Get the last indexed commit of a repository
+        (None if it was not indexed, "" if the indexed state has no commit)"""
+        cur = self._get_cursor()
+        cur.execute(self.SELECT_QUERY, (repo_source_path,))
+        selected_row = cur.fetchone()
+        if not selected_row:
+            return None
+        return selected_row["commit_sha"]
+
+    def get_all(self) -> dict:
+        """Get the last indexed commits of all repositories"""
+        cur = self._get_cursor()
+        cur.execute(self.SELECT_ALL_QUERY)
+        return {row["repo_source_path"]: row["commit_sha"] for row in cur.fetchall()}
+
+    def set(self, repo_source_path: str, commit_sha: str) -> None:
+        """Set the last indexed commit of a repository"""
+        cur = self._get_cursor()
+        cur.execute(self.UPSERT_QUERY, (repo_source_path, commit_sha))
+        self.commit()
@@ -0,0 +1,181 @@
+#! /usr/bin/env python
+"""Shared HTTP sessions (connection pooling, caching, rate limits and retries)."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests_cache.backends.sqlite import SQLiteDict
+from urllib3.util.retry import Retry
+
+from colrev.constants import Filepaths
+
+# Maximum number of requests per second (per host)
+RATE_LIMITS = {
+    "api.crossref.org": 10.0,
+    "api.openalex.org": 10.0,
+    "api.semanticscholar.org": 1.0,
+    "api.unpaywall.org": 10.0,
+    "dblp.org": 2.0,
+    "eutils.ncbi.nlm.nih.gov": 3.0,
+    "opencitations.net": 5.0,
+    "www.ebi.ac.uk": 10.0,
+}
+DEFAULT_RATE_LIMIT = 20.0
+
+POOL_SIZE = 32
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    # Note : the last response is returned (callers check the status codes)
+    raise_on_status=False,
+)
+
+
+class TokenBucket:
+    """A thread-safe token bucket (rate: tokens per second, bursts of one second)"""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, *, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token (waiting until it is available) and return the waiting time"""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            # Note : tokens are reserved (the bucket may become negative)
+            # so that waiting threads are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter waiting for the rate limit of the host before sending requests
+
+    Cached responses are not sent (and do not count towards the rate limits).
+    """
+
+    def __init__(self, *, manager: SessionManager) -> None:
+        self._session_manager = manager
+        super().__init__(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY
+        )
+
+    def send(  # type: ignore # pylint: disable=arguments-differ
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        self._session_manager.wait_for_host(urlparse(request.url).hostname or "")
+        return super().send(request, **kwargs)
+
+
+class SessionManager:
+    """The SessionManager provides HTTP sessions that are shared across threads.
+
+    Sessions keep connections alive (pooled per host), retry failed requests
+    (with backoff, respecting Retry-After headers), and respect per-host rate limits.
+    The cached session uses a single sqlite backend (WAL mode) for all connectors.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cached_session: typing.Optional[requests_cache.CachedSession] = None
+        self._cached_session_key: typing.Optional[typing.Tuple[Path, int]] = None
+        self._session: typing.Optional[requests.Session] = None
+        self._session_pid: typing.Optional[int] = None
+        self._rate_limiters: typing.Dict[str, TokenBucket] = {}
+
+    def _mount_adapters(self, session: requests.Session) -> None:
+        adapter = _RateLimitedAdapter(manager=self)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def get_cached_session(self) -> requests_cache.CachedSession:
+        """Get the shared cached session"""
+
+        # Note : the path may change (e.g., in tests) and
+        # sqlite connections must not be shared with forked processes
+        key = (Filepaths.PREP_REQUESTS_CACHE_FILE, os.getpid())
+        with self._lock:
+            if self._cached_session is None or self._cached_session_key != key:
+                key[0].parent.mkdir(parents=True, exist_ok=True)
+                cached_session = requests_cache.CachedSession(
+                    str(key[0]),
+                    backend="sqlite",
+                    expire_after=timedelta(days=30),
+                    # Note : wait for locks held by other threads/processes
+                    timeout=90,
+                )
+                # Note : WAL mode allows concurrent reads (persisted in the file)
+                responses = typing.cast(SQLiteDict, cached_session.cache.responses)
+                with responses.connection(commit=True) as connection:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                self._mount_adapters(cached_session)
+                self._cached_session = cached_session
+                self._cached_session_key = key
+            return self._cached_session
+
+    def get_session(self) -> requests.Session:
+        """Get the shared session (without cache)"""
+
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                session = requests.Session()
+                self._mount_adapters(session)
+                self._session = session
+                self._session_pid = os.getpid()
+            return self._session
+
+    def set_rate_limit(self, *, host: str, requests_per_second: float) -> None:
+        """Set the rate limit of a host"""
+
+        with self._lock:
+            self._rate_limiters[host] = TokenBucket(rate=requests_per_second)
+
+    def wait_for_host(self, host: str) -> float:
+        """Wait until the rate limit of the host allows another request"""
+
+        with self._lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = TokenBucket(
+                    rate=RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+                )
+            rate_limiter = self._rate_limiters[host]
+        return rate_limiter.acquire()
+
+    def close_all(self) -> None:
+        """Close the sessions (and their pooled connections)"""
+
+        with self._lock:
+            for session in (self._cached_session, self._session):
+                if session is not None:
+                    session.close()
+            self._cached_session = None
+            self._cached_session_key = None
+            self._session = None
+            self._session_pid = None
+
+
+session_manager = SessionManager()
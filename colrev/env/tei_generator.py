@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+"""Concurrent generation of TEI documents (based on GROBID)."""
+from __future__ import annotations
+
+import logging
+import typing
+from multiprocessing.pool import ThreadPool as Pool
+from pathlib import Path
+
+import requests
+from tqdm import tqdm
+
+import colrev.env.grobid_service
+import colrev.env.tei_parser
+import colrev.exceptions as colrev_exceptions
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.env.environment_manager
+
+
+class TEIGenerator:
+    """The TEIGenerator creates TEI documents for a set of PDFs.
+
+    GROBID handles concurrent requests, i.e., a bounded number of PDFs
+    (the pool size) is processed at the same time.
+    """
+
+    def __init__(
+        self,
+        *,
+        environment_manager: colrev.env.environment_manager.EnvironmentManager,
+        max_workers: int = colrev.env.grobid_service.GrobidService.MAX_WORKERS,
+        header_only: bool = False,
+        logger: typing.Optional[logging.Logger] = None,
+    ) -> None:
+        self.environment_manager = environment_manager
+        self.max_workers = max(1, max_workers)
+        self.header_only = header_only
+        self.logger = logger or logging.getLogger(__name__)
+
+    @staticmethod
+    def is_up_to_date(*, pdf_path: Path, tei_path: Path) -> bool:
+        """Check whether the TEI exists and is newer than the PDF"""
+        if not tei_path.is_file():
+            return False
+        return tei_path.stat().st_mtime_ns >= pdf_path.stat().st_mtime_ns
+
+    # Note : no named arguments (multiprocessing)
+    def _generate_tei(
+        self, item: typing.Tuple[Path, Path]
+    ) -> typing.Tuple[Path, typing.Optional[Path]]:
+        pdf_path, tei_path = item
+        try:
+            content = colrev.env.tei_parser.TEIParser.request_tei(
+                pdf_path=pdf_path, header_only=self.header_only
+            )
+            colrev.env.tei_parser.TEIParser.save_tei(tei_path=tei_path, content=content)
+        except (
+            colrev_exceptions.TEIException,
+            colrev_exceptions.TEITimeoutException,
+            requests.exceptions.RequestException,
+            OSError,
+        ) as exc:
+            self.logger.error(f"Error generating TEI for {pdf_path}: {exc}")
+            return pdf_path, None
+        return pdf_path, tei_path
+
+    def generate(
+        self, tei_paths: typing.Dict[Path, Path], *, show_progress: bool = True
+    ) -> typing.Dict[Path, Path]:
+        """Generate the TEIs (tei_paths: pdf_path -> tei_path)
+
+        TEIs that are newer than their PDF are not generated again.
+        Returns the available TEIs (pdf_path -> tei_path).
+        """
+
+        available = {}
+        to_generate = []
+        for pdf_path, tei_path in tei_paths.items():
+            if not pdf_path.is_file():
+                continue
+            if self.is_up_to_date(pdf_path=pdf_path, tei_path=tei_path):
+                available[pdf_path] = tei_path
+            else:
+                to_generate.append((pdf_path, tei_path))
+
+        if not to_generate:
+            return available
+
+        self.logger.info(
+            f"Generate {len(to_generate)} TEIs ({self.max_workers} workers, "
+            f"{len(available)} up-to-date)"
+        )
+        grobid_service = colrev.env.grobid_service.GrobidService(
+            environment_manager=self.environment_manager
+        )
+        grobid_service.start()
+
+        # Note : the number of concurrent requests is bounded by the pool size
+        # (GROBID responds with 503 when its threads are busy)
+        pool = Pool(min(self.max_workers, len(to_generate)))
+        try:
+            for pdf_path, tei_path in tqdm(
+                pool.imap_unordered(self._generate_tei, to_generate),
+                total=len(to_generate),
+                disable=not show_progress,
+            ):
+                if tei_path is not None:
+                    available[pdf_path] = tei_path
+        finally:
+            pool.close()
+            pool.join()
+
+        return available
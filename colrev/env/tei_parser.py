@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import time
 import typing
 from pathlib import Path
 
@@ -17,6 +18,7 @@ import colrev.record.record
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import RecordState
+from colrev.env.session_manager import session_manager
 
 # xpath alternative:
 # tree.xpath("//tei:sourceDesc/tei:biblStruct/tei:monogr/tei:idno",
@@ -40,6 +42,7 @@ class TEIParser:
         "tei": "http://www.tei-c.org/ns/1.0",
         "w3": "http://www.w3.org/XML/1998/namespace",
     }
+    GROBID_BUSY_RETRIES = 5
 
     def __init__(
         self,
@@ -47,15 +50,20 @@ class TEIParser:
         environment_manager: colrev.env.environment_manager.EnvironmentManager,
         pdf_path: typing.Optional[Path] = None,
         tei_path: typing.Optional[Path] = None,
+        header_only: bool = False,
     ):
         """Creates a TEI file
         modes of operation:
         - pdf_path: create TEI and temporarily store in self.data
         - pfd_path and tei_path: create TEI and save in tei_path
         - tei_path: read TEI from file
+        header_only: create a TEI containing only the header (metadata)
         """
 
         self.environment_manager = environment_manager
+        # Note : the in-text citations are indexed once (per parsed TEI)
+        self._citation_index: typing.Optional[typing.Dict[str, list]] = None
+        self._section_citations: typing.Optional[typing.Dict[str, list]] = None
         # pylint: disable=consider-using-with
         assert pdf_path is not None or tei_path is not None
         if pdf_path is not None:
@@ -63,6 +71,7 @@ class TEIParser:
                 pdf_path = pdf_path.resolve()
         self.pdf_path = pdf_path
         self.tei_path = tei_path
+        self.header_only = header_only
         if pdf_path is not None and not pdf_path.is_file():
             raise FileNotFoundError
 
@@ -87,15 +96,17 @@ class TEIParser:
 
         return etree.XML(xslt_content)
 
-    def _create_tei(self) -> None:
-        """Create the TEI (based on GROBID)"""
-        grobid_service = colrev.env.grobid_service.GrobidService(
-            environment_manager=self.environment_manager
-        )
-        grobid_service.start()
+    @classmethod
+    def request_tei(cls, *, pdf_path: Path, header_only: bool = False) -> bytes:
+        """Request the TEI of a PDF from GROBID (the service must be running)
+
+        header_only: only extract the header (metadata), which is much faster
+        """
+
         # Note: we have more control and transparency over the consolidation
         # if we do it in the colrev process
         options = {"consolidateHeader": "0", "consolidateCitations": "0"}
+        endpoint = "processHeaderDocument" if header_only else "processFulltextDocument"
 
         # Note: Grobid offers direct export of Bibtex:
         # r = requests.post(
@@ -103,46 +114,65 @@ class TEIParser:
         #     headers={"Accept": "application/x-bibtex"},
         # But parsing the metadata from the tei gives us more control of the details
 
+        session = session_manager.get_session()
         try:
-            # pylint: disable=consider-using-with
-            ret = requests.post(
-                grobid_service.GROBID_URL + "/api/processFulltextDocument",
-                files={"input": open(str(self.pdf_path), "rb")},
-                data=options,
-                timeout=180,
-            )
+            for attempt in range(cls.GROBID_BUSY_RETRIES + 1):
+                with open(pdf_path, "rb") as pdf_file:
+                    ret = session.post(
+                        f"{colrev.env.grobid_service.GrobidService.GROBID_URL}"
+                        f"/api/{endpoint}",
+                        files={"input": pdf_file},
+                        data=options,
+                        timeout=180,
+                    )
+                # GROBID responds with 503 if all its threads are busy
+                if ret.status_code != 503 or attempt == cls.GROBID_BUSY_RETRIES:
+                    break
+                time.sleep(attempt + 1)
+        except requests.exceptions.ConnectionError as exc:  # pragma: no cover
+            print(exc)
+            print(str(pdf_path))
+            raise colrev_exceptions.TEITimeoutException() from exc
 
-            # Possible extension: get header only (should be more efficient)
-            # r = requests.post(
-            #     GrobidService.GROBID_URL + "/api/processHeaderDocument",
-            #     files=dict(input=open(filepath, "rb")),
-            #     data=header_data,
-            # )
+        if ret.status_code != 200:  # pragma: no cover
+            raise colrev_exceptions.TEIException()
 
-            if ret.status_code != 200:  # pragma: no cover
-                raise colrev_exceptions.TEIException()
+        if b"[TIMEOUT]" in ret.content:  # pragma: no cover
+            raise colrev_exceptions.TEITimeoutException()
 
-            if b"[TIMEOUT]" in ret.content:  # pragma: no cover
-                raise colrev_exceptions.TEITimeoutException()
+        return ret.content
 
-            self.root = etree.fromstring(ret.content)
+    @classmethod
+    def save_tei(cls, *, tei_path: Path, content: bytes) -> Element:
+        """Save the TEI (returned by GROBID) and return its root"""
 
-            if self.tei_path is not None:
-                self.tei_path.parent.mkdir(exist_ok=True, parents=True)
-                with open(self.tei_path, "wb") as file:
-                    file.write(ret.content)
+        tei_path.parent.mkdir(exist_ok=True, parents=True)
+        with open(tei_path, "wb") as file:
+            file.write(content)
 
-                # Note : reopen/write to prevent format changes in the enhancement
-                with open(self.tei_path, "rb") as file:
-                    xml_fstring = file.read()
-                self.root = etree.fromstring(xml_fstring)
+        # Note : reopen/write to prevent format changes in the enhancement
+        with open(tei_path, "rb") as file:
+            xml_fstring = file.read()
+        root = etree.fromstring(xml_fstring)
 
-                tree = etree.ElementTree(self.root)
-                tree.write(str(self.tei_path), encoding="utf-8")
-        except requests.exceptions.ConnectionError as exc:  # pragma: no cover
-            print(exc)
-            print(str(self.pdf_path))
-            raise colrev_exceptions.TEITimeoutException() from exc
+        tree = etree.ElementTree(root)
+        tree.write(str(tei_path), encoding="utf-8")
+        return root
+
+    def _create_tei(self) -> None:
+        """Create the TEI (based on GROBID)"""
+        grobid_service = colrev.env.grobid_service.GrobidService(
+            environment_manager=self.environment_manager
+        )
+        grobid_service.start()
+
+        content = self.request_tei(
+            pdf_path=self.pdf_path, header_only=self.header_only  # type: ignore
+        )
+        if self.tei_path is not None:
+            self.root = self.save_tei(tei_path=self.tei_path, content=content)
+        else:
+            self.root = etree.fromstring(content)
 
     def get_tei_str(self) -> str:
         """Get the TEI string"""
@@ -508,15 +538,19 @@ class TEIParser:
                             entrytype = ENTRYTYPES.BOOK
         return entrytype
 
-    def _get_tei_id_count(self, *, tei_id: str) -> int:
-        count = 0
+    def _get_citation_index(self) -> typing.Dict[str, list]:
+        """Get the in-text citations (ref nodes) indexed by their target"""
+        if self._citation_index is None:
+            citation_index: typing.Dict[str, list] = {}
+            for reference in self.root.iter(self.ns["tei"] + "ref"):
+                target = reference.get("target")
+                if target is not None:
+                    citation_index.setdefault(target, []).append(reference)
+            self._citation_index = citation_index
+        return self._citation_index
 
-        for reference in self.root.iter(self.ns["tei"] + "ref"):
-            if "target" in reference.keys():
-                if reference.get("target") == f"#{tei_id}":
-                    count += 1
-
-        return count
+    def _get_tei_id_count(self, *, tei_id: str) -> int:
+        return len(self._get_citation_index().get(f"#{tei_id}", []))
 
     def _get_dict_from_reference(self, reference: Element) -> dict:
         entrytype = self._get_entrytype(reference)
@@ -578,25 +612,30 @@ class TEIParser:
 
         return tei_bib_db
 
-    def get_citations_per_section(self) -> dict:
-        """Get a dict of section-names and list-of-citations"""
-        section_citations = {}
-        parent_map = {c: p for p in self.root.iter() for c in p}
-        sections = self.root.iter(f'{self.ns["tei"]}head')
-        for section in sections:
-            section_name = section.text
-            if section_name is not None:
-                parent = parent_map[section]
-                citation_nodes = parent.findall(f'.//{self.ns["tei"]}ref')
+    def _get_section_citations(self) -> typing.Dict[str, list]:
+        if self._section_citations is None:
+            section_citations = {}
+            for section in self.root.iter(f'{self.ns["tei"]}head'):
+                section_name = section.text
+                if section_name is None:
+                    continue
                 citations = [
                     x.get("target", "").replace("#", "")
-                    for x in citation_nodes
+                    for x in section.getparent().iter(f'{self.ns["tei"]}ref')
                     if x.get("type", "") == "bibr"
                 ]
                 citations = list(filter(lambda a: a != "", citations))
                 if len(citations) > 0:
                     section_citations[section_name.lower()] = citations
-        return section_citations
+            self._section_citations = section_citations
+        return self._section_citations
+
+    def get_citations_per_section(self) -> dict:
+        """Get a dict of section-names and list-of-citations"""
+        return {
+            section_name: citations.copy()
+            for section_name, citations in self._get_section_citations().items()
+        }
 
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID"""
@@ -631,10 +670,10 @@ class TEIParser:
                 if ref.get(f'{self.ns["w3"]}id') == record_dict[Fields.TEI_ID]:
                     ref.set(Fields.ID, max_sim_record[Fields.ID])
             # mark reference in in-text citations
-            for reference in self.root.iter(f'{self.ns["tei"]}ref'):
-                if "target" in reference.keys():
-                    if reference.get("target") == f"#{record_dict['tei_id']}":
-                        reference.set(Fields.ID, max_sim_record[Fields.ID])
+            for reference in self._get_citation_index().get(
+                f"#{record_dict['tei_id']}", []
+            ):
+                reference.set(Fields.ID, max_sim_record[Fields.ID])
 
             # if settings file available: dedupe_io match agains records
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Cache of the parsed records file versions in the git history."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import typing
+from pathlib import Path
+
+import colrev
+import colrev.loader.load_utils
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import git
+
+# Note : git blobs are immutable, i.e., a version of the records file
+# is parsed once and retrieved by its blob SHA afterwards.
+# Snapshots map the IDs to record versions, which are stored once
+# (most records do not change between commits).
+
+
+class HistoryCache:
+    """The HistoryCache stores the parsed versions of a records file (per blob SHA)"""
+
+    _BATCH_SIZE = 900  # below the sqlite limit of variables per query
+
+    def __init__(self, *, path: Path, logger: logging.Logger) -> None:
+        self.path = path
+        self.logger = logger
+        self._connection: typing.Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=90)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS record_versions "
+            "(hash TEXT PRIMARY KEY, record BLOB)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots "
+            "(blob_sha TEXT PRIMARY KEY, record_hashes BLOB)"
+        )
+        # Parsed records may differ between versions
+        version = connection.execute(
+            "SELECT value FROM meta WHERE key='version'"
+        ).fetchone()
+        if version is None or version[0] != colrev.__version__:
+            connection.execute("DELETE FROM snapshots")
+            connection.execute("DELETE FROM record_versions")
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                (colrev.__version__,),
+            )
+        connection.commit()
+        self._connection = connection
+        return connection
+
+    def _parse(self, blob: git.Blob) -> dict:
+        return colrev.loader.load_utils.loads(
+            load_string=blob.data_stream.read().decode("utf-8", "replace"),
+            implementation="bib",
+            logger=self.logger,
+        )
+
+    def _get_record_hashes(self, blob: git.Blob) -> typing.Optional[dict]:
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT record_hashes FROM snapshots WHERE blob_sha=?", (blob.hexsha,)
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def _add_snapshot(self, blob: git.Blob, records_dict: dict) -> None:
+        record_hashes = {}
+        record_versions = []
+        for record_id, record_dict in records_dict.items():
+            record_pickle = pickle.dumps(record_dict, protocol=pickle.HIGHEST_PROTOCOL)
+            record_hash = hashlib.sha1(record_pickle).hexdigest()
+            record_hashes[record_id] = record_hash
+            record_versions.append((record_hash, record_pickle))
+
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO record_versions VALUES (?, ?)", record_versions
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?)",
+                (blob.hexsha, pickle.dumps(record_hashes)),
+            )
+
+    def _get_record_versions(self, record_hashes: typing.List[str]) -> dict:
+        connection = self._get_connection()
+        record_versions: typing.Dict[str, bytes] = {}
+        for i in range(0, len(record_hashes), self._BATCH_SIZE):
+            batch = record_hashes[i : i + self._BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            record_versions.update(
+                connection.execute(
+                    "SELECT hash, record FROM record_versions "
+                    f"WHERE hash IN ({placeholders})",  # nosec
+                    batch,
+                ).fetchall()
+            )
+        return record_versions
+
+    def get_records(self, blob: git.Blob) -> dict:
+        """Get the records dict of a version of the records file"""
+
+        try:
+            record_hashes = self._get_record_hashes(blob)
+            if record_hashes is None:
+                records_dict = self._parse(blob)
+                self._add_snapshot(blob, records_dict)
+                return records_dict
+
+            record_versions = self._get_record_versions(
+                list(set(record_hashes.values()))
+            )
+            return {
+                record_id: pickle.loads(record_versions[record_hash])
+                for record_id, record_hash in record_hashes.items()
+            }
+        except (
+            sqlite3.Error,
+            KeyError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+        ):  # pragma: no cover
+            # The cache is optional (e.g., read-only file systems or corrupted files)
+            return self._parse(blob)
+
+    def get_record(self, blob: git.Blob, record_id: str) -> typing.Optional[dict]:
+        """Get a record from a version of the records file (None if it is missing)"""
+
+        try:
+            record_hashes = self._get_record_hashes(blob)
+            if record_hashes is None:
+                return self.get_records(blob).get(record_id)
+            if record_id not in record_hashes:
+                return None
+            record_versions = self._get_record_versions([record_hashes[record_id]])
+            return pickle.loads(record_versions[record_hashes[record_id]])
+        except (
+            sqlite3.Error,
+            KeyError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+        ):  # pragma: no cover
+            return self._parse(blob).get(record_id)
+
+    def close(self) -> None:
+        """Close the connection to the cache"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -129,14 +129,17 @@ Example json record:
 """
 from __future__ import annotations
 
+import io
+import json
 import logging
-import tempfile
+import os
 import typing
 from pathlib import Path
 
 import colrev.loader.bib
 import colrev.loader.enl
 import colrev.loader.json
+import colrev.loader.loader
 import colrev.loader.md
 import colrev.loader.nbib
 import colrev.loader.ris
@@ -147,6 +150,25 @@ import colrev.loader.table
 # flake8: noqa: E501
 
 
+# pylint: disable=too-many-return-statements
+def _get_loader(suffix: str) -> typing.Type[colrev.loader.loader.Loader]:
+    if suffix == ".bib":
+        return colrev.loader.bib.BIBLoader
+    if suffix in [".csv", ".xls", ".xlsx"]:
+        return colrev.loader.table.TableLoader
+    if suffix == ".ris":
+        return colrev.loader.ris.RISLoader
+    if suffix in [".enl", ".txt"]:
+        return colrev.loader.enl.ENLLoader
+    if suffix == ".md":
+        return colrev.loader.md.MarkdownLoader
+    if suffix == ".nbib":
+        return colrev.loader.nbib.NBIBLoader
+    if suffix == ".json":
+        return colrev.loader.json.JSONLoader
+    raise NotImplementedError
+
+
 def load(  # type: ignore
     filename: Path,
     *,
@@ -164,22 +186,7 @@ def load(  # type: ignore
             return {}
         raise FileNotFoundError
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_loader(filename.suffix)
 
     return parser(
         filename=filename,
@@ -216,20 +223,23 @@ def loads(  # type: ignore
     ]:
         raise NotImplementedError
 
-    with tempfile.NamedTemporaryFile(
-        mode="wb", delete=False, suffix=f".{implementation}"
-    ) as temp_file:
-        temp_file.write(load_string.encode("utf-8"))
-        temp_file_path = Path(temp_file.name)
+    parser = _get_loader(f".{implementation}")
 
-    return load(
-        filename=temp_file_path,
+    # Parse from memory (Excel files are binary)
+    file_object: typing.IO
+    if implementation in ["xls", "xlsx"]:
+        file_object = io.BytesIO(load_string.encode("utf-8"))
+    else:
+        file_object = io.StringIO(load_string)
+
+    return parser(
+        file_object=file_object,
         entrytype_setter=entrytype_setter,
         field_mapper=field_mapper,
         id_labeler=id_labeler,
         unique_id_field=unique_id_field,
         logger=logger,
-    )
+    ).load()
 
 
 def get_nr_records(  # type: ignore
@@ -240,21 +250,58 @@ def get_nr_records(  # type: ignore
     if not filename.exists():
         return 0
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_loader(filename.suffix)
 
     return parser.get_nr_records(filename)
+
+
+def get_nr_records_in_files(
+    filenames: typing.List[Path],
+    *,
+    cache_path: typing.Optional[Path] = None,
+    logger: logging.Logger = logging.getLogger(__name__),
+) -> dict:
+    """Get the number of records in multiple files (dict of filename: nr_records)
+
+    cache_path: optional json file in which the numbers are stored
+    (keyed by path, size, modification time and CoLRev version)
+    """
+
+    cache: dict = {}
+    if cache_path is not None and cache_path.is_file():
+        try:
+            with open(cache_path, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (json.JSONDecodeError, OSError):  # pragma: no cover
+            cache = {}
+
+    nr_records = {}
+    updated = False
+    for filename in filenames:
+        cache_key = str(Path(filename).resolve())
+        try:
+            stat = os.stat(cache_key)
+        except OSError:
+            logger.warning(f"File not found: {filename} (counted as 0 records)")
+            nr_records[filename] = 0
+            continue
+        # Note : the numbers depend on the loaders (i.e., the CoLRev version)
+        file_version = [stat.st_size, stat.st_mtime_ns, colrev.__version__]
+        if cache.get(cache_key, [])[:3] == file_version:
+            nr_records[filename] = cache[cache_key][3]
+            continue
+        nr_records[filename] = get_nr_records(filename)
+        cache[cache_key] = file_version + [nr_records[filename]]
+        updated = True
+
+    if cache_path is not None and updated:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        try:
+            cache_path.parent.mkdir(exist_ok=True, parents=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(cache, file)
+            os.replace(tmp_path, cache_path)
+        except OSError:  # pragma: no cover
+            pass  # the cache is optional
+
+    return nr_records
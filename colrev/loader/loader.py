@@ -17,14 +17,19 @@ class Loader:
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
         unique_id_field: str,
         logger: logging.Logger,
     ):
+        # Records are loaded from the file_object (e.g., an in-memory buffer)
+        # if it is provided, otherwise from the filename
+        assert filename is not None or file_object is not None
         self.filename = filename
+        self.file_object = file_object
         self.unique_id_field = unique_id_field
         assert id_labeler is not None or unique_id_field != ""
         self.id_labeler = id_labeler
@@ -93,6 +98,18 @@ class Loader:
                 f"Record contains invalid keys: {error_fields},\n record: {error_cases}"
             )
 
+    @classmethod
+    def get_nr_records(cls, filename: Path) -> int:
+        """Get the number of records in the file"""
+        raise NotImplementedError  # pragma: no cover
+
+    def _read_text(self, *, encoding: str = "utf-8") -> str:
+        """Read the contents of the file_object or file"""
+        if self.file_object is not None:
+            return self.file_object.read()
+        assert self.filename is not None
+        return self.filename.read_text(encoding=encoding)
+
     def load_records_list(self) -> list:
         """The load_records_list must be implemented by the inheriting class
         (e.g., for ris/bib/...)"""
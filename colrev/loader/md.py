@@ -2,6 +2,7 @@
 """Load conversion of reference sections (bibliographies) in md-documents based on GROBID"""
 from __future__ import annotations
 
+import io
 import logging
 import typing
 from pathlib import Path
@@ -24,7 +25,8 @@ class MarkdownLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -34,6 +36,7 @@ class MarkdownLoader(colrev.loader.loader.Loader):
 
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -61,8 +64,11 @@ class MarkdownLoader(colrev.loader.loader.Loader):
         grobid_service = colrev.env.grobid_service.GrobidService()
 
         grobid_service.check_grobid_availability()
-        with open(self.filename, encoding="utf8") as file:
-            references = [line.rstrip() for line in file if "#" not in line[:2]]
+        references = [
+            line.rstrip()
+            for line in io.StringIO(self._read_text(encoding="utf8"))
+            if "#" not in line[:2]
+        ]
 
         data = ""
         ind = 0
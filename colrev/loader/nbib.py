@@ -32,7 +32,8 @@ class NBIBLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -41,6 +42,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -104,7 +106,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
         # Note: skip-tags and unknown-tags can be handled
         # between load_nbib_entries and convert_to_records.
 
-        text = self.filename.read_text(encoding="utf-8")
+        text = self._read_text()
         # clean_text?
         lines = text.split("\n")
         records_list = list(r for r in self._parse_lines(lines) if r)
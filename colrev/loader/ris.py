@@ -32,7 +32,8 @@ class RISLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -41,6 +42,7 @@ class RISLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -121,7 +123,7 @@ class RISLoader(colrev.loader.loader.Loader):
         # its DEFAULT_LIST_TAGS can be extended with list fields that should be joined automatically
 
         if content == "":
-            content = self.filename.read_text(encoding="utf-8")
+            content = self._read_text()
             content = self._clean_text(content)
 
         lines = content.split("\n")
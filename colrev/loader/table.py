@@ -2,6 +2,7 @@
 """Convenience functions to load tabular files (csv, xlsx)"""
 from __future__ import annotations
 
+import io
 import logging
 import typing
 from pathlib import Path
@@ -22,7 +23,8 @@ class TableLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -31,6 +33,7 @@ class TableLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -50,16 +53,25 @@ class TableLoader(colrev.loader.loader.Loader):
 
     def load_records_list(self) -> list:
         try:
-            if self.filename.name.endswith(".csv"):
-                data = pd.read_csv(self.filename)
-            elif self.filename.name.endswith((".xls", ".xlsx")):
-                data = pd.read_excel(
-                    self.filename, dtype=str
-                )  # dtype=str to avoid type casting
+            if self.file_object is not None:
+                # Text buffers contain csv data, binary buffers contain Excel data
+                if isinstance(self.file_object, io.TextIOBase):
+                    data = pd.read_csv(self.file_object)
+                else:
+                    data = pd.read_excel(self.file_object, dtype=str)
+            else:
+                assert self.filename is not None
+                if self.filename.name.endswith(".csv"):
+                    data = pd.read_csv(self.filename)
+                elif self.filename.name.endswith((".xls", ".xlsx")):
+                    data = pd.read_excel(
+                        self.filename, dtype=str
+                    )  # dtype=str to avoid type casting
 
-        except pd.errors.ParserError as exc:  # pragma: no cover
+        except pd.errors.ParserError as exc:
+            name = self.filename.name if self.filename is not None else "input"
             raise colrev_exceptions.ImportException(
-                f"Error: Not a valid file? {self.filename.name}"
+                f"Error: Not a valid file? {name}"
             ) from exc
 
         records_list = data.to_dict("records")
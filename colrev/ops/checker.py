@@ -22,6 +22,13 @@ from colrev.process.model import ProcessModel
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
+# (source, dest) : trigger
+# Note : if multiple triggers lead to the same transition, the last one is used
+_TRANSITION_TRIGGERS = {
+    (transition["source"], transition["dest"]): transition["trigger"]
+    for transition in ProcessModel.transitions
+}
+
 
 class Checker:
     """The CoLRev checker makes sure the project setup is ok"""
@@ -488,41 +495,48 @@ class Checker:
         prior_records = next(
             self.review_manager.dataset.load_records_from_history(), {}
         )
+        post_md_processed_states = RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
         for prior_record in prior_records.values():
             for orig in prior_record[Fields.ORIGIN]:
                 prior[Fields.STATUS].append([orig, prior_record[Fields.STATUS]])
-                if prior_record[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.md_processed
-                ):
+                if prior_record[Fields.STATUS] in post_md_processed_states:
                     prior["persisted_IDs"].append([orig, prior_record[Fields.ID]])
         return prior
 
+    def _get_prior_status_index(self, *, prior: dict) -> dict:
+        """Index the prior status by origin: (position in prior, status)"""
+        prior_status_index: dict = {}
+        for position, (org, stat) in enumerate(prior.get(Fields.STATUS, [])):
+            if org not in prior_status_index:
+                prior_status_index[org] = (position, stat)
+        return prior_status_index
+
     # pylint: disable=too-many-arguments
     def _get_status_transitions(
         self,
         *,
         record_id: str,
         origin: list,
-        prior: dict,
+        prior_status_index: dict,
         status: RecordState,
         status_data: dict,
     ) -> dict:
-        prior_status = []
-        if Fields.STATUS in prior:
-            prior_status = [
-                stat for (org, stat) in prior[Fields.STATUS] if org in origin
-            ]
+        # The prior status of the first origin (in prior order)
+        prior_items = [
+            prior_status_index[org] for org in origin if org in prior_status_index
+        ]
+        prior_status = [min(prior_items)[1]] if prior_items else []
 
         status_transition = {}
         if len(prior_status) == 0:
             # pylint: disable=colrev-missed-constant-usage
             status_transition[record_id] = "load"
         else:
-            proc_transition_list: list = [
-                x["trigger"]
-                for x in ProcessModel.transitions
-                if str(x["source"]) == prior_status[0] and str(x["dest"]) == status
-            ]
+            proc_transition_list: list = []
+            if (prior_status[0], status) in _TRANSITION_TRIGGERS:
+                proc_transition_list = [_TRANSITION_TRIGGERS[(prior_status[0], status)]]
             if len(proc_transition_list) == 0 and prior_status[0] != status:
                 status_data["start_states"].append(prior_status[0])
                 if prior_status[0] not in RecordState:
@@ -560,6 +574,10 @@ class Checker:
             "invalid_state_transitions": [],
         }
 
+        prior_status_index = self._get_prior_status_index(prior=prior)
+        post_md_processed_states = RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
         for record_dict in records.values():
             status_data["IDs"].append(record_dict[Fields.ID])
 
@@ -569,9 +587,6 @@ class Checker:
                 else:
                     status_data["origin_ID_list"][org] = [record_dict[Fields.ID]]
 
-            post_md_processed_states = RecordState.get_post_x_states(
-                state=RecordState.md_processed
-            )
             if record_dict[Fields.STATUS] in post_md_processed_states:
                 for origin_part in record_dict[Fields.ORIGIN]:
                     status_data["persisted_IDs"].append(
@@ -601,7 +616,7 @@ class Checker:
             status_transition = self._get_status_transitions(
                 record_id=record_dict[Fields.ID],
                 origin=record_dict[Fields.ORIGIN],
-                prior=prior,
+                prior_status_index=prior_status_index,
                 status=record_dict[Fields.STATUS],
                 status_data=status_data,
             )
@@ -5,7 +5,6 @@ from __future__ import annotations
 import string
 import typing
 from collections import defaultdict
-from itertools import combinations
 from pathlib import Path
 
 import pandas as pd
@@ -57,12 +56,35 @@ class Dedupe(colrev.process.operation.Operation):
         self.dedupe_dir.mkdir(exist_ok=True, parents=True)
 
     @classmethod
-    def _dfs(cls, node: str, graph: dict, visited: dict, component: list) -> None:
-        visited[node] = True
-        component.append(node)
-        for neighbor in graph[node]:
-            if not visited[neighbor]:
-                cls._dfs(neighbor, graph, visited, component)
+    def _get_id_clusters(cls, id_sets: list) -> list:
+        """Resolve the id_sets to disjoint clusters (union-find)
+
+        The IDs of each cluster are in the order of their first occurrence."""
+
+        parent: typing.Dict[str, str] = {}
+
+        def find(node: str) -> str:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]  # path halving
+                node = parent[node]
+            return node
+
+        for id_set in id_sets:
+            ids = list(id_set)
+            if len(ids) < 2:
+                continue
+            for node in ids:
+                parent.setdefault(node, node)
+            root = find(ids[0])
+            for node in ids[1:]:
+                node_root = find(node)
+                if node_root != root:
+                    parent[node_root] = root
+
+        clusters: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        for node in parent:
+            clusters[find(node)].append(node)
+        return list(clusters.values())
 
     @classmethod
     def connected_components(cls, id_sets: list) -> list:
@@ -75,24 +97,7 @@ class Dedupe(colrev.process.operation.Operation):
         Returns:
             list: A list of connected components.
         """
-        graph = defaultdict(list)
-
-        # Create an adjacency list
-        for origin_set in id_sets:
-            for combination in combinations(origin_set, 2):
-                graph[combination[0]].append(combination[1])
-                graph[combination[1]].append(combination[0])
-
-        visited = {node: False for node in graph}
-        components = []
-
-        for node in graph:
-            if not visited[node]:
-                component: typing.List[str] = []
-                cls._dfs(node, graph, visited, component)
-                components.append(sorted(component))
-
-        return components
+        return [sorted(cluster) for cluster in cls._get_id_clusters(id_sets)]
 
     @classmethod
     def get_records_for_dedupe(
@@ -401,11 +406,12 @@ class Dedupe(colrev.process.operation.Operation):
                 )
         # Drop cases where IDs are identical
         id_sets = [id_set for id_set in id_sets if len(set(id_set)) != 1]
+        id_clusters = self._get_id_clusters(id_sets)
 
         removed_duplicates = []
         duplicate_id_mappings: typing.Dict[str, list] = {}
         for main_record, dupe_record in self._get_records_to_merge(
-            records=records, id_sets=id_sets
+            records=records, id_clusters=id_clusters
         ):
             if self._skip_merge_condition(
                 main_record=main_record, dupe_record=dupe_record
@@ -422,7 +428,6 @@ class Dedupe(colrev.process.operation.Operation):
                 main_record=main_record,
                 dupe_record=dupe_record,
             )
-            dupe_record.data["MOVED_DUPE_ID"] = main_record.data[Fields.ID]
             main_record.merge(
                 dupe_record,
                 default_source="merged",
@@ -443,36 +448,70 @@ class Dedupe(colrev.process.operation.Operation):
             complete_dedupe=complete_dedupe,
             set_to_md_processed=set_to_md_processed,
         )
+        self.review_manager.logger.info(
+            "Duplicate clusters: ".ljust(39) + f"{len(id_clusters)} clusters"
+        )
 
-    def _get_records_to_merge(
-        self, *, records: dict, id_sets: list
-    ) -> typing.Iterable[tuple]:
-        """Resolves multiple/chained duplicates (by following the MOVED_DUPE_ID mark)
-        and returns tuples with the primary merge record in the first position."""
+    def _split_cross_level_cluster(self, *, records: dict, id_cluster: list) -> list:
+        """Split clusters that would require cross-level merges
+        (otherwise, no member is merged if a cross-level record is the primary record)
 
-        for id_set in id_sets:
-            recs_to_merge = [r for r in records.values() if r[Fields.ID] in id_set]
+        Proceedings are not merged, and inbooks are merged separately from books."""
 
-            # Simple way of implementing the closure
-            # cases where the main_record has already been merged into another record
-            for ind, rec_to_merge in enumerate(recs_to_merge):
-                cur_rec = rec_to_merge
-                while "MOVED_DUPE_ID" in cur_rec:
-                    cur_rec = records[cur_rec["MOVED_DUPE_ID"]]
-                recs_to_merge[ind] = cur_rec
+        if self.review_manager.force_mode:
+            return [id_cluster]
 
-            if all(recs_to_merge[0][Fields.ID] == r[Fields.ID] for r in recs_to_merge):
+        entrytypes = {
+            record_id: records[record_id].get(Fields.ENTRYTYPE, "")
+            for record_id in id_cluster
+        }
+        remaining_ids = []
+        for record_id in id_cluster:
+            if entrytypes[record_id] != ENTRYTYPES.PROCEEDINGS:
+                remaining_ids.append(record_id)
                 continue
+            self.review_manager.logger.info(
+                "Prevented cross-level merge: "
+                f"{record_id} - {', '.join(i for i in id_cluster if i != record_id)}"
+            )
 
-            for rec_1, rec_2 in combinations(recs_to_merge, 2):
-                main_record_dict, dupe_record_dict = self._select_primary_merge_record(
-                    rec_1, rec_2
-                )
+        inbook_ids = [i for i in remaining_ids if entrytypes[i] == ENTRYTYPES.INBOOK]
+        split_clusters = [remaining_ids]
+        if inbook_ids and any(entrytypes[i] == ENTRYTYPES.BOOK for i in remaining_ids):
+            self.review_manager.logger.info(
+                f"Prevented cross-level merge: {', '.join(inbook_ids)} (inbook) - "
+                f"{', '.join(i for i in remaining_ids if i not in inbook_ids)}"
+            )
+            split_clusters = [
+                [i for i in remaining_ids if i not in inbook_ids],
+                inbook_ids,
+            ]
+        return [cluster for cluster in split_clusters if len(cluster) > 1]
+
+    def _get_records_to_merge(
+        self, *, records: dict, id_clusters: list
+    ) -> typing.Iterable[tuple]:
+        """Selects the primary record of each cluster (of duplicates)
+        and returns tuples with the primary merge record in the first position."""
 
-                main_record = colrev.record.record.Record(main_record_dict)
-                dupe_record = colrev.record.record.Record(dupe_record_dict)
+        for id_cluster in [
+            split_cluster
+            for id_cluster in id_clusters
+            for split_cluster in self._split_cross_level_cluster(
+                records=records, id_cluster=id_cluster
+            )
+        ]:
+            main_record_dict = records[id_cluster[0]]
+            for record_id in id_cluster[1:]:
+                main_record_dict, _ = self._select_primary_merge_record(
+                    main_record_dict, records[record_id]
+                )
 
-                yield (main_record, dupe_record)
+            main_record = colrev.record.record.Record(main_record_dict)
+            for record_id in id_cluster:
+                if record_id == main_record_dict[Fields.ID]:
+                    continue
+                yield (main_record, colrev.record.record.Record(records[record_id]))
 
     def _get_origins_for_current_ids(self, current_record_ids: list) -> dict:
         """
@@ -630,7 +669,7 @@ class Dedupe(colrev.process.operation.Operation):
                 except colrev_exceptions.NotEnoughDataToIdentifyException:
                     pass
 
-        id_sets = []
+        id_sets: typing.List[list] = []
         for global_key in global_keys:
             global_key_dict: typing.Dict[str, list] = {}
             for record in records.values():
@@ -641,9 +680,7 @@ class Dedupe(colrev.process.operation.Operation):
                 else:
                     global_key_dict[record[global_key]] = [record[Fields.ID]]
 
-            global_key_duplicates = [v for v in global_key_dict.values() if len(v) > 1]
-            for duplicate in global_key_duplicates:
-                id_sets.extend(list(combinations(duplicate, 2)))
+            id_sets.extend(v for v in global_key_dict.values() if len(v) > 1)
 
         if apply:
             self.apply_merges(id_sets=id_sets)
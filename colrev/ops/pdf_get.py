@@ -10,6 +10,7 @@ from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
+import colrev.record.record_identifier
 import colrev.record.record_pdf
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -220,6 +221,21 @@ class PDFGet(colrev.process.operation.Operation):
 
         return record.get_data()
 
+    def _get_pdf_candidates(self, pdf_dir: Path) -> dict:
+        """Get the colrev_pdf_ids of the PDFs (relative paths)"""
+        pdf_paths = list(pdf_dir.glob("**/*.pdf"))
+        pdf_ids = colrev.record.record_identifier.get_colrev_pdf_ids(
+            pdf_paths, cache_path=self.review_manager.paths.pdf_ids_cache
+        )
+        return {
+            pdf_candidate.relative_to(self.review_manager.path): (
+                pdf_ids[pdf_candidate]
+                if pdf_candidate in pdf_ids
+                else colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(pdf_candidate)
+            )
+            for pdf_candidate in pdf_paths
+        }
+
     def _relink_pdfs(
         self,
         records: typing.Dict[str, typing.Dict],
@@ -247,12 +263,7 @@ class PDFGet(colrev.process.operation.Operation):
             source_records = list(source_records_dict.values())
 
             self.review_manager.logger.info("Calculate colrev_pdf_ids")
-            pdf_candidates = {
-                pdf_candidate.relative_to(
-                    self.review_manager.path
-                ): colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(pdf_candidate)
-                for pdf_candidate in list(pdf_dir.glob("**/*.pdf"))
-            }
+            pdf_candidates = self._get_pdf_candidates(pdf_dir)
 
             for record in records.values():
                 if Fields.FILE not in record:
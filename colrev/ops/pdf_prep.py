@@ -11,7 +11,6 @@ from pathlib import Path
 import requests
 
 import colrev.exceptions as colrev_exceptions
-import colrev.packages.grobid_tei.src.grobid_tei
 import colrev.process.operation
 import colrev.record.record_pdf
 from colrev.constants import Colors
@@ -361,24 +360,27 @@ class PDFPrep(colrev.process.operation.Operation):
         """Generate TEI documents for included records"""
 
         self.review_manager.logger.info("Generate TEI documents")
-        endpoint = colrev.packages.grobid_tei.src.grobid_tei.GROBIDTEI(
-            pdf_prep_operation=self, settings={"endpoint": "colrev.grobid_tei"}
-        )
         records = self.review_manager.dataset.load_records_dict()
+        tei_paths = {}
         for record_dict in records.values():
             if record_dict[Fields.STATUS] not in [
                 RecordState.rev_included,
                 RecordState.rev_synthesized,
             ]:
                 continue
-            self.review_manager.logger.info(record_dict[Fields.ID])
-            try:
-                endpoint.prep_pdf(
-                    record=colrev.record.record_pdf.PDFRecord(record_dict),
-                    pad=0,
-                )
-            except colrev_exceptions.TEIException:
-                self.review_manager.logger.error("Error generating TEI")
+            if not record_dict.get(Fields.FILE, "NA").endswith(".pdf"):
+                continue
+            record = colrev.record.record_pdf.PDFRecord(record_dict)
+            tei_paths[self.review_manager.path / Path(record_dict[Fields.FILE])] = (
+                self.review_manager.path / record.get_tei_filename()
+            )
+
+        tei_generator = self.review_manager.get_tei_generator()
+        available = tei_generator.generate(tei_paths)
+        if len(available) < len(tei_paths):
+            self.review_manager.logger.error(
+                f"Error generating {len(tei_paths) - len(available)} TEIs"
+            )
 
     @colrev.process.operation.Operation.decorate()
     def main(
@@ -763,6 +763,19 @@ class Prep(colrev.process.operation.Operation):
                 )
                 endpoint.check_availability(source_operation=self)  # type: ignore
 
+    def _precompute_batch(self, preparation_data: list) -> None:
+        # Endpoints can process the batch of records at once (e.g., in parallel)
+        records = [
+            item["record"]
+            for item in preparation_data
+            if self._status_to_prepare(item["record"]) or self.polish
+        ]
+        for endpoint_name, endpoint in self.prep_package_endpoints.items():
+            precompute_function = getattr(endpoint, "precompute_batch", None)
+            if callable(precompute_function):
+                self.review_manager.logger.debug(f"Precompute batch ({endpoint_name})")
+                endpoint.precompute_batch(records)  # type: ignore
+
     def _log_record_change_scores(
         self, *, preparation_data: list, prepared_records: list
     ) -> None:
@@ -940,6 +953,7 @@ class Prep(colrev.process.operation.Operation):
                     print()
                     return
 
+                self._precompute_batch(preparation_data)
                 if self._cpu == 1:
                     # Note: preparation_data is not turned into a list of records.
                     prepared_records = []
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import time
+import typing
 from copy import deepcopy
 from random import randint
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.loader.load_utils_formatter
 import colrev.record.record_merger
@@ -70,6 +72,15 @@ class SearchAPIFeed:
         self.prep_mode = prep_mode
         if not prep_mode:
             self.records = self.review_manager.dataset.load_records_dict()
+            self._index_origins()
+
+    def _index_origins(self) -> None:
+        """Index the records by colrev_origin (origin: ID of the first record)"""
+        self._origin_index: typing.Dict[str, str] = {}
+        for record_id, record_dict in self.records.items():
+            for origin in record_dict.get(Fields.ORIGIN, []):
+                self._origin_index.setdefault(origin, record_id)
+        self._indexed_records = (id(self.records), len(self.records))
 
     def _load_feed(self) -> None:
         if not self.feed_file.is_file():
@@ -170,30 +181,36 @@ class SearchAPIFeed:
                 )
         return added_new
 
+    def _normalize(self, record: colrev.record.record.Record) -> dict:
+        """Normalize the record like saving/loading it (in memory if possible)"""
+        record_dict = colrev.loader.bib.normalize_fields(
+            record.data, skip=FieldSet.PROVENANCE_KEYS + [Fields.CURATION_ID]
+        )
+        if record_dict is not None:
+            return record_dict
+
+        record_dict = deepcopy(record.data)
+        bibtex_str = to_string(
+            records_dict={record_dict[Fields.ID]: record_dict}, implementation="bib"
+        )
+        return list(
+            colrev.loader.load_utils.loads(
+                load_string=bibtex_str,
+                implementation="bib",
+                logger=self.review_manager.logger,
+            ).values()
+        )[0]
+
     def _have_changed(
         self,
         record_a: colrev.record.record.Record,
         record_b: colrev.record.record.Record,
     ) -> bool:
 
-        def tostr_and_load(record: colrev.record.record.Record) -> dict:
-            record_dict = deepcopy(record.data)
-            bibtex_str = to_string(
-                records_dict={record_dict[Fields.ID]: record_dict}, implementation="bib"
-            )
-            record_dict = list(
-                colrev.loader.load_utils.loads(
-                    load_string=bibtex_str,
-                    implementation="bib",
-                    logger=self.review_manager.logger,
-                ).values()
-            )[0]
-            return record_dict
-
         # To ignore changes introduced by saving/loading the feed-records,
-        # we parse and load them in the following.
-        record_a_dict = tostr_and_load(record_a)
-        record_b_dict = tostr_and_load(record_b)
+        # we normalize them in the following.
+        record_a_dict = self._normalize(record_a)
+        record_b_dict = self._normalize(record_b)
 
         # Note : record_a can have more keys (that's ok)
         changed = False
@@ -319,17 +336,22 @@ class SearchAPIFeed:
 
     def _get_main_record(self, colrev_origin: str) -> colrev.record.record.Record:
 
-        main_record_dict: dict = {}
-        for record_dict in self.records.values():
-            if colrev_origin in record_dict[Fields.ORIGIN]:
-                main_record_dict = record_dict
-                break
+        # Note : the records may be replaced or extended
+        if self._indexed_records != (id(self.records), len(self.records)):
+            self._index_origins()
+        record_id = self._origin_index.get(colrev_origin, "")
+        if not record_id or colrev_origin not in self.records.get(record_id, {}).get(
+            Fields.ORIGIN, []
+        ):
+            # The origins of the records changed (e.g., merged or added origins)
+            self._index_origins()
+            record_id = self._origin_index.get(colrev_origin, "")
 
-        if main_record_dict == {}:
+        if not record_id:
             raise colrev_exceptions.RecordNotFoundException(
                 f"Could not find/update {colrev_origin}"
             )
-        return colrev.record.record.Record(main_record_dict)
+        return colrev.record.record.Record(self.records[record_id])
 
     def _update_record(
         self,
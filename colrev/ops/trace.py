@@ -39,12 +39,9 @@ class Trace(colrev.process.operation.Operation):
         self,
         *,
         commit: git.objects.commit.Commit,
-        records_dict: dict,
-        record_id: str,
+        record: dict,
         prev_record: dict,
     ) -> dict:
-        record = records_dict[record_id]
-
         diffs = list(dictdiffer.diff(prev_record, record))
 
         if len(diffs) > 0:
@@ -84,9 +81,6 @@ class Trace(colrev.process.operation.Operation):
 
         prev_record: dict = {}
         for commit in reversed(list(revlist)):
-            filecontents = (
-                commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-            ).data_stream.read()
             commit_message_first_line = str(commit.message).partition("\n")[0]
 
             if self.review_manager.verbose_mode:
@@ -100,20 +94,18 @@ class Trace(colrev.process.operation.Operation):
                     + f" {commit_message_first_line} (by {commit.author.name})"
                 )
 
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8"),
-                implementation="bib",
-                logger=self.review_manager.logger,
+            # Note : the parsed versions of the records file are cached (per blob)
+            record = self.review_manager.dataset.load_record_from_blob(
+                commit.tree / self.review_manager.paths.RECORDS_FILE_GIT, record_id
             )
 
-            if record_id not in records_dict:
+            if record is None:
                 if self.review_manager.verbose_mode:
                     print(f"record {record_id} not in commit.")
                 continue
 
             prev_record = self._print_record_changes(
                 commit=commit,
-                records_dict=records_dict,
-                record_id=record_id,
+                record=record,
                 prev_record=prev_record,
             )
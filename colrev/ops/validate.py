@@ -36,17 +36,14 @@ class Validate(colrev.process.operation.Operation):
         # Ensure the path uses forward slashes, which is compatible with Git's path handling
         records_file_path = self.review_manager.paths.RECORDS_FILE_GIT
         revlist = (
-            (
-                commit_i.hexsha,
-                (commit_i.tree / records_file_path).data_stream.read(),
-            )
+            (commit_i.hexsha, commit_i.tree / records_file_path)
             for commit_i in git_repo.iter_commits(
                 paths=str(self.review_manager.paths.RECORDS_FILE)
             )
         )
 
         found_target_commit = False
-        for commit_id, filecontents in list(revlist):
+        for commit_id, blob in revlist:
             if commit_sha:
                 if commit_id == commit_sha:
                     found_target_commit = True
@@ -57,13 +54,7 @@ class Validate(colrev.process.operation.Operation):
                 # To skip the same commit
                 found_target_commit = True
                 continue
-            prior_records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
-
-            return prior_records_dict
+            return self.review_manager.dataset.load_records_from_blob(blob)
         return {}
 
     def _get_prep_prescreen_exclusions(self, records: dict) -> list:
@@ -277,12 +268,7 @@ class Validate(colrev.process.operation.Operation):
         dataset = self.review_manager.dataset
         git_repo = dataset.get_repo()
         revlist = (
-            (
-                commit.hexsha,
-                (
-                    commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-                ).data_stream.read(),
-            )
+            (commit.hexsha, commit.tree / self.review_manager.paths.RECORDS_FILE_GIT)
             for commit in git_repo.iter_commits(
                 paths=str(self.review_manager.paths.RECORDS_FILE)
             )
@@ -290,20 +276,12 @@ class Validate(colrev.process.operation.Operation):
         found = False
         records: typing.Dict[str, typing.Any] = {}
         prior_records = {}
-        for commit, filecontents in list(revlist):
+        for commit, blob in revlist:
             if found:  # load the records_file_relative in the following commit
-                prior_records = colrev.loader.load_utils.loads(
-                    load_string=filecontents.decode("utf-8"),
-                    implementation="bib",
-                    logger=self.review_manager.logger,
-                )
+                prior_records = dataset.load_records_from_blob(blob)
                 break
             if commit == target_commit:
-                records = colrev.loader.load_utils.loads(
-                    load_string=filecontents.decode("utf-8"),
-                    implementation="bib",
-                    logger=self.review_manager.logger,
-                )
+                records = dataset.load_records_from_blob(blob)
                 found = True
 
         # determine which records have been changed (prepared or merged)
@@ -523,37 +501,16 @@ class Validate(colrev.process.operation.Operation):
             if not any(x in commit.message for x in ["prescreen", "screen"]):
                 continue
 
-            load_str = (
-                (commit.parents[0].tree / self.review_manager.paths.RECORDS_FILE_GIT)
-                .data_stream.read()
-                .decode("utf-8")
+            dataset = self.review_manager.dataset
+            records_file = self.review_manager.paths.RECORDS_FILE_GIT
+            records_branch_1 = dataset.load_records_from_blob(
+                commit.parents[0].tree / records_file
             )
-            records_branch_1 = colrev.loader.load_utils.loads(
-                load_string=load_str,
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
-
-            load_str = (
-                (commit.parents[1].tree / self.review_manager.paths.RECORDS_FILE_GIT)
-                .data_stream.read()
-                .decode("utf-8")
-            )
-            records_branch_2 = colrev.loader.load_utils.loads(
-                load_string=load_str,
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
-
-            load_str = (
-                (commit.tree / self.review_manager.paths.RECORDS_FILE_GIT)
-                .data_stream.read()
-                .decode("utf-8")
+            records_branch_2 = dataset.load_records_from_blob(
+                commit.parents[1].tree / records_file
             )
-            records_reconciled = colrev.loader.load_utils.loads(
-                load_string=load_str,
-                implementation="bib",
-                logger=self.review_manager.logger,
+            records_reconciled = dataset.load_records_from_blob(
+                commit.tree / records_file
             )
 
             if "screen" in commit.message or "prescreen" in commit.message:
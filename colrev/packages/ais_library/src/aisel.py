@@ -23,6 +23,7 @@ from colrev.constants import Fields
 from colrev.constants import FieldValues
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 from colrev.packages.ais_library.src import ais_load_utils
 
 # pylint: disable=unused-argument
@@ -251,7 +252,7 @@ class AISeLibrarySearchSource(JsonSchemaMixin):
         )
         query_string = f"{query_string}&q={final_q}"
 
-        response = requests.get(query_string, timeout=300)
+        response = session_manager.get_session().get(query_string, timeout=300)
         response.raise_for_status()
 
         # Note: the following writes the enl to the feed file (bib).
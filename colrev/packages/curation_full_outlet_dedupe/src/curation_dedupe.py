@@ -9,6 +9,7 @@ import pandas as pd
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 from rapidfuzz import fuzz
+from rapidfuzz import process
 from tqdm import tqdm
 
 import colrev.package_manager.interfaces
@@ -98,6 +99,21 @@ class CurationDedupe(JsonSchemaMixin):
 
         return similarity_score
 
+    def _get_similarity_matrix(self, *, references: pd.DataFrame) -> np.ndarray:
+        """Compute the similarities (as in _get_similarity) of all pairs of references"""
+        authors = references[Fields.AUTHOR].tolist()
+        titles = references[Fields.TITLE].str.lower().tolist()
+        author_similarities = process.cdist(
+            authors, authors, scorer=fuzz.ratio, dtype=np.float64, workers=-1
+        )
+        title_similarities = process.cdist(
+            titles, titles, scorer=fuzz.ratio, dtype=np.float64, workers=-1
+        )
+        # Note : weights and rounding correspond to _get_similarity
+        return np.round(
+            author_similarities / 100 * 0.4 + title_similarities / 100 * 0.6, 4
+        )
+
     def _calculate_similarities(
         self,
         *,
@@ -106,17 +122,17 @@ class CurationDedupe(JsonSchemaMixin):
         min_similarity: float,
     ) -> tuple:
         # Fill out the similarity matrix first
-        for base_entry_i in range(1, references.shape[0]):
-            for comparison_entry_i in range(1, references.shape[0]):
-                if base_entry_i > comparison_entry_i:
-                    if -1 != similarity_array[base_entry_i, comparison_entry_i]:
-                        similarity_array[base_entry_i, comparison_entry_i] = (
-                            self._get_similarity(
-                                df_a=references.iloc[base_entry_i],
-                                df_b=references.iloc[comparison_entry_i],
-                            )
-                        )
-
+        # (lower triangle, excluding the first entry and entries set to -1)
+        to_fill: np.ndarray = np.tril(np.ones(similarity_array.shape, dtype=bool), k=-1)
+        to_fill[0, :] = False
+        to_fill[:, 0] = False
+        to_fill &= similarity_array != -1
+        if to_fill.any():
+            similarity_array[to_fill] = self._get_similarity_matrix(
+                references=references
+            )[to_fill]
+
+        record_ids = references[Fields.ID].tolist()
         tuples_to_process = []
         maximum_similarity = 1
         while True:
@@ -129,8 +145,8 @@ class CurationDedupe(JsonSchemaMixin):
                 similarity_array[cord] = 0  # ie., has been processed
                 tuples_to_process.append(
                     [
-                        references.iloc[cord[0]][Fields.ID],
-                        references.iloc[cord[1]][Fields.ID],
+                        record_ids[cord[0]],
+                        record_ids[cord[1]],
                         maximum_similarity,
                         "not_processed",
                     ]
@@ -161,6 +177,20 @@ class CurationDedupe(JsonSchemaMixin):
         toc_items = list(map(dict, temp))  # type: ignore
         return toc_items
 
+    def _get_toc_index(self, *, records_list: list, toc_items: list) -> dict:
+        """Index the records by toc_item (records matching all fields of the toc_item)"""
+        toc_index: dict = {tuple(sorted(t.items())): [] for t in toc_items}
+        toc_fields = {tuple(sorted(t)) for t in toc_items}
+        for record in records_list:
+            for fields in toc_fields:
+                toc_key = tuple((k, record.get(k, "NA")) for k in fields)
+                if toc_key in toc_index:
+                    toc_index[toc_key].append(record)
+        return toc_index
+
+    def _get_toc_records(self, *, toc_index: dict, toc_item: dict) -> list:
+        return toc_index[tuple(sorted(toc_item.items()))]
+
     def _warn_on_missing_sources(self, *, first_source: bool) -> None:
         # warn if not all SOURCE.filenames are included in a dedupe script
         if first_source:
@@ -219,15 +249,25 @@ class CurationDedupe(JsonSchemaMixin):
         ]
 
         toc_items = self._get_toc_items(records_list=source_records)
+        records_toc_index = self._get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_records_toc_index = self._get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
 
         for toc_item in toc_items:
+            same_toc_source_records = self._get_toc_records(
+                toc_index=source_records_toc_index, toc_item=toc_item
+            )
             # Note : these would be potential errors (duplicates)
             # because they have the same selected_source
             processed_same_toc_same_source_records = [
                 r
-                for r in records.values()
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-                and r[Fields.STATUS]
+                for r in self._get_toc_records(
+                    toc_index=records_toc_index, toc_item=toc_item
+                )
+                if r[Fields.STATUS]
                 not in [
                     RecordState.md_prepared,
                     RecordState.md_needs_manual_preparation,
@@ -244,17 +284,13 @@ class CurationDedupe(JsonSchemaMixin):
                 print(toc_item)
 
                 for source_record_dict in sorted(
-                    source_records, key=lambda d: d[Fields.AUTHOR]
+                    same_toc_source_records, key=lambda d: d[Fields.AUTHOR]
                 ):
-                    if all(
-                        source_record_dict.get(k, "NA") == v
-                        for k, v in toc_item.items()
-                    ):
-                        # Record(sr).print_citation_format()
-                        print(
-                            f"{source_record_dict.get('author', 'NO_AUTHOR')} : "
-                            f"{source_record_dict.get('title', 'NO_TITLE')}"
-                        )
+                    # Record(sr).print_citation_format()
+                    print(
+                        f"{source_record_dict.get('author', 'NO_AUTHOR')} : "
+                        f"{source_record_dict.get('title', 'NO_TITLE')}"
+                    )
                 recs_unique = self.review_manager.force_mode
                 if not recs_unique:
                     recs_unique = "y" == input(
@@ -262,17 +298,11 @@ class CurationDedupe(JsonSchemaMixin):
                         "All records unique? Set to md_processed [y]? "
                     )
                 if recs_unique:
-                    for source_record_dict in source_records:
-                        if all(
-                            source_record_dict.get(k, "NA") == v
-                            for k, v in toc_item.items()
-                        ):
-                            source_record = colrev.record.record.Record(
-                                data=source_record_dict
-                            )
-                            source_record.set_status(
-                                target_state=RecordState.md_processed
-                            )
+                    for source_record_dict in same_toc_source_records:
+                        source_record = colrev.record.record.Record(
+                            data=source_record_dict
+                        )
+                        source_record.set_status(target_state=RecordState.md_processed)
             else:
                 print(toc_item)
                 print("Pre-imported records found for this toc_item (skipping)")
@@ -340,13 +370,21 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[list] = []
         # decision_list =[{'ID1': ID1, 'ID2': ID2, 'decision': 'duplicate'}]
 
+        records_toc_index = self._get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_records_toc_index = self._get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
+
         # match based on overlapping  colrev_ids
         for toc_item in tqdm(toc_items):
             processed_same_toc_records = [
                 r
-                for r in records.values()
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-                and r[Fields.STATUS]
+                for r in self._get_toc_records(
+                    toc_index=records_toc_index, toc_item=toc_item
+                )
+                if r[Fields.STATUS]
                 not in [
                     RecordState.md_imported,
                     RecordState.md_needs_manual_preparation,
@@ -358,11 +396,9 @@ class CurationDedupe(JsonSchemaMixin):
                     for co in r[Fields.ORIGIN]
                 )
             ]
-            new_same_toc_records = [
-                r
-                for r in source_records
-                if all(r.get(k, "NA") == v for k, v in toc_item.items())
-            ]
+            new_same_toc_records = self._get_toc_records(
+                toc_index=source_records_toc_index, toc_item=toc_item
+            )
             if len(new_same_toc_records) > 0:
                 # print(new_same_toc_records)
                 for new_same_toc_record in new_same_toc_records:
@@ -433,13 +469,15 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[list],
         toc_item: dict,
         records: dict,
-        source_records: list,
+        records_toc_index: dict,
+        source_records_toc_index: dict,
     ) -> None:
         processed_same_toc_records = [
             r
-            for r in records.values()
-            if all(r.get(k, "NA") == v for k, v in toc_item.items())
-            and r[Fields.STATUS]
+            for r in self._get_toc_records(
+                toc_index=records_toc_index, toc_item=toc_item
+            )
+            if r[Fields.STATUS]
             not in [
                 RecordState.md_imported,
                 RecordState.md_needs_manual_preparation,
@@ -451,11 +489,9 @@ class CurationDedupe(JsonSchemaMixin):
                 for co in r[Fields.ORIGIN]
             )
         ]
-        pdf_same_toc_records = [
-            r
-            for r in source_records
-            if all(r.get(k, "NA") == v for k, v in toc_item.items())
-        ]
+        pdf_same_toc_records = self._get_toc_records(
+            toc_index=source_records_toc_index, toc_item=toc_item
+        )
 
         references = pd.DataFrame.from_records(
             processed_same_toc_records + pdf_same_toc_records
@@ -501,12 +537,20 @@ class CurationDedupe(JsonSchemaMixin):
         decision_list: list[list] = []
         # decision_list =[{'ID1': ID1, 'ID2': ID2, 'decision': 'duplicate'}]
 
-        for toc_item in tqdm(self._get_toc_items(records_list=source_records)):
+        toc_items = self._get_toc_items(records_list=source_records)
+        records_toc_index = self._get_toc_index(
+            records_list=list(records.values()), toc_items=toc_items
+        )
+        source_records_toc_index = self._get_toc_index(
+            records_list=source_records, toc_items=toc_items
+        )
+        for toc_item in tqdm(toc_items):
             self._dedupe_pdf_toc_item(
                 decision_list=decision_list,
                 toc_item=toc_item,
                 records=records,
-                source_records=source_records,
+                records_toc_index=records_toc_index,
+                source_records_toc_index=source_records_toc_index,
             )
 
         return decision_list
@@ -2,12 +2,19 @@
 """Default deduplication module for CoLRev"""
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import pickle
 import shutil
 from dataclasses import dataclass
+from importlib.metadata import version
 from pathlib import Path
 
+import bib_dedupe.block
 import bib_dedupe.cluster
 import bib_dedupe.maybe_cases
+import bib_dedupe.prep
 import pandas as pd
 import zope.interface
 from bib_dedupe.bib_dedupe import block
@@ -16,6 +23,7 @@ from bib_dedupe.bib_dedupe import import_maybe
 from bib_dedupe.bib_dedupe import match
 from dataclasses_jsonschema import JsonSchemaMixin
 
+import colrev
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
@@ -25,6 +33,20 @@ from colrev.constants import RecordState
 
 # pylint: disable=too-few-public-methods
 
+SEARCH_SET = "search_set"
+OLD_SEARCH = "old_search"
+FINGERPRINT = "fingerprint"
+# Fields used by bib_dedupe.prep (changes require the records to be prepared again)
+PREP_FIELDS = [
+    field
+    for field in bib_dedupe.prep.REQUIRED_FIELDS + bib_dedupe.prep.OPTIONAL_FIELDS
+    if field != SEARCH_SET
+]
+BLOCK_KEYS = [
+    (f"block_key_{i}", sorted(block_fields))
+    for i, block_fields in enumerate(bib_dedupe.block.block_fields_list)
+]
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.DedupeInterface)
 @dataclass
@@ -57,6 +79,105 @@ class Dedupe(JsonSchemaMixin):
             return
         shutil.move(str(maybe_file), str(target_path))
 
+    def _get_blocking_index_key(self) -> tuple:
+        return (colrev.__version__, version("bib-dedupe"))
+
+    def _load_blocking_index(self) -> pd.DataFrame:
+        """Load the prepared md_processed records (with their blocking keys)"""
+        try:
+            with open(self.review_manager.paths.dedupe_index, "rb") as file:
+                if pickle.load(file) != self._get_blocking_index_key():
+                    return pd.DataFrame()
+                return pickle.load(file)
+        except FileNotFoundError:
+            return pd.DataFrame()
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return pd.DataFrame()  # e.g., if the index is corrupted
+
+    def _save_blocking_index(self, index_df: pd.DataFrame) -> None:
+        index_file = self.review_manager.paths.dedupe_index
+        tmp_file = index_file.with_name(f"{index_file.name}.tmp")
+        try:
+            index_file.parent.mkdir(exist_ok=True, parents=True)
+            with open(tmp_file, "wb") as file:
+                pickle.dump(self._get_blocking_index_key(), file)
+                pickle.dump(index_df, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, index_file)
+        except OSError:  # pragma: no cover
+            pass  # the index is optional
+
+    def _get_fingerprint(self, record_dict: dict) -> str:
+        values = [str(record_dict.get(field, "")) for field in PREP_FIELDS]
+        return hashlib.sha1(json.dumps(values).encode("utf-8")).hexdigest()
+
+    def _add_blocking_keys(self, prepared_df: pd.DataFrame) -> pd.DataFrame:
+        """Add the blocking keys (empty if a field of the block is empty)"""
+        blocking_keys = {}
+        for column, block_fields in BLOCK_KEYS:
+            keys = prepared_df[block_fields[0]]
+            for field in block_fields[1:]:
+                keys = keys + "\x1f" + prepared_df[field]
+            keys[prepared_df[block_fields].eq("").any(axis=1)] = ""
+            blocking_keys[column] = keys
+        return prepared_df.assign(**blocking_keys)
+
+    def _get_prepared_records(
+        self, *, records: dict, records_df: pd.DataFrame, verbosity_level: int
+    ) -> pd.DataFrame:
+        """Prepare the records that are not (or no longer) in the blocking index"""
+
+        index_df = self._load_blocking_index()
+        fingerprints = pd.Series(
+            [self._get_fingerprint(records[ID]) for ID in records_df.index],
+            index=records_df.index,
+            dtype=str,
+        )
+        cached = pd.Series(False, index=records_df.index)
+        if not index_df.empty:
+            cached = (records_df[SEARCH_SET] == OLD_SEARCH) & (
+                fingerprints == index_df[FINGERPRINT].reindex(records_df.index)
+            )
+
+        prepared_df = pd.DataFrame()
+        if not cached.all():
+            prepared_df = self.dedupe_operation.get_records_for_dedupe(
+                records_df=records_df[~cached], verbosity_level=verbosity_level
+            )
+        if 0 != prepared_df.shape[0]:
+            prepared_df = self._add_blocking_keys(prepared_df)
+            prepared_df[FINGERPRINT] = fingerprints.reindex(prepared_df.index)
+
+        prepared_df = pd.concat([index_df.reindex(cached[cached].index), prepared_df])
+        # Note : the order of records affects the pairs created by bib_dedupe.block
+        return prepared_df.reindex(records_df.index.intersection(prepared_df.index))
+
+    def _get_blocking_candidates(
+        self, *, index_df: pd.DataFrame, new_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Get the indexed records sharing a blocking key with the new records"""
+        selected = pd.Series(False, index=index_df.index)
+        for column, _ in BLOCK_KEYS:
+            selected |= index_df[column].isin(set(new_df[column]) - {""})
+        return index_df[selected]
+
+    def _update_blocking_index(self, *, prepared_df: pd.DataFrame) -> None:
+        """Update the blocking index (after merges)"""
+        records = self.review_manager.dataset.load_records_dict()
+        post_md_processed_states = RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
+        indexed_ids = [
+            ID
+            for ID, record_dict in records.items()
+            if record_dict[Fields.STATUS] in post_md_processed_states
+            and ID in prepared_df.index
+            # Note : records changed by merges are prepared again in the next run
+            and prepared_df.at[ID, FINGERPRINT] == self._get_fingerprint(record_dict)
+        ]
+        index_df = prepared_df.loc[indexed_ids]
+        index_df = index_df.assign(**{SEARCH_SET: OLD_SEARCH})
+        self._save_blocking_index(index_df)
+
     def run_dedupe(self) -> None:
         """Run default dedupe"""
 
@@ -79,21 +200,34 @@ class Dedupe(JsonSchemaMixin):
             records_df[Fields.STATUS].isin(
                 RecordState.get_post_x_states(state=RecordState.md_processed)
             ),
-            "search_set",
-        ] = "old_search"
+            SEARCH_SET,
+        ] = OLD_SEARCH
 
-        records_df = self.dedupe_operation.get_records_for_dedupe(
-            records_df=records_df, verbosity_level=verbosity_level
+        # Only new records are blocked (and matched) against the md_processed records
+        # (pairs of md_processed records are not considered by bib_dedupe)
+        prepared_df = self._get_prepared_records(
+            records=records, records_df=records_df, verbosity_level=verbosity_level
         )
+        if 0 == prepared_df.shape[0]:
+            return
 
-        if 0 == records_df.shape[0]:
+        index_df = prepared_df[prepared_df[SEARCH_SET] == OLD_SEARCH]
+        new_df = prepared_df[prepared_df[SEARCH_SET] != OLD_SEARCH]
+        if 0 == new_df.shape[0]:
+            self._save_blocking_index(index_df)
             return
 
+        candidates_df = self._get_blocking_candidates(index_df=index_df, new_df=new_df)
+        records_df = prepared_df[
+            prepared_df.index.isin(new_df.index.union(candidates_df.index))
+        ].drop(columns=[FINGERPRINT] + [column for column, _ in BLOCK_KEYS])
+
         deduplication_pairs = block(records_df, verbosity_level=verbosity_level)
         matched_df = match(deduplication_pairs, verbosity_level=verbosity_level)
         matched_df = import_maybe(matched_df)
 
         if self.dedupe_operation.debug:
+            self._save_blocking_index(index_df)
             return
 
         duplicate_id_sets = bib_dedupe.cluster.get_connected_components(matched_df)
@@ -108,3 +242,5 @@ class Dedupe(JsonSchemaMixin):
 
         export_maybe(records_df, matched_df=matched_df)
         self._move_maybe_file()
+
+        self._update_blocking_index(prepared_df=prepared_df)
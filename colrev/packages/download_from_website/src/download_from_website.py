@@ -16,6 +16,7 @@ import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
 import colrev.record.record
 from colrev.constants import Fields
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=duplicate-code
 # pylint: disable=too-few-public-methods
@@ -53,7 +54,9 @@ class WebsiteDownload(JsonSchemaMixin):
         self, *, record: colrev.record.record.Record, pdf_filepath: Path
     ) -> None:
         article_url = record.data[Fields.URL]
-        response = requests.get(article_url, headers=self.headers, timeout=60)
+        response = session_manager.get_session().get(
+            article_url, headers=self.headers, timeout=60
+        )
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, "html.parser")
@@ -65,7 +68,9 @@ class WebsiteDownload(JsonSchemaMixin):
 
                 paper_title_tag = soup.find("meta", {"name": "citation_title"})
                 if paper_title_tag:
-                    pdf_response = requests.get(pdf_url, timeout=60)
+                    pdf_response = session_manager.get_session().get(
+                        pdf_url, timeout=60
+                    )
 
                     if pdf_response.status_code == 200:
                         with open(pdf_filepath, "wb") as pdf_file:
@@ -92,7 +97,9 @@ class WebsiteDownload(JsonSchemaMixin):
         self, *, record: colrev.record.record.Record, pdf_filepath: Path
     ) -> None:
         url = record.data[Fields.URL]
-        response = requests.get(url, headers=self.headers, timeout=60)
+        response = session_manager.get_session().get(
+            url, headers=self.headers, timeout=60
+        )
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, "html.parser")
@@ -106,7 +113,9 @@ class WebsiteDownload(JsonSchemaMixin):
                     if not pdf_url.startswith(("http:", "https:")):
                         pdf_url = urljoin(url, pdf_url)
 
-                    pdf_response = requests.get(pdf_url, timeout=60)
+                    pdf_response = session_manager.get_session().get(
+                        pdf_url, timeout=60
+                    )
 
                     if pdf_response.status_code == 200:
                         with open(pdf_filepath, "wb") as pdf_file:
@@ -132,7 +141,9 @@ class WebsiteDownload(JsonSchemaMixin):
         self, *, record: colrev.record.record.Record, pdf_filepath: Path
     ) -> None:
         url = record.data[Fields.URL]
-        response = requests.get(url, headers=self.headers, timeout=60)
+        response = session_manager.get_session().get(
+            url, headers=self.headers, timeout=60
+        )
 
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, "html.parser")
@@ -150,7 +161,9 @@ class WebsiteDownload(JsonSchemaMixin):
                     if not pdf_url.startswith(("http:", "https:")):
                         pdf_url = urljoin(url, pdf_url)
 
-                    pdf_response = requests.get(pdf_url, timeout=60)
+                    pdf_response = session_manager.get_session().get(
+                        pdf_url, timeout=60
+                    )
 
                     if pdf_response.status_code == 200:
                         with open(pdf_filepath, "wb") as pdf_file:
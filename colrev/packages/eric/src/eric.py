@@ -7,7 +7,6 @@ import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
 
-import requests
 import zope.interface
 from dacite import from_dict
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -21,6 +20,7 @@ from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -186,7 +186,7 @@ class ERICSearchSource(JsonSchemaMixin):
         """Get the records from a query"""
         full_url = self._build_search_url()
 
-        response = requests.get(full_url, timeout=90)
+        response = session_manager.get_session().get(full_url, timeout=90)
         if response.status_code != 200:
             return
         with open("test.json", "wb") as file:
@@ -59,6 +59,7 @@ class ExcludeLanguagesPrep(JsonSchemaMixin):
             lang_code_list=languages_to_include
         )
         self.languages_to_include = list(set(languages_to_include))
+        self._title_languages: dict = {}
 
     def _title_has_multiple_languages(self, *, title: str) -> bool:
         if "[" not in title:
@@ -71,6 +72,31 @@ class ExcludeLanguagesPrep(JsonSchemaMixin):
             return True
         return False
 
+    def _requires_language_detection(
+        self, record: colrev.record.record_prep.PrepRecord
+    ) -> bool:
+        title = record.data.get(Fields.TITLE, FieldValues.UNKNOWN)
+        return (
+            title != FieldValues.UNKNOWN
+            and record.data.get(Fields.LANGUAGE, "") not in self.languages_to_include
+            and len(title) >= 30
+            and not self._title_has_multiple_languages(title=title)
+        )
+
+    def precompute_batch(self, records: list) -> None:
+        """Compute the languages of the titles (of a prep batch) in parallel"""
+
+        titles = list(
+            {
+                record.data[Fields.TITLE]
+                for record in records
+                if self._requires_language_detection(record)
+            }
+        )
+        self._title_languages = dict(
+            zip(titles, self.language_service.compute_languages(titles))
+        )
+
     def prepare(
         self, record: colrev.record.record_prep.PrepRecord
     ) -> colrev.record.record.Record:
@@ -99,9 +125,11 @@ class ExcludeLanguagesPrep(JsonSchemaMixin):
         if not self._title_has_multiple_languages(
             title=record.data.get(Fields.TITLE, "")
         ):
-            language = self.language_service.compute_language(
-                text=record.data[Fields.TITLE]
-            )
+            title = record.data[Fields.TITLE]
+            if title in self._title_languages:
+                language = self._title_languages[title]
+            else:
+                language = self.language_service.compute_language(text=title)
             # Note: classification of non-english titles is not reliable.
             # Other languages should be checked in man-prep.
             record.update_field(
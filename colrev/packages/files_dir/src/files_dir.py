@@ -22,6 +22,7 @@ import colrev.packages.crossref.src.crossref_search_source
 import colrev.packages.pdf_backward_search.src.pdf_backward_search as bws
 import colrev.record.qm.checkers.missing_field
 import colrev.record.record
+import colrev.record.record_identifier
 import colrev.record.record_pdf
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -61,6 +62,8 @@ class FilesSearchSource(JsonSchemaMixin):
     ) -> None:
         self.review_manager = source_operation.review_manager
         self.source_operation = source_operation
+        # colrev_pdf_ids of the current batch (computed in parallel)
+        self._colrev_pdf_ids: dict = {}
 
         self.search_source = from_dict(data_class=self.settings_class, data=settings)
 
@@ -274,9 +277,8 @@ class FilesSearchSource(JsonSchemaMixin):
 
         pdf_path = self.review_manager.path / Path(record_dict[Fields.FILE])
         try:
-            tei = self.review_manager.get_tei(
-                pdf_path=pdf_path,
-            )
+            # Note : only the metadata is needed (header-only mode)
+            tei = self.review_manager.get_tei(pdf_path=pdf_path, header_only=True)
         except (FileNotFoundError, requests.exceptions.ReadTimeout):
             return record_dict
 
@@ -350,11 +352,14 @@ class FilesSearchSource(JsonSchemaMixin):
     def _is_broken_filepath(
         self,
         file_path: Path,
+        *,
+        silent_mode: bool = False,
     ) -> bool:
         if ";" in str(file_path):
-            self.review_manager.logger.error(
-                f'skipping PDF with ";" in filepath: \n{file_path}'
-            )
+            if not silent_mode:
+                self.review_manager.logger.error(
+                    f'skipping PDF with ";" in filepath: \n{file_path}'
+                )
             return True
 
         if (
@@ -363,9 +368,10 @@ class FilesSearchSource(JsonSchemaMixin):
             or "_with_lp.pdf" == str(file_path)[-10:]
             or "_backup.pdf" == str(file_path)[-11:]
         ):
-            self.review_manager.logger.info(
-                f"Skipping PDF with _ocr.pdf/_with_cp.pdf: {file_path}"
-            )
+            if not silent_mode:
+                self.review_manager.logger.info(
+                    f"Skipping PDF with _ocr.pdf/_with_cp.pdf: {file_path}"
+                )
             return True
 
         return False
@@ -473,28 +479,21 @@ class FilesSearchSource(JsonSchemaMixin):
         if self._is_broken_filepath(file_path=file_path):
             return new_record
 
-        if not self.review_manager.force_mode:
-            # note: for curations, we want all pdfs indexed/merged separately,
-            # in other projects, it is generally sufficient if the pdf is linked
-            if not self.review_manager.settings.is_curated_masterdata_repo():
-                if file_path in linked_file_paths:
-                    # Otherwise: skip linked PDFs
-                    return new_record
-
-            if file_path in [
-                Path(r[Fields.FILE])
-                for r in files_dir_feed.feed_records.values()
-                if Fields.FILE in r
-            ]:
-                return new_record
-        # otherwise: reindex all
+        if self._is_indexed(
+            file_path=file_path,
+            files_dir_feed=files_dir_feed,
+            linked_file_paths=linked_file_paths,
+        ):
+            return new_record
 
         self.review_manager.logger.info(f" extract metadata from {file_path}")
         try:
             if not self.review_manager.settings.is_curated_masterdata_repo():
                 # retrieve_based_on_colrev_pdf_id
 
-                colrev_pdf_id = colrev.record.record.Record.get_colrev_pdf_id(
+                colrev_pdf_id = self._colrev_pdf_ids.get(
+                    file_path
+                ) or colrev.record.record.Record.get_colrev_pdf_id(
                     pdf_path=Path(file_path)
                 )
                 new_record_object = local_index.retrieve_based_on_colrev_pdf_id(
@@ -534,6 +533,56 @@ class FilesSearchSource(JsonSchemaMixin):
 
         return new_record
 
+    def _is_indexed(
+        self,
+        *,
+        file_path: Path,
+        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
+        linked_file_paths: list,
+    ) -> bool:
+        if self.review_manager.force_mode:
+            # reindex all
+            return False
+
+        # note: for curations, we want all pdfs indexed/merged separately,
+        # in other projects, it is generally sufficient if the pdf is linked
+        if not self.review_manager.settings.is_curated_masterdata_repo():
+            if file_path in linked_file_paths:
+                # Otherwise: skip linked PDFs
+                return True
+
+        return file_path in [
+            Path(r[Fields.FILE])
+            for r in files_dir_feed.feed_records.values()
+            if Fields.FILE in r
+        ]
+
+    def _set_colrev_pdf_ids(
+        self,
+        *,
+        file_batch: list,
+        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
+        linked_file_paths: list,
+    ) -> None:
+        # Compute the colrev_pdf_ids of the batch in parallel (and cache them)
+        self._colrev_pdf_ids = {}
+        if self.review_manager.settings.is_curated_masterdata_repo():
+            return
+        pdfs_to_index = [
+            file_path
+            for file_path in file_batch
+            if file_path.suffix == ".pdf"
+            and not self._is_broken_filepath(file_path=file_path, silent_mode=True)
+            and not self._is_indexed(
+                file_path=file_path,
+                files_dir_feed=files_dir_feed,
+                linked_file_paths=linked_file_paths,
+            )
+        ]
+        self._colrev_pdf_ids = colrev.record.record_identifier.get_colrev_pdf_ids(
+            pdfs_to_index, cache_path=self.review_manager.paths.pdf_ids_cache
+        )
+
     def _index_mp4(
         self,
         *,
@@ -579,6 +628,11 @@ class FilesSearchSource(JsonSchemaMixin):
             for record in files_dir_feed.feed_records.values():
                 record = self._add_md_string(record_dict=record)
 
+            self._set_colrev_pdf_ids(
+                file_batch=file_batch,
+                files_dir_feed=files_dir_feed,
+                linked_file_paths=linked_file_paths,
+            )
             for file_path in file_batch:
                 new_record = self._index_file(
                     file_path=file_path,
@@ -42,6 +42,14 @@ class LocalIndexPrep(JsonSchemaMixin):
         )
         self.prep_operation = prep_operation
 
+    def precompute_batch(self, records: list) -> None:
+        """Retrieve the records of a prep batch (based on their dois) in one query"""
+
+        self.local_index_source.local_index.prefetch(
+            key=Fields.DOI,
+            values=[record.data.get(Fields.DOI, "") for record in records],
+        )
+
     def prepare(
         self, record: colrev.record.record_prep.PrepRecord
     ) -> colrev.record.record.Record:
@@ -7,7 +7,6 @@ import typing
 from dataclasses import dataclass
 from pathlib import Path
 
-import requests
 import zope.interface
 from dacite import from_dict
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -22,6 +21,7 @@ from colrev.constants import Fields
 from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -118,7 +118,7 @@ class OpenCitationsSearchSource(JsonSchemaMixin):
         # headers = {"authorization": "YOUR-OPENCITATIONS-ACCESS-TOKEN"}
         headers: typing.Dict[str, str] = {}
 
-        ret = requests.get(url, headers=headers, timeout=300)
+        ret = session_manager.get_session().get(url, headers=headers, timeout=300)
         try:
             items = json.loads(ret.text)
 
@@ -21,6 +21,7 @@ import colrev.record.record_prep
 from colrev.constants import Fields
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 
 # Note: not (yet) implemented as a full search_source
 # (including SearchSourceInterface, packages_endpoints.json)
@@ -101,7 +102,7 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
         }
         try:
             url = f"https://openlibrary.org/isbn/{test_rec['isbn']}.json"
-            ret = requests.get(
+            ret = session_manager.get_session().get(
                 url,
                 headers=self.requests_headers,
                 timeout=30,
@@ -3,9 +3,8 @@
 import json
 import typing
 
-import requests
-
 from colrev.constants import Fields
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=colrev-missed-constant-usage
 
@@ -52,7 +51,9 @@ class OSFApiQuery:
         string url  Full URL to pass to API
         return string: Results from API"""
 
-        response = requests.get(url, headers=self.headers, timeout=60)
+        response = session_manager.get_session().get(
+            url, headers=self.headers, timeout=60
+        )
         return response.text
 
     def retrieve_records(self) -> typing.List[dict]:
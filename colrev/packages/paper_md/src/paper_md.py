@@ -13,7 +13,6 @@ from pathlib import Path
 from threading import Timer
 
 import docker
-import requests
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 from docker.errors import DockerException
@@ -28,6 +27,7 @@ import colrev.package_manager.package_settings
 import colrev.record.record
 from colrev.constants import Colors
 from colrev.constants import Fields
+from colrev.env.session_manager import session_manager
 from colrev.writer.write_utils import write_file
 
 
@@ -174,7 +174,9 @@ class PaperMarkdown(JsonSchemaMixin):
                     csl_link = csl_match.group(1)
 
         if "http" in csl_link:
-            ret = requests.get(csl_link, allow_redirects=True, timeout=30)
+            ret = session_manager.get_session().get(
+                csl_link, allow_redirects=True, timeout=30
+            )
             csl_filename = self.review_manager.paths.DATA_DIR / Path(csl_link).name
             with open(csl_filename, "wb") as file:
                 file.write(ret.content)
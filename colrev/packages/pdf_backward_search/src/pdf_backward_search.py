@@ -9,7 +9,6 @@ from pathlib import Path
 
 import inquirer
 import pandas as pd
-import requests
 import zope.interface
 from bib_dedupe.bib_dedupe import block
 from bib_dedupe.bib_dedupe import cluster
@@ -33,6 +32,7 @@ from colrev.constants import Fields
 from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -149,7 +149,7 @@ class BackwardSearchSource(JsonSchemaMixin):
         url = f"{self._api_url}{record_dict['doi']}"
         # headers = {"authorization": "YOUR-OPENCITATIONS-ACCESS-TOKEN"}
         headers: typing.Dict[str, str] = {}
-        ret = requests.get(url, headers=headers, timeout=300)
+        ret = session_manager.get_session().get(url, headers=headers, timeout=300)
         try:
             items = json.loads(ret.text)
 
@@ -472,6 +472,17 @@ class BackwardSearchSource(JsonSchemaMixin):
 
         all_references = {}
 
+        # Note : the TEIs are generated concurrently (and loaded from the files below)
+        tei_paths = {}
+        for record in selected_records.values():
+            if Fields.FILE not in record:
+                continue
+            tei_filename = colrev.record.record.Record(record).get_tei_filename()
+            tei_paths[review_manager.path / Path(record[Fields.FILE])] = (
+                review_manager.path / tei_filename
+            )
+        review_manager.get_tei_generator().generate(tei_paths)
+
         for record in tqdm(selected_records.values()):
             try:
 
@@ -20,6 +20,7 @@ from lxml import etree
 from lxml import html
 from lxml.etree import XMLSyntaxError
 
+import colrev.env.session_manager
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
@@ -56,6 +57,9 @@ class PubMedSearchSource(JsonSchemaMixin):
     short_name = "PubMed"
     db_url = "https://pubmed.ncbi.nlm.nih.gov/"
     _pubmed_md_filename = Path("data/search/md_pubmed.bib")
+    _eutils_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+    # Note : E-utilities accept several hundred ids per efetch request
+    _efetch_batch_size = 200
 
     def __init__(
         self,
@@ -328,6 +332,18 @@ class PubMedSearchSource(JsonSchemaMixin):
 
         return retrieved_record_dict
 
+    @classmethod
+    def _pubmed_xml_to_records(cls, *, root) -> typing.List[dict]:  # type: ignore
+        records = []
+        for pubmed_article in root.findall("PubmedArticle"):
+            # Note : _pubmed_xml_to_record parses a PubmedArticleSet with one article
+            article_set = etree.Element("PubmedArticleSet")
+            article_set.append(pubmed_article)
+            record_dict = cls._pubmed_xml_to_record(root=article_set)
+            if record_dict:
+                records.append(record_dict)
+        return records
+
     def _get_pubmed_ids(self, query: str, retstart: int, page: int) -> typing.List[str]:
         headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
         session = self.review_manager.get_cached_session()
@@ -347,39 +363,18 @@ class PubMedSearchSource(JsonSchemaMixin):
         displayed_uids = [tag.get("content") for tag in meta_tags][0].split(",")
         return displayed_uids
 
-    def _pubmed_query_id(
+    def _efetch(
         self,
         *,
-        pubmed_id: str,
-        timeout: int = 60,
-    ) -> dict:
-        """Retrieve records from Pubmed based on a query"""
-
+        url: str,
+        session: requests.Session,
+        timeout: int,
+    ) -> typing.List[dict]:
+        headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
         try:
-            database = "pubmed"
-            url = (
-                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?"
-                + f"db={database}&id={pubmed_id}&rettype=xml&retmode=text"
-            )
-
-            headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
-            session = self.review_manager.get_cached_session()
-
-            # review_manager.logger.debug(url)
             ret = session.request("GET", url, headers=headers, timeout=timeout)
             ret.raise_for_status()
-            if ret.status_code != 200:
-                # review_manager.logger.debug(
-                #     f"crossref_query failed with status {ret.status_code}"
-                # )
-                return {"pubmed_id": pubmed_id}
-
             root = etree.fromstring(str.encode(ret.text))
-            retrieved_record = self._pubmed_xml_to_record(root=root)
-            if not retrieved_record:
-                return {"pubmed_id": pubmed_id}
-        except requests.exceptions.RequestException:
-            return {"pubmed_id": pubmed_id}
         except XMLSyntaxError as exc:
             raise colrev_exceptions.RecordNotParsableException(
                 "Error parsing xml"
@@ -390,7 +385,50 @@ class PubMedSearchSource(JsonSchemaMixin):
                 "sqlite, required for requests CachedSession "
                 "(possibly caused by concurrent operations)"
             ) from exc
-        return retrieved_record
+        return self._pubmed_xml_to_records(root=root)
+
+    def _pubmed_query_ids(
+        self,
+        *,
+        pubmed_ids: typing.List[str],
+        timeout: int = 60,
+    ) -> typing.List[dict]:
+        """Retrieve records from Pubmed based on a list of ids (one efetch request)
+
+        The records are returned in the order of the pubmed_ids
+        ({"pubmed_id": ...} if a record could not be retrieved).
+        """
+
+        url = (
+            f"{self._eutils_url}efetch.fcgi?"
+            + f"db=pubmed&id={','.join(pubmed_ids)}&rettype=xml&retmode=text"
+        )
+        try:
+            retrieved_records = {
+                r["pubmedid"]: r
+                for r in self._efetch(
+                    url=url,
+                    session=self.review_manager.get_cached_session(),
+                    timeout=timeout,
+                )
+                if "pubmedid" in r
+            }
+        except requests.exceptions.RequestException:
+            retrieved_records = {}
+        return [
+            retrieved_records.get(pubmed_id.upper(), {"pubmed_id": pubmed_id})
+            for pubmed_id in pubmed_ids
+        ]
+
+    def _pubmed_query_id(
+        self,
+        *,
+        pubmed_id: str,
+        timeout: int = 60,
+    ) -> dict:
+        """Retrieve records from Pubmed based on a query"""
+
+        return self._pubmed_query_ids(pubmed_ids=[pubmed_id], timeout=timeout)[0]
 
     def _get_masterdata_record(
         self,
@@ -511,9 +549,44 @@ class PubMedSearchSource(JsonSchemaMixin):
 
         return record
 
+    def _get_pubmed_query_return_from_history(
+        self, *, query: str
+    ) -> typing.Iterator[dict]:
+        # Note : the ESearch results are stored on the history server (WebEnv)
+        # and retrieved in batches (efetch). Responses are not cached
+        # because the WebEnv expires.
+        headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
+        session = colrev.env.session_manager.session_manager.get_session()
+        query = query.replace("https://pubmed.ncbi.nlm.nih.gov/?term=", "")
+        url = f"{self._eutils_url}esearch.fcgi?db=pubmed&term={query}&usehistory=y"
+        ret = session.request("GET", url, headers=headers, timeout=30)
+        ret.raise_for_status()
+        try:
+            root = etree.fromstring(str.encode(ret.text))
+        except XMLSyntaxError as exc:
+            raise colrev_exceptions.RecordNotParsableException(
+                "Error parsing xml"
+            ) from exc
+        count = int(root.findtext("Count", default="0"))
+        query_key = root.findtext("QueryKey")
+        web_env = root.findtext("WebEnv")
+
+        for retstart in range(0, count, self._efetch_batch_size):
+            url = (
+                f"{self._eutils_url}efetch.fcgi?db=pubmed"
+                f"&query_key={query_key}&WebEnv={web_env}"
+                f"&retstart={retstart}&retmax={self._efetch_batch_size}"
+                "&rettype=xml&retmode=text"
+            )
+            yield from self._efetch(url=url, session=session, timeout=60)
+
     def _get_pubmed_query_return(self) -> typing.Iterator[dict]:
         params = self.search_source.search_parameters
 
+        if params.get("use_history", False):
+            yield from self._get_pubmed_query_return_from_history(query=params["query"])
+            return
+
         retstart = 10
         page = 1
         while True:
@@ -522,8 +595,7 @@ class PubMedSearchSource(JsonSchemaMixin):
             )
             if not pubmed_ids:
                 break
-            for pubmed_id in pubmed_ids:
-                yield self._pubmed_query_id(pubmed_id=pubmed_id)
+            yield from self._pubmed_query_ids(pubmed_ids=pubmed_ids)
 
             page += 1
 
@@ -584,23 +656,27 @@ class PubMedSearchSource(JsonSchemaMixin):
         pubmed_feed: colrev.ops.search_api_feed.SearchAPIFeed,
     ) -> None:
 
-        for feed_record_dict in pubmed_feed.feed_records.values():
-            feed_record = colrev.record.record.Record(feed_record_dict)
-
-            try:
-                retrieved_record_dict = self._pubmed_query_id(
-                    pubmed_id=feed_record_dict["pubmedid"]
-                )
-
-                if retrieved_record_dict["pubmedid"] != feed_record.data["pubmedid"]:
-                    continue
-                retrieved_record = colrev.record.record.Record(retrieved_record_dict)
-                pubmed_feed.add_update_record(retrieved_record)
-            except (
-                colrev_exceptions.RecordNotFoundInPrepSourceException,
-                colrev_exceptions.NotFeedIdentifiableException,
+        pubmed_ids = [
+            feed_record_dict["pubmedid"]
+            for feed_record_dict in pubmed_feed.feed_records.values()
+        ]
+        for i in range(0, len(pubmed_ids), self._efetch_batch_size):
+            batch = pubmed_ids[i : i + self._efetch_batch_size]
+            for pubmed_id, retrieved_record_dict in zip(
+                batch, self._pubmed_query_ids(pubmed_ids=batch)
             ):
-                continue
+                if retrieved_record_dict.get("pubmedid") != pubmed_id:
+                    continue
+                try:
+                    retrieved_record = colrev.record.record.Record(
+                        retrieved_record_dict
+                    )
+                    pubmed_feed.add_update_record(retrieved_record)
+                except (
+                    colrev_exceptions.RecordNotFoundInPrepSourceException,
+                    colrev_exceptions.NotFeedIdentifiableException,
+                ):
+                    continue
 
         pubmed_feed.save()
 
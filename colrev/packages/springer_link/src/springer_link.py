@@ -10,7 +10,6 @@ from pathlib import Path
 
 import inquirer
 import pandas as pd
-import requests
 import zope.interface
 from dacite import from_dict
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -26,6 +25,7 @@ from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.env.session_manager import session_manager
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -288,7 +288,7 @@ class SpringerLinkSearchSource(JsonSchemaMixin):
             full_url = self._build_api_search_url(
                 query=query, api_key=api_key, start=start
             )
-            response = requests.get(full_url, timeout=10)
+            response = session_manager.get_session().get(full_url, timeout=10)
             if response.status_code != 200:
                 print(
                     f"Error - API search failed for the following reason: {response.status_code}"
@@ -485,7 +485,7 @@ class SpringerLinkSearchSource(JsonSchemaMixin):
         full_url = self._build_api_search_url(
             query="doi:10.1007/978-3-319-07410-8_4", api_key=answer
         )
-        response = requests.get(full_url, timeout=10)
+        response = session_manager.get_session().get(full_url, timeout=10)
         if response.status_code != 200:
             raise inquirer.errors.ValidationError("", reason="Error: Invalid API key.")
         print(
@@ -5,13 +5,12 @@ from __future__ import annotations
 import re
 import typing
 
-import requests
-
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.env.environment_manager import EnvironmentManager
+from colrev.env.session_manager import session_manager
 from colrev.packages.unpaywall.src import utils
 
 
@@ -131,7 +130,7 @@ class UnpaywallAPI:
 
         while True:
             page_dependend_url = self._build_search_url(page)
-            response = requests.get(page_dependend_url, timeout=90)
+            response = session_manager.get_session().get(page_dependend_url, timeout=90)
             if response.status_code != 200:
                 print(f"Error fetching data: {response.status_code}")
                 return
@@ -17,6 +17,7 @@ import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
 import colrev.record.record
 from colrev.constants import Fields
+from colrev.env.session_manager import session_manager
 from colrev.packages.unpaywall.src import utils
 
 # pylint: disable=duplicate-code
@@ -51,16 +52,15 @@ class Unpaywall(JsonSchemaMixin):
         self,
         *,
         doi: str,
-        retry: int = 0,
         pdfonly: bool = True,
     ) -> str:
         url = f"https://api.unpaywall.org/v2/{doi}"
 
         try:
-            ret = requests.get(url, params={"email": self.email}, timeout=30)
-            if ret.status_code == 500 and retry < 3:
-                return self._unpaywall(doi=doi, retry=retry + 1)
-
+            # Note : the shared session retries failed requests (e.g., status 500)
+            ret = session_manager.get_session().get(
+                url, params={"email": self.email}, timeout=30
+            )
             if ret.status_code in [404, 500]:
                 return "NA"
 
@@ -103,7 +103,7 @@ class Unpaywall(JsonSchemaMixin):
             return record
 
         try:
-            res = requests.get(
+            res = session_manager.get_session().get(
                 url,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
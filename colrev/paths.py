@@ -26,6 +26,11 @@ class PathManager:
     REPORT_FILE = Path(".report.log")
     GIT_IGNORE_FILE = Path(".gitignore")
     PRE_COMMIT_CONFIG = Path(".pre-commit-config.yaml")
+    RECORDS_CACHE_FILE = Path(".colrev/records_cache.pickle")
+    PDF_IDS_CACHE_FILE = Path(".colrev/colrev_pdf_ids.json")
+    DEDUPE_INDEX_FILE = Path(".colrev/dedupe/blocking_index.pickle")
+    HISTORY_CACHE_FILE = Path(".colrev/history_cache.db")
+    NR_RECORDS_CACHE_FILE = Path(".colrev/nr_records_cache.json")
 
     # Ensure the path uses forward slashes, which is compatible with Git's path handling
     RECORDS_FILE_GIT = str(RECORDS_FILE).replace("\\", "/")
@@ -49,3 +54,8 @@ class PathManager:
         self.report = base_path / self.REPORT_FILE
         self.git_ignore = base_path / self.GIT_IGNORE_FILE
         self.pre_commit_config = base_path / self.PRE_COMMIT_CONFIG
+        self.records_cache = base_path / self.RECORDS_CACHE_FILE
+        self.pdf_ids_cache = base_path / self.PDF_IDS_CACHE_FILE
+        self.dedupe_index = base_path / self.DEDUPE_INDEX_FILE
+        self.history_cache = base_path / self.HISTORY_CACHE_FILE
+        self.nr_records_cache = base_path / self.NR_RECORDS_CACHE_FILE
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import typing
+from collections import Counter
 from dataclasses import dataclass
 
 import colrev.process.operation
@@ -55,8 +56,8 @@ class StatusStats:
 
         self.status_list = [x[Fields.STATUS] for x in self.records.values()]
         self.screening_statistics = self._get_screening_statistics()
-        self.md_duplicates_removed = self._get_duplicates_removed()
         self.nr_origins = self._get_nr_origins()
+        self.md_duplicates_removed = self._get_duplicates_removed()
         self.nr_incomplete = self._get_nr_incomplete()
 
         self.overall = StatusStatsOverall(status_stats=self)
@@ -118,20 +119,16 @@ class StatusStats:
         return nr_curated_records
 
     def _get_nr_origins(self) -> int:
-        origin_list = [x[Fields.ORIGIN] for x in self.records.values()]
         nr_origins = 0
-        for origin in origin_list:
-            nr_origins += len([o for o in origin if not o.startswith("md_")])
+        for record_dict in self.records.values():
+            nr_origins += sum(
+                not o.startswith("md_") for o in record_dict[Fields.ORIGIN]
+            )
         return nr_origins
 
     def _get_duplicates_removed(self) -> int:
-        md_duplicates_removed = 0
-        for record_dict in self.records.values():
-            md_duplicates_removed += (
-                len([o for o in record_dict[Fields.ORIGIN] if not o.startswith("md_")])
-                - 1
-            )
-        return md_duplicates_removed
+        # Each record (except for the first) merged into a record is a duplicate
+        return self.nr_origins - len(self.records)
 
     def _get_nr_incomplete(self) -> int:
         """Get the number of incomplete records"""
@@ -167,8 +164,8 @@ class StatusStats:
     def _get_completed_atomic_steps(self) -> int:
         """Get the number of completed atomic steps"""
         completed_steps = 0
-        for record_dict in self.records.values():
-            completed_steps += self.REQUIRED_ATOMIC_STEPS[record_dict[Fields.STATUS]]
+        for colrev_status, freq in Counter(self.status_list).items():
+            completed_steps += self.REQUIRED_ATOMIC_STEPS[colrev_status] * freq
         completed_steps += 4 * self.md_duplicates_removed
         completed_steps += self.currently.md_retrieved  # not in records
         return completed_steps
@@ -317,9 +314,11 @@ class StatusStatsParent:
         status_stats: StatusStats,
     ) -> None:
         self.status_stats = status_stats
+        # Note : the frequencies are counted once (instead of a pass per state)
+        self._status_counts = Counter(status_stats.status_list)
 
     def _get_freq(self, colrev_status: RecordState) -> int:
-        return len([x for x in self.status_stats.status_list if colrev_status == x])
+        return self._status_counts[colrev_status]
 
 
 @dataclass
@@ -376,17 +375,13 @@ class StatusStatsCurrently(StatusStatsParent):
         self.pdf_needs_manual_preparation = self._get_freq(
             RecordState.pdf_needs_manual_preparation
         )
-        self.non_completed = len(
-            [
-                r
-                for r in status_stats.records.values()
-                if r[Fields.STATUS]
-                not in [
-                    RecordState.rev_synthesized,
-                    RecordState.rev_prescreen_excluded,
-                    RecordState.pdf_not_available,
-                    RecordState.rev_excluded,
-                ]
+        self.non_completed = len(status_stats.records) - sum(
+            self._get_freq(colrev_status)
+            for colrev_status in [
+                RecordState.rev_synthesized,
+                RecordState.rev_prescreen_excluded,
+                RecordState.pdf_not_available,
+                RecordState.rev_excluded,
             ]
         )
 
@@ -425,18 +420,20 @@ class StatusStatsOverall(StatusStatsParent):
         self.pdf_not_available = self._get_freq(RecordState.pdf_not_available)
 
     def _get_cumulative_freq(self, colrev_status: RecordState) -> int:
-        return len(
-            [
-                x
-                for x in self.status_stats.status_list
-                if x in RecordState.get_post_x_states(state=colrev_status)
-            ]
+        return sum(
+            self._get_freq(post_x_state)
+            for post_x_state in RecordState.get_post_x_states(state=colrev_status)
         )
 
     def _get_md_retrieved(self, status_stats: StatusStats) -> int:
-        md_retrieved = 0
-        for source in status_stats.review_manager.settings.sources:
-            if not source.is_md_source():
-                nr_in_file = colrev.loader.load_utils.get_nr_records(source.filename)
-                md_retrieved += nr_in_file
-        return md_retrieved
+        # Note : the numbers of records are cached (until the files change)
+        nr_records = colrev.loader.load_utils.get_nr_records_in_files(
+            [
+                source.filename
+                for source in status_stats.review_manager.settings.sources
+                if not source.is_md_source()
+            ],
+            cache_path=status_stats.review_manager.paths.nr_records_cache,
+            logger=status_stats.review_manager.logger,
+        )
+        return sum(nr_records.values())
@@ -2,10 +2,11 @@
 """Functionality to identify records."""
 from __future__ import annotations
 
+import json
 import logging
+import multiprocessing as mp
 import os
 import re
-import tempfile
 import typing
 from pathlib import Path
 
@@ -192,26 +193,28 @@ def get_colrev_id(record: colrev.record.record.Record, *, assume_complete: bool)
     return srep
 
 
+def get_page_image(page: pymupdf.Page) -> Image.Image:
+    """Render a PDF page to an image (in memory)"""
+    # Note : pixmaps are rendered in RGB (without alpha) by default
+    pix = page.get_pixmap(dpi=200)
+    return Image.frombytes("RGB", (pix.w, pix.h), pix.samples)
+
+
 def _get_colrev_pdf_id_cpid2(pdf_path: Path) -> str:
-    with tempfile.NamedTemporaryFile(suffix=".png") as temp_file:
-        file_name = temp_file.name
-        try:
-            doc: pymupdf.Document = pymupdf.open(pdf_path)
+    try:
+        with pymupdf.open(pdf_path) as doc:
             page = next(iter(doc))  # get the first page
-            pix = page.get_pixmap(dpi=200)
-            pix.save(file_name)  # store image as a PNG
-            with Image.open(file_name) as img:
-                average_hash = imagehash.average_hash(img, hash_size=32)
-                average_hash_str = str(average_hash).replace("\n", "")
-                if len(average_hash_str) * "0" == average_hash_str:
-                    raise colrev_exceptions.PDFHashError(path=pdf_path)
-                return "cpid2:" + average_hash_str
-        except StopIteration as exc:  # pragma: no cover
-            raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
-        except pymupdf.FileDataError as exc:
-            raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
-        except RuntimeError as exc:
-            raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+            average_hash = imagehash.average_hash(get_page_image(page), hash_size=32)
+        average_hash_str = str(average_hash).replace("\n", "")
+        if len(average_hash_str) * "0" == average_hash_str:
+            raise colrev_exceptions.PDFHashError(path=pdf_path)
+        return "cpid2:" + average_hash_str
+    except StopIteration as exc:  # pragma: no cover
+        raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+    except pymupdf.FileDataError as exc:
+        raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
+    except RuntimeError as exc:
+        raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
 
 
 def get_colrev_pdf_id(pdf_path: Path, *, cpid_version: str = "cpid2") -> str:
@@ -228,6 +231,83 @@ def get_colrev_pdf_id(pdf_path: Path, *, cpid_version: str = "cpid2") -> str:
     raise NotImplementedError
 
 
+def _get_colrev_pdf_id_or_none(pdf_path: Path) -> typing.Optional[str]:
+    # Note : errors are not returned from the worker processes
+    # (get_colrev_pdf_id() raises them for the pdf_path)
+    try:
+        return get_colrev_pdf_id(pdf_path)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _load_pdf_id_cache(cache_path: typing.Optional[Path]) -> dict:
+    if cache_path is None or not cache_path.is_file():
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as file:
+            return json.load(file)
+    except (json.JSONDecodeError, OSError):  # pragma: no cover
+        return {}
+
+
+def _save_pdf_id_cache(cache_path: Path, cache: dict) -> None:
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True, parents=True)
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(cache, file)
+        os.replace(tmp_path, cache_path)
+    except OSError:  # pragma: no cover
+        pass  # the cache is optional
+
+
+def get_colrev_pdf_ids(
+    pdf_paths: typing.List[Path],
+    *,
+    cache_path: typing.Optional[Path] = None,
+    processes: typing.Optional[int] = None,
+) -> dict:
+    """Get the PDF hashes of multiple PDFs (in parallel processes)
+
+    Returns a dict of pdf_path: colrev_pdf_id. PDFs for which no hash
+    can be computed are omitted (get_colrev_pdf_id() raises the error).
+
+    cache_path: optional json file in which the colrev_pdf_ids are stored
+    (keyed by path, size and modification time)
+    """
+
+    cache = _load_pdf_id_cache(cache_path)
+    pdf_ids = {}
+    to_compute = []
+    for pdf_path in pdf_paths:
+        cache_key = str(Path(pdf_path).resolve())
+        try:
+            stat = os.stat(cache_key)
+        except OSError:
+            continue
+        file_version = [stat.st_size, stat.st_mtime_ns]
+        if cache.get(cache_key, [])[:2] == file_version:
+            pdf_ids[pdf_path] = cache[cache_key][2]
+            continue
+        to_compute.append((pdf_path, cache_key, file_version))
+
+    if len(to_compute) > 1 and processes != 1:
+        with mp.Pool(processes) as pool:
+            computed = pool.map(_get_colrev_pdf_id_or_none, [x[0] for x in to_compute])
+    else:
+        computed = [_get_colrev_pdf_id_or_none(x[0]) for x in to_compute]
+
+    for (pdf_path, cache_key, file_version), pdf_id in zip(to_compute, computed):
+        if pdf_id is None:
+            continue
+        pdf_ids[pdf_path] = pdf_id
+        cache[cache_key] = file_version + [pdf_id]
+
+    if cache_path is not None and to_compute:
+        _save_pdf_id_cache(cache_path, cache)
+    return pdf_ids
+
+
 def get_toc_key(record: colrev.record.record.Record) -> str:
     """Get the record's toc-key"""
 
@@ -4,17 +4,16 @@ from __future__ import annotations
 
 import logging
 import os
-import tempfile
 import typing
 from pathlib import Path
 
 import imagehash
 import pymupdf
-from PIL import Image
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
+import colrev.record.record_identifier
 from colrev.constants import Colors
 from colrev.constants import Fields
 
@@ -117,26 +116,22 @@ class PDFRecord(colrev.record.record.Record):
             logging.error("%sPDF with size 0: %s %s", Colors.RED, pdf_path, Colors.END)
             raise colrev_exceptions.InvalidPDFException(path=pdf_path)
 
-        with tempfile.NamedTemporaryFile(suffix=".png") as temp_file:
-            file_name = temp_file.name
-            try:
-                doc: pymupdf.Document = pymupdf.open(pdf_path)
+        try:
+            with pymupdf.open(pdf_path) as doc:
                 # Starting with page 1
                 for page_no, page in enumerate(doc, 1):
                     if page_no == page_nr:
-                        pix = page.get_pixmap(dpi=200)
-                        pix.save(file_name)  # store image as a PNG
-                        with Image.open(file_name) as img:
-                            average_hash = imagehash.average_hash(
-                                img, hash_size=hash_size
-                            )
-                            average_hash_str = str(average_hash).replace("\n", "")
-                            if len(average_hash_str) * "0" == average_hash_str:
-                                raise colrev_exceptions.PDFHashError(path=pdf_path)
-                            return average_hash_str
-                # Page not found
-                raise colrev_exceptions.PDFHashError(path=pdf_path)  # pragma: no cover
-            except pymupdf.FileDataError as exc:
-                raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
-            except RuntimeError as exc:
-                raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+                        average_hash = imagehash.average_hash(
+                            colrev.record.record_identifier.get_page_image(page),
+                            hash_size=hash_size,
+                        )
+                        average_hash_str = str(average_hash).replace("\n", "")
+                        if len(average_hash_str) * "0" == average_hash_str:
+                            raise colrev_exceptions.PDFHashError(path=pdf_path)
+                        return average_hash_str
+            # Page not found
+            raise colrev_exceptions.PDFHashError(path=pdf_path)  # pragma: no cover
+        except pymupdf.FileDataError as exc:
+            raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
+        except RuntimeError as exc:
+            raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
@@ -7,7 +7,6 @@ import os
 import pprint
 import typing
 from dataclasses import asdict
-from datetime import timedelta
 from pathlib import Path
 
 import git
@@ -23,7 +22,6 @@ import colrev.process.operation
 import colrev.record.qm.quality_model
 import colrev.settings
 from colrev.constants import Colors
-from colrev.constants import Filepaths
 from colrev.constants import OperationsType
 from colrev.paths import PathManager
 
@@ -359,6 +357,7 @@ class ReviewManager:
         *,
         pdf_path: typing.Optional[Path] = None,
         tei_path: typing.Optional[Path] = None,
+        header_only: bool = False,
     ) -> colrev.env.tei_parser.TEIParser:  # type: ignore # pragma: no cover
         """Get a tei object"""
 
@@ -368,6 +367,20 @@ class ReviewManager:
             environment_manager=self.environment_manager,
             pdf_path=self.path / pdf_path if pdf_path else None,
             tei_path=self.path / tei_path if tei_path else None,
+            header_only=header_only,
+        )
+
+    def get_tei_generator(
+        self, *, header_only: bool = False
+    ) -> colrev.env.tei_generator.TEIGenerator:  # pragma: no cover
+        """Get a tei generator object (concurrent TEI generation)"""
+
+        import colrev.env.tei_generator
+
+        return colrev.env.tei_generator.TEIGenerator(
+            environment_manager=self.environment_manager,
+            header_only=header_only,
+            logger=self.logger,
         )
 
     @classmethod
@@ -381,13 +394,10 @@ class ReviewManager:
 
     @classmethod
     def get_cached_session(cls) -> requests_cache.CachedSession:  # pragma: no cover
-        """Get a cached session"""
+        """Get the (shared) cached session"""
+        import colrev.env.session_manager
 
-        return requests_cache.CachedSession(
-            str(Filepaths.PREP_REQUESTS_CACHE_FILE),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
-        )
+        return colrev.env.session_manager.session_manager.get_cached_session()
 
     @classmethod
     def get_resources(cls) -> colrev.env.resources.Resources:  # pragma: no cover
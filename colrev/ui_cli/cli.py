@@ -2269,6 +2269,12 @@ def _print_environment_status(
 @click.option(
     "-i", "--index", is_flag=True, default=False, help="Create the LocalIndex"
 )
+@click.option(
+    "--cpu",
+    type=int,
+    default=1,
+    help="Number of cpus (parallel processes) to create the LocalIndex",
+)
 @click.option(
     "--install",
     help="Install a new resource providing its url "
@@ -2308,6 +2314,7 @@ def _print_environment_status(
 def env(
     ctx: click.core.Context,
     index: bool,
+    cpu: int,
     install: str,
     pull: bool,
     status: bool,
@@ -2337,7 +2344,7 @@ def env(
         local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder(
             verbose_mode=verbose
         )
-        local_index_builder.index()
+        local_index_builder.index(processes=cpu)
         local_index_builder.index_journal_rankings()
         return
 
@@ -2,7 +2,9 @@
 """Convenience functions to write bib files"""
 from __future__ import annotations
 
-from copy import deepcopy
+import hashlib
+import re
+import typing
 from pathlib import Path
 
 from colrev.constants import Fields
@@ -56,21 +58,25 @@ def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
     return list_to_return
 
 
-def _get_stringified_record(*, record_dict: dict) -> dict:
-    data_copy = deepcopy(record_dict)
+_ORDERED_FIELDS = frozenset(RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE])
+_LIST_SEPARATOR = "\n" + " " * 36
 
-    def list_to_str(*, val: list) -> str:
-        return ("\n" + " " * 36).join([f.rstrip() for f in val])
 
-    for key in [Fields.ORIGIN]:
-        if key in data_copy:
-            if key in [Fields.ORIGIN]:
-                data_copy[key] = sorted(list(set(data_copy[key])))
-            for ind, val in enumerate(data_copy[key]):
-                if len(val) > 0:
-                    if val[-1] != ";":
-                        data_copy[key][ind] = val + ";"
-            data_copy[key] = list_to_str(val=data_copy[key])
+def _list_to_str(*, val: list) -> str:
+    return _LIST_SEPARATOR.join([f.rstrip() for f in val])
+
+
+def _get_stringified_record(*, record_dict: dict) -> dict:
+    # Note : returns a (shallow) copy, the record_dict is not modified
+    data_copy = dict(record_dict)
+
+    if Fields.ORIGIN in data_copy:
+        data_copy[Fields.ORIGIN] = _list_to_str(
+            val=[
+                val + ";" if len(val) > 0 and val[-1] != ";" else val
+                for val in sorted(set(data_copy[Fields.ORIGIN]))
+            ]
+        )
 
     for key in [Fields.MD_PROV, Fields.D_PROV]:
         if key in data_copy:
@@ -79,50 +85,134 @@ def _get_stringified_record(*, record_dict: dict) -> dict:
                     input_dict=data_copy[key], input_key=key
                 )
             if isinstance(data_copy[key], list):
-                data_copy[key] = list_to_str(val=data_copy[key])
+                data_copy[key] = _list_to_str(val=data_copy[key])
 
     return data_copy
 
 
-def to_string(*, records_dict: dict) -> str:
-    """Convert a records dict to a bibtex string"""
-    # Note: we need a deepcopy because the parsing modifies dicts
-    recs_dict = deepcopy(records_dict)
+def _format_field(field: str, value: typing.Any) -> str:
+    padd = " " * max(0, 28 - len(field))
+    return f",\n   {field} {padd} = {{{value}}}"
 
-    def format_field(field: str, value: str) -> str:
-        padd = " " * max(0, 28 - len(field))
-        return f",\n   {field} {padd} = {{{value}}}"
 
-    bibtex_str = ""
-    first = True
-    for record_id, record_dict in sorted(recs_dict.items()):
-        if not first:
-            bibtex_str += "\n"
-        first = False
+def _record_to_string(*, record_id: str, record_dict: dict) -> str:
+    record_dict = _get_stringified_record(record_dict=record_dict)
 
-        bibtex_str += f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}"
+    parts = [f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}"]
+    for ordered_field in RECORDS_FIELD_ORDER:
+        if ordered_field in record_dict:
+            if record_dict[ordered_field] == "":
+                continue
+            parts.append(_format_field(ordered_field, record_dict[ordered_field]))
 
-        record_dict = _get_stringified_record(record_dict=record_dict)
+    for key in sorted(record_dict.keys()):
+        if key in _ORDERED_FIELDS:
+            continue
+        parts.append(_format_field(key, record_dict[key]))
 
-        for ordered_field in RECORDS_FIELD_ORDER:
-            if ordered_field in record_dict:
-                if record_dict[ordered_field] == "":
-                    continue
-                bibtex_str += format_field(ordered_field, record_dict[ordered_field])
+    parts.append(",\n}\n")
+    return "".join(parts)
 
-        for key in sorted(record_dict.keys()):
-            if key in RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE]:
-                continue
 
-            bibtex_str += format_field(key, record_dict[key])
+def _get_record_string(
+    *, record_id: str, record_dict: dict, cache: typing.Optional[dict]
+) -> str:
+    if cache is None:
+        return _record_to_string(record_id=record_id, record_dict=record_dict)
+
+    # The repr covers all values (including nested lists/dicts and RecordStates)
+    content_hash = hashlib.blake2b(
+        repr((record_id, record_dict)).encode("utf-8", "backslashreplace"),
+        digest_size=16,
+    ).digest()
+    if content_hash not in cache:
+        cache[content_hash] = _record_to_string(
+            record_id=record_id, record_dict=record_dict
+        )
+    return cache[content_hash]
 
-        bibtex_str += ",\n}\n"
 
-    return bibtex_str
+def iter_strings(
+    *, records_dict: dict, cache: typing.Optional[dict] = None
+) -> typing.Iterator[str]:
+    """Convert a records dict to bibtex strings (record by record)
 
+    cache: optional dict (content hash: bibtex string) that is
+    reused across calls to avoid re-formatting unchanged records
+    """
 
-def write_file(*, records_dict: dict, filename: Path) -> None:
+    for i, record_id in enumerate(sorted(records_dict)):
+        if i > 0:
+            yield "\n"
+        yield _get_record_string(
+            record_id=record_id, record_dict=records_dict[record_id], cache=cache
+        )
+
+
+def to_string(*, records_dict: dict, cache: typing.Optional[dict] = None) -> str:
+    """Convert a records dict to a bibtex string"""
+    return "".join(iter_strings(records_dict=records_dict, cache=cache))
+
+
+# Records start with a line like "@article{ID,"
+_RECORD_START_RE = re.compile(rb"^@[^\n]*$", re.MULTILINE)
+
+
+def get_record_offsets(contents: bytes) -> dict:
+    """Get the byte offsets of the records in a bib file
+
+    Returns a dict of ID: (start, end), where end is the start of the next record
+    (i.e., the blank lines after a record belong to it).
+    """
+    record_starts = []
+    for match in _RECORD_START_RE.finditer(contents):
+        line = match.group()
+        record_id = line[line.find(b"{") + 1 : line.rfind(b",")].decode("utf-8")
+        record_starts.append((record_id, match.start()))
+
+    offsets: dict = {}
+    record_ends = [start for _, start in record_starts[1:]] + [len(contents)]
+    for (record_id, start), end in zip(record_starts, record_ends):
+        # Note : for duplicate IDs, the first record is replaced
+        offsets.setdefault(record_id, (start, end))
+    return offsets
+
+
+def splice_records(
+    *, contents: bytes, records_dict: dict, cache: typing.Optional[dict] = None
+) -> bytes:
+    """Replace the records in the contents of a bib file (in one pass)
+
+    Records that are not in the contents are appended.
+    """
+
+    offsets = get_record_offsets(contents)
+    replacements = []
+    appended = []
+    for record_id, record_dict in records_dict.items():
+        record_str = (
+            _get_record_string(
+                record_id=record_id, record_dict=record_dict, cache=cache
+            )
+            + "\n"
+        )
+        if record_id in offsets:
+            replacements.append((offsets[record_id], record_str.encode("utf-8")))
+        else:
+            appended.append(record_str.encode("utf-8"))
+
+    chunks = []
+    position = 0
+    for (start, end), record_bytes in sorted(replacements, key=lambda x: x[0]):
+        chunks.extend([contents[position:start], record_bytes])
+        position = end
+    chunks.append(contents[position:])
+    return b"".join(chunks + appended)
+
+
+def write_file(
+    *, records_dict: dict, filename: Path, cache: typing.Optional[dict] = None
+) -> None:
     """Write a bib file from a records dict"""
-    bibtexstr = to_string(records_dict=records_dict)
     with open(filename, "w", encoding="utf-8") as file:
-        file.write(bibtexstr)
+        file.writelines(iter_strings(records_dict=records_dict, cache=cache))
@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 """Tests for the dataset"""
+import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import git
 import pytest
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
 import colrev.review_manager
+import colrev.writer.bib
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import OperationsType
@@ -67,6 +71,63 @@ def test_load_records_from_history(  # type: ignore
     ), "The record status does not match the expected status."
 
 
+def test_history_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test the cache of parsed records file versions (per blob SHA)."""
+
+    helpers.reset_commit(base_repo_review_manager, commit="prescreen_commit")
+    dataset = base_repo_review_manager.dataset
+    dataset._history_cache = None  # pylint: disable=protected-access
+    base_repo_review_manager.paths.history_cache.unlink(missing_ok=True)
+    git_repo = git.Repo(base_repo_review_manager.path)
+    record_versions = [
+        colrev.loader.load_utils.loads(
+            load_string=(commit.tree / "data/records.bib")
+            .data_stream.read()
+            .decode("utf-8"),
+            implementation="bib",
+        )
+        for commit in git_repo.iter_commits(paths="data/records.bib")
+    ]
+    # Note : empty versions are skipped
+    expected = [records for records in record_versions if records]
+
+    loads_spy = mocker.spy(colrev.loader.load_utils, "loads")
+    assert expected == list(dataset.load_records_from_history())
+    assert len(record_versions) == loads_spy.call_count
+
+    # Cached versions are not parsed again
+    loads_spy.reset_mock()
+    assert expected == list(dataset.load_records_from_history())
+    blob = git_repo.head.commit.tree / "data/records.bib"
+    assert expected[0]["SrivastavaShainesh2015"] == dataset.load_record_from_blob(
+        blob, "SrivastavaShainesh2015"
+    )
+    assert dataset.load_record_from_blob(blob, "NotInRecords") is None
+    assert 0 == loads_spy.call_count
+
+    # Unchanged records are stored once
+    def get_nr_record_versions() -> int:
+        connection = sqlite3.connect(str(base_repo_review_manager.paths.history_cache))
+        nr_record_versions = connection.execute(
+            "SELECT COUNT(*) FROM record_versions"
+        ).fetchone()[0]
+        connection.close()
+        return nr_record_versions
+
+    nr_record_versions = get_nr_record_versions()
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records = dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed title"
+    dataset.save_records_dict(records)
+    dataset.create_commit(msg="Change a title", manual_author=True)
+    assert "Changed title" == dataset.load_record_from_blob(
+        git_repo.head.commit.tree / "data/records.bib", "SrivastavaShainesh2015"
+    ).get(Fields.TITLE)
+    assert nr_record_versions + 1 == get_nr_record_versions()
+
+
 def test_get_origin_state_dict(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
@@ -304,6 +365,83 @@ def test_get_format_report(
     }
 
 
+def test_save_records_dict_partial(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test saving records partially (splicing records into the records file)."""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records_file = base_repo_review_manager.paths.records
+    original_contents = records_file.read_bytes()
+
+    records = {
+        record_id: {
+            Fields.ID: record_id,
+            Fields.ENTRYTYPE: "article",
+            Fields.ORIGIN: [f"test.bib/{record_id}"],
+            Fields.STATUS: RecordState.md_imported,
+            Fields.TITLE: f"Title of {record_id}",
+            Fields.AUTHOR: "Smith, Tom",
+            Fields.YEAR: "2020",
+        }
+        for record_id in ["Doe2020", "Miller2020", "Smith2020"]
+    }
+    try:
+        base_repo_review_manager.dataset.save_records_dict(records)
+
+        changed_records = {
+            "Miller2020": {
+                **records["Miller2020"],
+                Fields.TITLE: "A (much) longer title of the changed record",
+                Fields.STATUS: RecordState.md_prepared,
+            },
+            "Zhang2020": {
+                **records["Smith2020"],
+                Fields.ID: "Zhang2020",
+                Fields.ORIGIN: ["test.bib/Zhang2020"],
+            },
+        }
+        base_repo_review_manager.dataset.save_records_dict(
+            changed_records, partial=True
+        )
+        records.update(changed_records)
+
+        assert records == base_repo_review_manager.dataset.load_records_dict()
+        assert (
+            records_file.read_text(encoding="utf-8")
+            == colrev.writer.bib.to_string(records_dict=records) + "\n"
+        )
+    finally:
+        records_file.write_bytes(original_contents)
+
+
+def test_splice_records() -> None:
+    """Test the offsets and splicing of records in bib files."""
+
+    contents = (
+        b"@article{A,\n   title = {A},\n}\n\n"
+        b"@article{B,\n   title = {B},\n}\n\n"
+        b"@article{C,\n   title = {C},\n}\n\n"
+    )
+    assert colrev.writer.bib.get_record_offsets(contents) == {
+        "A": (0, 31),
+        "B": (31, 62),
+        "C": (62, 93),
+    }
+    actual = colrev.writer.bib.splice_records(
+        contents=contents,
+        records_dict={
+            "C": {Fields.ID: "C", Fields.ENTRYTYPE: "book", Fields.TITLE: "C2"},
+            "D": {Fields.ID: "D", Fields.ENTRYTYPE: "misc", Fields.TITLE: "D"},
+        },
+    )
+    assert actual == (
+        contents[:62]
+        + b"@book{C,\n   title                         = {C2},\n}\n\n"
+        + b"@misc{D,\n   title                         = {D},\n}\n\n"
+    )
+
+
 def test_get_commit_message(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
@@ -659,3 +797,38 @@ def test_stash_unstaged_changes(
         Path(unstaged_file_path.name)
         not in base_repo_review_manager.dataset.get_untracked_files()
     ), "The file should not be recognized as an unstaged change after stashing."
+
+
+def test_load_records_dict_cache(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the cache of parsed records (keyed by the git blob hash)."""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records_file = base_repo_review_manager.paths.records
+    cache_file = base_repo_review_manager.paths.records_cache
+    cache_file.unlink(missing_ok=True)
+
+    records = dataset.load_records_dict()
+    assert cache_file.is_file()
+    assert dataset._get_records_cache_key()[1] == dataset.get_repo().git.hash_object(
+        str(records_file)
+    )
+    assert records == dataset._load_cached_records_dict()
+    assert records == dataset.load_records_dict()
+
+    # Changes to the records file invalidate the cache
+    original_contents = records_file.read_bytes()
+    try:
+        records_file.write_bytes(original_contents.replace(b"2015", b"2016"))
+        assert dataset._load_cached_records_dict() is None
+        changed_records = dataset.load_records_dict()
+        assert changed_records != records
+        assert changed_records == dataset._load_cached_records_dict()
+
+        cache_file.write_bytes(b"corrupted")
+        assert dataset._load_cached_records_dict() is None
+        assert changed_records == dataset.load_records_dict()
+    finally:
+        records_file.write_bytes(original_contents)
@@ -168,17 +168,17 @@ def test_open_pdf_invalid_path(helpers, tmp_path):  # type: ignore
 
     pymupdf.open = original_fitz_open
 
-    def image_open_runtime_error(pdf_path):  # type: ignore
+    def image_frombytes_runtime_error(mode, size, data):  # type: ignore
         """Raise a runtime error"""
         raise RuntimeError
 
-    original_image_open = Image.open
-    Image.open = image_open_runtime_error
+    original_image_frombytes = Image.frombytes
+    Image.frombytes = image_frombytes_runtime_error
 
     with pytest.raises(colrev_exceptions.PDFHashError):
         colrev.record.record.Record.get_colrev_pdf_id(pdf_path=pdf_path)
 
-    Image.open = original_image_open
+    Image.frombytes = original_image_frombytes
 
     original_imagehash_averagehash = imagehash.average_hash
 
@@ -213,3 +213,43 @@ def test_cpid(helpers) -> None:  # type: ignore
         colrev.record.record_identifier.get_colrev_pdf_id(
             pdf_path=pdf_path, cpid_version="unknown"
         )
+
+
+def test_get_colrev_pdf_ids(helpers, tmp_path) -> None:  # type: ignore
+    """Test the parallel and cached computation of colrev_pdf_ids"""
+
+    pdf_paths = []
+    for pdf_name in [
+        "WagnerLukyanenkoParEtAl2022.pdf",
+        "SrivastavaShainesh2015.pdf",
+        "broken-pdf.pdf",
+        "zero-size-pdf.pdf",
+    ]:
+        pdf_path = tmp_path / Path(pdf_name)
+        helpers.retrieve_test_file(source=Path("data") / pdf_name, target=pdf_path)
+        pdf_paths.append(pdf_path)
+    cache_path = tmp_path / Path(".colrev/colrev_pdf_ids.json")
+
+    actual = colrev.record.record_identifier.get_colrev_pdf_ids(
+        pdf_paths + [tmp_path / Path("missing.pdf")], cache_path=cache_path
+    )
+    # Invalid and missing PDFs are omitted
+    assert list(actual) == pdf_paths[:2]
+    for pdf_path in pdf_paths[:2]:
+        assert actual[pdf_path] == colrev.record.record_identifier.get_colrev_pdf_id(
+            pdf_path
+        )
+    assert cache_path.is_file()
+
+    # Cached colrev_pdf_ids are not recomputed
+    def pymupdf_open_error(pdf_path):  # type: ignore
+        raise RuntimeError
+
+    original_pymupdf_open = pymupdf.open
+    pymupdf.open = pymupdf_open_error
+    try:
+        assert actual == colrev.record.record_identifier.get_colrev_pdf_ids(
+            pdf_paths, cache_path=cache_path, processes=1
+        )
+    finally:
+        pymupdf.open = original_pymupdf_open
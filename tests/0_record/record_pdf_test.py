@@ -115,19 +115,19 @@ def test_get_pdf_hash(helpers) -> None:  # type: ignore
 
     pymupdf.open = original_pymupdf_open
 
-    def image_open_runtime_error(pdf_path):  # type: ignore
+    def image_frombytes_runtime_error(mode, size, data):  # type: ignore
         """Raise a runtime error"""
         raise RuntimeError
 
-    original_image_open = Image.open
-    Image.open = image_open_runtime_error
+    original_image_frombytes = Image.frombytes
+    Image.frombytes = image_frombytes_runtime_error
 
     with pytest.raises(colrev_exceptions.PDFHashError):
         colrev.record.record_pdf.PDFRecord(
             {"file": Path("WagnerLukyanenkoParEtAl2022.pdf")}
         ).get_pdf_hash(page_nr=1)
 
-    Image.open = original_image_open
+    Image.frombytes = original_image_frombytes
 
     original_imagehash_averagehash = imagehash.average_hash
 
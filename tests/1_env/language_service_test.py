@@ -123,6 +123,31 @@ def test_compute_language(
     assert expected_lang == predicted_lang
 
 
+def test_compute_languages(
+    language_service: colrev.env.language_service.LanguageService,
+) -> None:
+    """Test the batch computation of languages (compute_languages)"""
+
+    texts = [
+        "An Integrated Framework for Understanding Digital Work in Organizations",
+        "Editorial",
+        "Maxillary Implant Prosthodontic Treatment Using Digital Laboratory Protocol for a Patient with Epidermolysis Bullosa: A Case History Report",
+        "ελληνικά",
+        "平台经济的典型特征、垄断分析与反垄断监管",
+        "Editorial",
+    ]
+    expected = [language_service.compute_language(text=text) for text in texts]
+    assert expected == language_service.compute_languages(texts)
+    assert [] == language_service.compute_languages([])
+
+    # The language detector is shared (and only loaded once)
+    other_language_service = colrev.env.language_service.LanguageService()
+    assert (
+        other_language_service.lingua_language_detector
+        is language_service.lingua_language_detector
+    )
+
+
 @pytest.mark.parametrize(
     "language_code, expected",
     [
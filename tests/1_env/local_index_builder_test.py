@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""Test the local_index_builder"""
+import json
+import shutil
+import sqlite3
+from pathlib import Path
+
+import git
+
+import colrev.env.local_index_builder
+import colrev.env.local_index_sqlite
+import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+
+
+def _get_index(sqlite_file: Path) -> tuple:
+    connection = sqlite3.connect(str(sqlite_file))
+    titles = {
+        row[0] for row in connection.execute(f"SELECT {Fields.TITLE} FROM record_index")
+    }
+    toc_items = dict(connection.execute("SELECT * FROM toc_index").fetchall())
+    connection.close()
+    return titles, toc_items
+
+
+def _create_curated_repo(  # type: ignore
+    base_repo_review_manager, helpers, repo_path: Path, bib_file: str = "misq.bib"
+) -> Path:
+    shutil.copytree(base_repo_review_manager.path, repo_path)
+    settings = json.loads((repo_path / Path("settings.json")).read_text())
+    settings["data"]["data_package_endpoints"].append(
+        {
+            "endpoint": "colrev.colrev_curation",
+            "curation_url": "https://github.com/CoLRev-curations/misq",
+            "curated_masterdata": True,
+            "masterdata_restrictions": {},
+            "curated_fields": [],
+        }
+    )
+    (repo_path / Path("settings.json")).write_text(json.dumps(settings, indent=4))
+    helpers.retrieve_test_file(
+        source=Path("data/local_index") / Path(bib_file),
+        target=repo_path / Path("data/records.bib"),
+    )
+    repo = git.Repo(repo_path)
+    repo.index.add(["settings.json", "data/records.bib"])
+    repo.index.commit("add curated records", skip_hooks=True)
+    return repo_path
+
+
+def test_index_changes(  # type: ignore
+    base_repo_review_manager, helpers, tmp_path, mocker
+) -> None:
+    """Test the incremental indexing of changes (based on the watermarks)"""
+
+    repo_path = _create_curated_repo(
+        base_repo_review_manager, helpers, tmp_path / Path("curated_repo")
+    )
+    repo = git.Repo(repo_path)
+
+    sqlite_file = tmp_path / Path("sqlite_index_test.db")
+    mocker.patch.object(Filepaths, "LOCAL_INDEX_SQLITE_FILE", sqlite_file)
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.reinitialize_sqlite_db()
+    local_index_builder.index_colrev_project(repo_path)
+
+    watermarks = colrev.env.local_index_sqlite.SQLiteIndexWatermarks()
+    assert {str(repo_path.resolve()): repo.head.commit.hexsha} == watermarks.get_all()
+    titles, toc_items = _get_index(sqlite_file)
+    assert 4 == len(titles)
+    assert toc_items
+
+    # Changes are indexed incrementally (without loading the project)
+    records = (repo_path / Path("data/records.bib")).read_text(encoding="utf-8")
+    records = records.replace(
+        "Symbolic Action Research in Information Systems: Introduction to the Special Issue",
+        "Symbolic Action Research in Information Systems",
+    )
+    (repo_path / Path("data/records.bib")).write_text(records, encoding="utf-8")
+    repo.index.add(["data/records.bib"])
+    repo.index.commit("update record", skip_hooks=True)
+
+    mocker.patch.object(
+        colrev.review_manager, "ReviewManager", side_effect=AssertionError
+    )
+    local_index_builder.index_colrev_project(repo_path)
+    assert repo.head.commit.hexsha == watermarks.get(str(repo_path.resolve()))
+    updated_titles, updated_toc_items = _get_index(sqlite_file)
+    assert {
+        "Symbolic Action Research in Information Systems: Introduction to the Special Issue"
+    } == titles - updated_titles
+    assert {"Symbolic Action Research in Information Systems"} == (
+        updated_titles - titles
+    )
+    assert toc_items.keys() == updated_toc_items.keys()
+    assert toc_items != updated_toc_items
+
+    # Without changes, the index remains unchanged
+    local_index_builder.index_colrev_project(repo_path)
+    assert (updated_titles, updated_toc_items) == _get_index(sqlite_file)
+    assert local_index_builder._can_index_incrementally(  # pylint: disable=protected-access
+        [repo_path]
+    )
+    assert not local_index_builder._can_index_incrementally(  # pylint: disable=protected-access
+        []
+    )
+
+    # Uncommitted changes are not indexed (the index must be reinitialized)
+    (repo_path / Path("data/records.bib")).write_text(
+        records.replace("Symbolic Action Research", "Uncommitted title"),
+        encoding="utf-8",
+    )
+    assert not local_index_builder._can_index_incrementally(  # pylint: disable=protected-access
+        [repo_path]
+    )
+    local_index_builder.index_colrev_project(repo_path)
+    assert repo.head.commit.hexsha == watermarks.get(str(repo_path.resolve()))
+    assert (updated_titles, updated_toc_items) == _get_index(sqlite_file)
+
+    # Removed repositories require a reinitialization of the index
+    shutil.rmtree(repo_path)
+    assert not local_index_builder._can_index_incrementally(  # pylint: disable=protected-access
+        [repo_path]
+    )
+
+
+def test_index_in_parallel(  # type: ignore
+    base_repo_review_manager, helpers, tmp_path, mocker
+) -> None:
+    """Test the indexing of projects in parallel processes"""
+
+    repo_paths = [
+        _create_curated_repo(
+            base_repo_review_manager, helpers, tmp_path / Path("misq"), "misq.bib"
+        ),
+        _create_curated_repo(
+            base_repo_review_manager, helpers, tmp_path / Path("cais"), "cais.bib"
+        ),
+    ]
+    sqlite_file = tmp_path / Path("sqlite_index_test.db")
+    mocker.patch.object(Filepaths, "LOCAL_INDEX_SQLITE_FILE", sqlite_file)
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.reinitialize_sqlite_db()
+    # pylint: disable=protected-access
+    local_index_builder._index_colrev_projects_in_parallel(repo_paths, processes=2)
+
+    titles, toc_items = _get_index(sqlite_file)
+    assert 5 == len(titles)
+    assert toc_items
+    watermarks = colrev.env.local_index_sqlite.SQLiteIndexWatermarks().get_all()
+    assert {
+        str(repo_path.resolve()): git.Repo(repo_path).head.commit.hexsha
+        for repo_path in repo_paths
+    } == watermarks
+
+
+def test_reinitialize_sqlite_db(tmp_path, mocker) -> None:  # type: ignore
+    """Test the reinitialization of the sqlite database (WAL mode)"""
+
+    sqlite_file = tmp_path / Path("sqlite_index_test.db")
+    mocker.patch.object(Filepaths, "LOCAL_INDEX_SQLITE_FILE", sqlite_file)
+    wal_files = [Path(f"{sqlite_file}-wal"), Path(f"{sqlite_file}-shm")]
+    for file in [sqlite_file] + wal_files:
+        file.write_bytes(b"stale")
+
+    # The WAL files are removed before the database is created
+    existing_files = []
+
+    def create_index(**_kwargs) -> None:  # type: ignore
+        existing_files.extend(
+            file for file in [sqlite_file] + wal_files if file.is_file()
+        )
+
+    for index_class in ["SQLiteIndexRecord", "SQLiteIndexTOC", "SQLiteIndexWatermarks"]:
+        mocker.patch.object(
+            colrev.env.local_index_sqlite, index_class, side_effect=create_index
+        )
+
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.reinitialize_sqlite_db()
+
+    assert [] == existing_files
@@ -1,5 +1,251 @@
 #!/usr/bin/env python
 """Test the local_index"""
+import sqlite3
+import threading
+
+import pytest
+
+import colrev.env.local_index_builder
+import colrev.exceptions as colrev_exceptions
+import colrev.env.local_index_sqlite
+import colrev.loader.load_utils
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.constants import LocalIndexFields
+
 # pylint: disable=line-too-long
 # flake8: noqa: E501
 # TODO
+
+
+def test_connection_manager(local_index) -> None:  # type: ignore
+    """Test the pooled read-only connections of the SQLiteConnectionManager"""
+
+    connection_manager = colrev.env.local_index_sqlite.connection_manager
+
+    # Connections are reused across lookups (within a thread)
+    connection = connection_manager.get_connection()
+    assert connection is connection_manager.get_connection()
+
+    # Read-only index instances do not close the pooled connection
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        read_only=True
+    )
+    assert sqlite_index_record.connection is connection
+    sqlite_index_record.close()
+    connection.execute("SELECT 1")
+
+    # Each thread has its own connection
+    other_connections = []
+    thread = threading.Thread(
+        target=lambda: other_connections.append(connection_manager.get_connection())
+    )
+    thread.start()
+    thread.join()
+    assert other_connections[0] is not connection
+
+    # Connections of finished threads are closed (when new connections are created)
+    # and connections of running threads remain open (until the threads reconnect)
+    connection_requested = threading.Event()
+    close_all_called = threading.Event()
+
+    def use_connection() -> None:
+        running_connection = connection_manager.get_connection()
+        other_connections.append(running_connection)
+        connection_requested.set()
+        close_all_called.wait(timeout=10)
+        running_connection.execute("SELECT 1")
+        other_connections.append(connection_manager.get_connection())
+
+    thread = threading.Thread(target=use_connection)
+    thread.start()
+    connection_requested.wait(timeout=10)
+    with pytest.raises(sqlite3.ProgrammingError):
+        other_connections[0].execute("SELECT 1")
+
+    # Lookups work after the connections were closed (e.g., after reinitialization)
+    connection_manager.close_all()
+    close_all_called.set()
+    thread.join()
+    assert other_connections[2] is not other_connections[1]
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    assert connection_manager.get_connection() is not connection
+    assert local_index.search("title LIKE '%%'") is not None
+
+
+def test_record_json(local_index, tmp_path, mocker) -> None:  # type: ignore
+    """Test the pre-parsed records (record_json) and their migration"""
+
+    connection = colrev.env.local_index_sqlite.connection_manager.get_connection()
+    rows = connection.execute("SELECT * FROM record_index").fetchall()
+    assert rows
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        read_only=True
+    )
+    expected = {}
+    for row in rows:
+        records_dict = colrev.loader.load_utils.loads(
+            load_string=row[LocalIndexFields.BIBTEX],
+            implementation="bib",
+            unique_id_field="ID",
+        )
+        expected[row[Fields.COLREV_ID]] = list(records_dict.values())[0]
+        assert expected[row[Fields.COLREV_ID]] == sqlite_index_record.get(
+            key=Fields.COLREV_ID, value=row[Fields.COLREV_ID]
+        )
+
+    # Create an index without the record_json column (previous versions)
+    legacy_sqlite = tmp_path / "legacy_index.db"
+    source = sqlite3.connect(str(Filepaths.LOCAL_INDEX_SQLITE_FILE))
+    target = sqlite3.connect(str(legacy_sqlite))
+    source.backup(target)
+    source.close()
+    target.execute(
+        f"ALTER TABLE record_index DROP COLUMN {LocalIndexFields.RECORD_JSON}"
+    )
+    for column in colrev.env.local_index_sqlite.SQLiteIndexRecord.INDEXED_COLUMNS:
+        target.execute(f"DROP INDEX record_index_{column}")
+    target.commit()
+    target.close()
+    mocker.patch.object(Filepaths, "LOCAL_INDEX_SQLITE_FILE", legacy_sqlite)
+
+    # Rows without record_json are parsed from the bibtex field
+    for colrev_id, record_dict in expected.items():
+        assert record_dict == sqlite_index_record.get(
+            key=Fields.COLREV_ID, value=colrev_id
+        )
+
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.migrate_sqlite_db()
+    connection = colrev.env.local_index_sqlite.connection_manager.get_connection()
+    rows = connection.execute("SELECT * FROM record_index").fetchall()
+    assert all(row[LocalIndexFields.RECORD_JSON] for row in rows)
+    indices = connection.execute("PRAGMA index_list(record_index)").fetchall()
+    assert {
+        f"record_index_{column}" for column in sqlite_index_record.INDEXED_COLUMNS
+    } <= {index["name"] for index in indices}
+    for colrev_id, record_dict in expected.items():
+        assert record_dict == sqlite_index_record.get(
+            key=Fields.COLREV_ID, value=colrev_id
+        )
+
+
+def test_get_many(local_index) -> None:  # type: ignore
+    """Test the batched retrieval (get_many)"""
+
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        read_only=True
+    )
+    connection = colrev.env.local_index_sqlite.connection_manager.get_connection()
+    query_plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM record_index WHERE doi=?", ("NA",)
+    ).fetchall()
+    assert "USING INDEX record_index_doi" in query_plan[0]["detail"]
+
+    dois = [
+        row[Fields.DOI]
+        for row in connection.execute("SELECT doi FROM record_index WHERE doi != ''")
+    ]
+    assert dois
+    actual = sqlite_index_record.get_many(
+        key=Fields.DOI, values=dois + ["10.1111/NOT-IN-INDEX"]
+    )
+    assert set(dois) == set(actual)
+    for doi in dois:
+        assert actual[doi] == sqlite_index_record.get(key=Fields.DOI, value=doi)
+
+    records = local_index.retrieve_many(key=Fields.DOI, values=dois[:1])
+    assert records[dois[0]].data[Fields.DOI] == dois[0]
+    assert {} == local_index.retrieve_many(key=Fields.DOI, values=[])
+
+
+def test_prefetch(local_index, mocker) -> None:  # type: ignore
+    """Test the retrieval of records prefetched for a batch (e.g., in prep)"""
+
+    connection = colrev.env.local_index_sqlite.connection_manager.get_connection()
+    doi = connection.execute("SELECT doi FROM record_index WHERE doi != ''").fetchone()[
+        Fields.DOI
+    ]
+    # pylint: disable=protected-access
+    get_many_spy = mocker.spy(local_index._sqlite_index_record, "get_many")
+    local_index.prefetch(key=Fields.DOI, values=[doi, "10.1111/NOT-IN-INDEX", ""])
+    get_many_spy.assert_called_once()
+
+    get_mock = mocker.patch.object(local_index._sqlite_index_record, "get")
+    record = local_index.retrieve({Fields.ID: "0001", Fields.DOI: doi})
+    assert doi == record.data[Fields.DOI]
+    with pytest.raises(colrev_exceptions.RecordNotInIndexException):
+        local_index.retrieve({Fields.ID: "0002", Fields.DOI: "10.1111/NOT-IN-INDEX"})
+    get_mock.assert_not_called()
+
+
+def test_upsert_many(local_index, tmp_path, mocker) -> None:  # type: ignore
+    """Test the bulk insertion (upsert_many) and the amended records"""
+
+    # The curated fields (curation_layer.bib) amend the indexed records (misq.bib)
+    records = local_index.retrieve_many(
+        key=Fields.COLREV_ID,
+        values=[
+            row[Fields.COLREV_ID]
+            for row in colrev.env.local_index_sqlite.connection_manager.get_connection().execute(
+                "SELECT colrev_id FROM record_index WHERE citation_key='AlaviLeidner2001'"
+            )
+        ],
+    )
+    assert ["yes"] == [r.data.get("literature_review") for r in records.values()]
+
+    mocker.patch.object(Filepaths, "LOCAL_INDEX_SQLITE_FILE", tmp_path / "index.db")
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        reinitialize=True
+    )
+    assert (
+        1
+        == sqlite_index_record.connection.execute("PRAGMA synchronous").fetchone()[
+            "synchronous"
+        ]
+    )
+    items = []
+    for i in range(3):
+        bibtex = f"@article{{R{i},\n   title = {{Title {i}}},\n}}\n"
+        item = {key: "" for key in sqlite_index_record.KEYS}
+        item.update(
+            {
+                LocalIndexFields.ID: f"id{i}",
+                Fields.COLREV_ID: f"cid{i}",
+                Fields.TITLE: f"Title {i}",
+                LocalIndexFields.BIBTEX: bibtex,
+                LocalIndexFields.RECORD_JSON: colrev.env.local_index_sqlite.get_record_json(
+                    bibtex
+                ),
+            }
+        )
+        items.append(item)
+    sqlite_index_record.upsert_many(items)
+    assert {"id0", "id1", "id2"} == set(
+        sqlite_index_record.get_many_by_id(["id0", "id1", "id2", "id3"])
+    )
+
+    # Existing records: only the bibtex/record_json are updated
+    bibtex = "@article{R0,\n   title = {Title 0},\n   literature_review = {yes},\n}\n"
+    items[0].update(
+        {
+            Fields.TITLE: "Changed",
+            LocalIndexFields.BIBTEX: bibtex,
+            LocalIndexFields.RECORD_JSON: colrev.env.local_index_sqlite.get_record_json(
+                bibtex
+            ),
+        }
+    )
+    sqlite_index_record.upsert_many(items[:1])
+    row = sqlite_index_record.connection.execute(
+        "SELECT * FROM record_index WHERE id='id0'"
+    ).fetchone()
+    assert "Title 0" == row[Fields.TITLE]
+    assert {
+        "ID": "R0",
+        "ENTRYTYPE": "article",
+        "title": "Title 0",
+        "literature_review": "yes",
+    } == sqlite_index_record.get_many_by_id(["id0"])["id0"]
+    sqlite_index_record.close()
@@ -3,6 +3,8 @@
 import pytest
 
 import colrev.env.local_index
+import colrev.env.local_index_builder
+import colrev.env.local_index_sqlite
 import colrev.env.tei_parser
 import colrev.review_manager
 from colrev.constants import ENTRYTYPES
@@ -39,7 +41,25 @@ def test_get_fields_to_remove(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
-# TODO get_journal_rankings
+def test_get_journal_rankings(local_index) -> None:  # type: ignore
+    """Test get_journal_rankings()"""
+
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.index_journal_rankings()
+
+    connection = colrev.env.local_index_sqlite.connection_manager.get_connection()
+    query_plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM rankings WHERE journal_name=?", ("NA",)
+    ).fetchall()
+    assert "USING INDEX rankings_journal_name" in query_plan[0]["detail"]
+
+    local_index = colrev.env.local_index.LocalIndex()
+    rankings = local_index.get_journal_rankings("MIS Quarterly")
+    assert ["Senior Scholar's List of Premier Journals", "FT-50"] == [
+        r["ranking"] for r in rankings
+    ]
+    assert rankings == local_index.get_journal_rankings(" mis  quarterly")
+    assert [] == local_index.get_journal_rankings("Unknown Journal")
 
 
 def test_get_year_from_toc(local_index) -> None:  # type: ignore
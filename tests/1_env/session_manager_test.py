@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Test the session_manager"""
+import threading
+
+import colrev.env.session_manager
+from colrev.constants import Filepaths
+
+# pylint: disable=protected-access
+
+
+def test_shared_sessions(tmp_path, mocker) -> None:  # type: ignore
+    """Test the shared (cached) sessions"""
+
+    mocker.patch.object(
+        Filepaths, "PREP_REQUESTS_CACHE_FILE", tmp_path / "prep_requests_cache"
+    )
+    session_manager = colrev.env.session_manager.SessionManager()
+
+    # Sessions are shared across threads
+    cached_session = session_manager.get_cached_session()
+    sessions = []
+    threads = [
+        threading.Thread(
+            target=lambda: sessions.append(session_manager.get_cached_session())
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(session is cached_session for session in sessions)
+    assert session_manager.get_session() is session_manager.get_session()
+    assert session_manager.get_session() is not cached_session
+
+    # Connections are pooled and failed requests are retried
+    adapter = cached_session.get_adapter("https://api.crossref.org")
+    assert isinstance(adapter, colrev.env.session_manager.HTTPAdapter)
+    assert colrev.env.session_manager.POOL_SIZE == adapter._pool_maxsize
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header
+
+    # The cache uses WAL mode (concurrent reads)
+    with cached_session.cache.responses.connection() as connection:
+        assert "wal" == connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    # Sessions are recreated when the cache file changes
+    mocker.patch.object(Filepaths, "PREP_REQUESTS_CACHE_FILE", tmp_path / "other")
+    assert session_manager.get_cached_session() is not cached_session
+
+    session_manager.close_all()
+    assert session_manager.get_cached_session() is not cached_session
+
+
+def test_rate_limits(mocker) -> None:  # type: ignore
+    """Test the per-host rate limits"""
+
+    clock = [0.0]
+    mocker.patch.object(
+        colrev.env.session_manager.time,
+        "sleep",
+        side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+    )
+    mocker.patch.object(
+        colrev.env.session_manager.time, "monotonic", side_effect=lambda: clock[0]
+    )
+    session_manager = colrev.env.session_manager.SessionManager()
+    session_manager.set_rate_limit(host="api.crossref.org", requests_per_second=2)
+
+    # Bursts are allowed (up to the capacity), afterwards requests wait for tokens
+    assert [0.0, 0.0, 0.5, 0.5] == [
+        session_manager.wait_for_host("api.crossref.org") for _ in range(4)
+    ]
+    assert 1.0 == clock[0]
+    # Rate limits are separate for each host
+    assert 0.0 == session_manager.wait_for_host("dblp.org")
+
+    # Requests sent by the sessions wait for the rate limits
+    wait_spy = mocker.spy(session_manager, "wait_for_host")
+    mocker.patch.object(
+        colrev.env.session_manager.HTTPAdapter, "send", return_value="response"
+    )
+    session = session_manager.get_session()
+    request = session.prepare_request(
+        colrev.env.session_manager.requests.Request(
+            "GET", "https://api.crossref.org/works"
+        )
+    )
+    assert "response" == session.get_adapter(request.url).send(request)
+    wait_spy.assert_called_once_with("api.crossref.org")
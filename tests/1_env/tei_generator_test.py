@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Test the tei generator"""
+import os
+import threading
+from pathlib import Path
+
+import requests
+
+import colrev.env.environment_manager
+import colrev.env.tei_generator
+import colrev.env.tei_parser
+import colrev.exceptions as colrev_exceptions
+
+
+def test_tei_generator(tmp_path, mocker) -> None:  # type: ignore
+    """Test the concurrent generation of TEIs"""
+
+    tei_content = (
+        Path(__file__).parent.parent / Path("data/WagnerLukyanenkoParEtAl2022.tei.xml")
+    ).read_bytes()
+    grobid_service_mock = mocker.patch(
+        "colrev.env.grobid_service.GrobidService", autospec=True
+    )
+    barrier = threading.Barrier(2, timeout=10)
+
+    def request_tei(*, pdf_path: Path, header_only: bool) -> bytes:
+        assert header_only
+        if pdf_path.name == "error.pdf":
+            raise colrev_exceptions.TEIException()
+        if pdf_path.name == "timeout.pdf":
+            raise requests.exceptions.ReadTimeout()
+        # Requests are processed concurrently (two workers)
+        barrier.wait()
+        return tei_content
+
+    request_tei_mock = mocker.patch.object(
+        colrev.env.tei_parser.TEIParser, "request_tei", side_effect=request_tei
+    )
+
+    tei_paths = {}
+    for name in ["a", "b", "up_to_date", "error", "timeout"]:
+        pdf_path = tmp_path / Path(f"pdfs/{name}.pdf")
+        pdf_path.parent.mkdir(exist_ok=True, parents=True)
+        pdf_path.write_bytes(b"%PDF")
+        tei_paths[pdf_path] = tmp_path / Path(f".tei/{name}.tei.xml")
+    tei_paths[tmp_path / Path("pdfs/missing.pdf")] = tmp_path / Path(
+        ".tei/missing.tei.xml"
+    )
+    up_to_date_pdf = tmp_path / Path("pdfs/up_to_date.pdf")
+    tei_paths[up_to_date_pdf].parent.mkdir(exist_ok=True, parents=True)
+    tei_paths[up_to_date_pdf].write_bytes(b"<TEI/>")
+
+    tei_generator = colrev.env.tei_generator.TEIGenerator(
+        environment_manager=colrev.env.environment_manager.EnvironmentManager(),
+        max_workers=2,
+        header_only=True,
+    )
+    available = tei_generator.generate(tei_paths, show_progress=False)
+
+    assert {
+        tmp_path / Path("pdfs/a.pdf"),
+        tmp_path / Path("pdfs/b.pdf"),
+        up_to_date_pdf,
+    } == set(available)
+    assert 4 == request_tei_mock.call_count
+    grobid_service_mock.assert_called_once()
+    assert b"<TEI/>" == tei_paths[up_to_date_pdf].read_bytes()
+    tei = colrev.env.tei_parser.TEIParser(
+        environment_manager=colrev.env.environment_manager.EnvironmentManager(),
+        tei_path=available[tmp_path / Path("pdfs/a.pdf")],
+    )
+    assert "0.8.0" == tei.get_grobid_version()
+
+    # TEIs are generated again when the PDF changes
+    os.utime(up_to_date_pdf, ns=(0, tei_paths[up_to_date_pdf].stat().st_mtime_ns + 1))
+    assert not colrev.env.tei_generator.TEIGenerator.is_up_to_date(
+        pdf_path=up_to_date_pdf, tei_path=tei_paths[up_to_date_pdf]
+    )
+    request_tei_mock.side_effect = None
+    request_tei_mock.return_value = tei_content
+    tei_generator.generate({up_to_date_pdf: tei_paths[up_to_date_pdf]})
+    assert 5 == request_tei_mock.call_count
+    assert tei_generator.is_up_to_date(
+        pdf_path=up_to_date_pdf, tei_path=tei_paths[up_to_date_pdf]
+    )
+
+    # Nothing to generate: the GROBID service is not started
+    grobid_service_mock.reset_mock()
+    assert available == tei_generator.generate(available, show_progress=False)
+    grobid_service_mock.assert_not_called()
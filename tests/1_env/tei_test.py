@@ -4,6 +4,7 @@ import re
 from pathlib import Path
 
 import pytest
+import requests_mock
 
 import colrev.env.environment_manager
 import colrev.env.tei_parser
@@ -14,6 +15,7 @@ from colrev.constants import RecordState
 
 # pylint: disable=line-too-long
 # pylint: disable=too-many-lines
+# pylint: disable=protected-access
 
 
 @pytest.fixture(scope="module")
@@ -1765,6 +1767,15 @@ def test_tei_citations_per_section(tei_doc, tmp_path) -> None:  # type: ignore
         "concluding remarks": ["b62", "b89", "b117"],
     } == tei_doc.get_citations_per_section()
 
+    # The in-text citations are indexed once (per parsed TEI)
+    section_citations = tei_doc.get_citations_per_section()
+    section_citations["concluding remarks"].append("b0")
+    assert section_citations != tei_doc.get_citations_per_section()
+    citation_index = tei_doc._get_citation_index()
+    assert citation_index is tei_doc._get_citation_index()
+    assert 1 == tei_doc._get_tei_id_count(tei_id="b118")
+    assert 0 == tei_doc._get_tei_id_count(tei_id="unknown")
+
 
 def test_tei_mark_references(tei_doc, tmp_path) -> None:  # type: ignore
     """Test the tei extraction of references"""
@@ -1818,6 +1829,32 @@ def test_tei_mark_references(tei_doc, tmp_path) -> None:  # type: ignore
     assert "NOT_INCLUDED" not in actual
 
 
+def test_tei_request_header_only(tmp_path, mocker) -> None:  # type: ignore
+    """Test the header-only TEI requests"""
+
+    mocker.patch.object(colrev.env.tei_parser.time, "sleep")
+    pdf_path = tmp_path / Path("paper.pdf")
+    pdf_path.write_bytes(b"%PDF")
+    url = "http://localhost:8070/api/processHeaderDocument"
+    with requests_mock.Mocker() as req_mock:
+        # GROBID responds with 503 if all its threads are busy
+        req_mock.post(
+            url,
+            [{"status_code": 503}, {"status_code": 200, "content": b"<TEI/>"}],
+        )
+        assert b"<TEI/>" == colrev.env.tei_parser.TEIParser.request_tei(
+            pdf_path=pdf_path, header_only=True
+        )
+        assert 2 == req_mock.call_count
+
+    tei_path = tmp_path / Path("tei/paper.tei.xml")
+    root = colrev.env.tei_parser.TEIParser.save_tei(
+        tei_path=tei_path, content=b"<TEI/>"
+    )
+    assert "TEI" == root.tag
+    assert tei_path.is_file()
+
+
 def test_tei_exception(tmp_path) -> None:  # type: ignore
     tei_path = tmp_path / Path("erroneous_tei.tei.xml")
 
@@ -1,16 +1,20 @@
 #!/usr/bin/env python
 """Tests of the load utils for bib files"""
+import copy
 import logging
 import os
 from pathlib import Path
 
+import pybtex.errors
 import pytest
 
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.bib
 import colrev.loader.load_utils
+import colrev.record.record
 import colrev.review_manager
 import colrev.settings
+import colrev.writer.bib
 
 
 def test_load(tmp_path, helpers) -> None:  # type: ignore
@@ -119,3 +123,171 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
     Path("data/search/bib_data2.unkonwn").write_text("This is not a bib file.")
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.get_nr_records(Path("data/search/bib_data2.unkonwn"))
+
+
+def _get_canonical_records(nr_records: int) -> dict:
+    return {
+        f"Author{i:06d}": {
+            "ID": f"Author{i:06d}",
+            "ENTRYTYPE": "article",
+            "colrev_origin": [f"crossref.bib/{i:06d}", f"dblp.bib/{i:06d}"],
+            "colrev_status": colrev.record.record.RecordState.md_processed,
+            "colrev_masterdata_provenance": {
+                "author": {"source": f"crossref.bib/{i:06d}", "note": ""},
+                "journal": {"source": f"crossref.bib/{i:06d}", "note": "missing"},
+            },
+            "colrev_data_provenance": {
+                "language": {"source": "LanguageDetector", "note": ""},
+            },
+            "doi": f"10.1000/ABC.{i}",
+            "author": "Author, Anna and von Neumann, John, Jr and Müller, Ö.",
+            "journal": "Journal of {Information} Systems",
+            "title": "A {B}ib{T}e{X} title, with braces",
+            "year": "2020",
+            "volume": "1",
+            "number": "2",
+            "pages": "1--10",
+            "abstract": "First sentence. Second sentence = {x}.",
+            "language": "eng",
+        }
+        for i in range(nr_records)
+    }
+
+
+def test_load_canonical(tmp_path) -> None:  # type: ignore
+    """Test the single-pass parser for files in the CoLRev format"""
+
+    records = _get_canonical_records(10)
+    bib_file = tmp_path / "records.bib"
+    colrev.writer.bib.write_file(records_dict=records, filename=bib_file)
+
+    bib_loader = colrev.loader.bib.BIBLoader(filename=bib_file)
+    with open(bib_file, encoding="utf-8") as file:
+        canonical_records = bib_loader._load_canonical_records(file_object=file)
+    assert canonical_records is not None
+    assert canonical_records == bib_loader._load_records_pybtex()
+    assert canonical_records == records
+    assert colrev.loader.load_utils.load(filename=bib_file) == records
+
+    # Non-canonical files are parsed by pybtex
+    bib_file.write_text(
+        '@string{jis = "Journal of Information Systems"}\n\n'
+        "@article{Staehr2010,\n   journal = jis,\n   title = {Title},\n}\n"
+    )
+    with open(bib_file, encoding="utf-8") as file:
+        assert bib_loader._load_canonical_records(file_object=file) is None
+    assert colrev.loader.load_utils.load(filename=bib_file) == {
+        "Staehr2010": {
+            "ID": "Staehr2010",
+            "ENTRYTYPE": "article",
+            "journal": "Journal of Information Systems",
+            "title": "Title",
+        }
+    }
+
+
+@pytest.mark.slow
+def test_bib_parser_large_file(tmp_path) -> None:  # type: ignore
+    """Test the single-pass parser against pybtex (large file)"""
+
+    records = _get_canonical_records(20000)
+    bib_file = tmp_path / "records.bib"
+    colrev.writer.bib.write_file(records_dict=records, filename=bib_file)
+    bib_loader = colrev.loader.bib.BIBLoader(filename=bib_file)
+
+    with open(bib_file, encoding="utf-8") as file:
+        canonical_records = bib_loader._load_canonical_records(file_object=file)
+
+    assert canonical_records is not None
+    assert 20000 == len(canonical_records)
+    assert canonical_records == bib_loader._load_records_pybtex()
+
+
+def test_format_names_not_strict(tmp_path) -> None:  # type: ignore
+    """Test names that are not valid in pybtex's strict mode (e.g., too many commas)"""
+
+    pybtex.errors.set_strict_mode(True)
+    try:
+        records = _get_canonical_records(1)
+        records["Author000000"]["author"] = "a, b, c, d"
+        bib_file = tmp_path / "records.bib"
+        colrev.writer.bib.write_file(records_dict=records, filename=bib_file)
+        assert (
+            "a, b, c d"
+            == colrev.loader.load_utils.load(filename=bib_file)["Author000000"][
+                "author"
+            ]
+        )
+
+        pybtex.errors.set_strict_mode(True)
+        assert (
+            "a, b, c d"
+            == colrev.loader.bib.normalize_fields(
+                {"ID": "a", "ENTRYTYPE": "article", "author": "a, b, c, d"}
+            )["author"]
+        )
+    finally:
+        pybtex.errors.set_strict_mode(False)
+
+
+def test_to_string_cache() -> None:
+    """Test the (cached) serialization of records"""
+
+    records = _get_canonical_records(3)
+    records["Author000001"]["colrev_origin"] = ["z.bib/1", "a.bib/1;", "z.bib/1"]
+    records_copy = copy.deepcopy(records)
+
+    expected = colrev.writer.bib.to_string(records_dict=records)
+    assert records == records_copy
+    assert "   colrev_origin                 = {a.bib/1;\n" in expected
+
+    cache: dict = {}
+    assert expected == colrev.writer.bib.to_string(records_dict=records, cache=cache)
+    assert 3 == len(cache)
+    assert expected == colrev.writer.bib.to_string(records_dict=records, cache=cache)
+    assert 3 == len(cache)
+
+    # Changed records are serialized again
+    records["Author000001"]["colrev_masterdata_provenance"]["author"]["note"] = "x"
+    actual = colrev.writer.bib.to_string(records_dict=records, cache=cache)
+    assert actual == colrev.writer.bib.to_string(records_dict=records)
+    assert actual != expected
+    assert 4 == len(cache)
+
+
+def test_normalize_fields() -> None:
+    """Test the (in-memory) normalization of fields (like writing/loading records)"""
+
+    def round_trip(record_dict: dict) -> dict:
+        return colrev.loader.load_utils.loads(
+            load_string=colrev.writer.bib.to_string(
+                records_dict={record_dict["ID"]: record_dict}
+            ),
+            implementation="bib",
+        )[record_dict["ID"]]
+
+    records = _get_canonical_records(3)
+    records["Author000001"].update(
+        {
+            "ENTRYTYPE": "Article",
+            "title": "  Multi-line\n  title\twith   whitespace ",
+            "author": "Jane Doe and van der Berg, J. and Smith, Jr., John",
+            "doi": "10.1/abc",
+            "journal": "",
+            "note": "",
+            "editor": "",
+            "pages": "nan",
+            "colrev_status": "md_prepared",
+        }
+    )
+    skip = ["colrev_origin", "colrev_masterdata_provenance", "colrev_data_provenance"]
+    for record_dict in records.values():
+        expected = {k: v for k, v in round_trip(record_dict).items() if k not in skip}
+        assert expected == colrev.loader.bib.normalize_fields(record_dict, skip=skip)
+
+    # Provenance fields and non-canonical values require a round trip
+    assert colrev.loader.bib.normalize_fields(records["Author000002"]) is None
+    records["Author000002"]["title"] = "Title}"
+    assert (
+        colrev.loader.bib.normalize_fields(records["Author000002"], skip=skip) is None
+    )
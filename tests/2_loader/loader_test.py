@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
 import colrev.review_manager
 import colrev.settings
@@ -47,3 +48,94 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
 
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.loads(load_string="content...", implementation="xy")
+
+    with pytest.raises(colrev_exceptions.ImportException):
+        colrev.loader.load_utils.loads(
+            load_string="title,author\na,b\nc,d,e,f\n", implementation="csv"
+        )
+
+
+@pytest.mark.parametrize(
+    "source_file, unique_id_field",
+    [
+        ("bib_data.bib", ""),
+        ("ris_data.ris", "INCREMENTAL"),
+        ("nbib_data.nbib", "INCREMENTAL"),
+        ("enl_data.enl", "INCREMENTAL"),
+    ],
+)
+def test_loads(source_file: str, unique_id_field: str, tmp_path, helpers) -> None:  # type: ignore
+    """Test that loading strings (in-memory) corresponds to loading files"""
+    os.chdir(tmp_path)
+
+    def entrytype_setter(record_dict: dict) -> None:
+        record_dict.setdefault("ENTRYTYPE", "misc")
+
+    helpers.retrieve_test_file(
+        source=Path("2_loader/data") / source_file,
+        target=Path("data/search") / source_file,
+    )
+    load_string = Path("data/search", source_file).read_text(encoding="utf-8")
+
+    records = colrev.loader.load_utils.loads(
+        load_string=load_string,
+        implementation=Path(source_file).suffix[1:],
+        entrytype_setter=entrytype_setter,
+        unique_id_field=unique_id_field,
+    )
+    assert records == colrev.loader.load_utils.load(
+        filename=Path("data/search") / source_file,
+        entrytype_setter=entrytype_setter,
+        unique_id_field=unique_id_field,
+    )
+
+
+def test_get_nr_records_in_files(tmp_path, helpers, mocker, caplog) -> None:  # type: ignore
+    """Test the (cached) numbers of records in files"""
+    os.chdir(tmp_path)
+    for source_file in ["bib_data.bib", "ris_data.ris"]:
+        helpers.retrieve_test_file(
+            source=Path("2_loader/data") / Path(source_file),
+            target=Path("data/search") / Path(source_file),
+        )
+    filenames = [
+        Path("data/search/bib_data.bib"),
+        Path("data/search/ris_data.ris"),
+        Path("data/search/missing.bib"),
+    ]
+    expected = {
+        filename: colrev.loader.load_utils.get_nr_records(filename)
+        for filename in filenames
+    }
+    cache_path = tmp_path / Path(".colrev/nr_records_cache.json")
+
+    with caplog.at_level(logging.WARNING):
+        assert expected == colrev.loader.load_utils.get_nr_records_in_files(
+            filenames, cache_path=cache_path
+        )
+    assert "File not found: data/search/missing.bib" in caplog.text
+    assert cache_path.is_file()
+
+    # Unchanged files are not read again
+    get_nr_records_spy = mocker.spy(colrev.loader.load_utils, "get_nr_records")
+    assert expected == colrev.loader.load_utils.get_nr_records_in_files(
+        filenames, cache_path=cache_path
+    )
+    assert 0 == get_nr_records_spy.call_count
+
+    # Changed files are read again
+    with open(filenames[0], "a", encoding="utf-8") as file:
+        file.write("\n@article{New2024,\n  title = {New},\n}\n")
+    actual = colrev.loader.load_utils.get_nr_records_in_files(
+        filenames, cache_path=cache_path
+    )
+    assert expected[filenames[0]] + 1 == actual[filenames[0]]
+    get_nr_records_spy.assert_called_once_with(filenames[0])
+
+    # Files are read again when the CoLRev version changes
+    get_nr_records_spy.reset_mock()
+    mocker.patch("colrev.__version__", "0.0.0")
+    assert actual == colrev.loader.load_utils.get_nr_records_in_files(
+        filenames, cache_path=cache_path
+    )
+    assert 2 == get_nr_records_spy.call_count
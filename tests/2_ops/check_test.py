@@ -5,7 +5,12 @@ import typing
 from dataclasses import asdict
 from pathlib import Path
 
+import pytest
+
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import OperationsType
+from colrev.constants import RecordState
 from colrev.constants import SearchType
 
 
@@ -67,3 +72,63 @@ def test_checks(  # type: ignore
             },
         ]
         assert expected == actual
+
+
+def _get_status_data_test_records(nr_records: int) -> typing.Tuple[dict, dict]:
+    # Two origins per record: the prior status is given by the first one
+    prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
+    records = {}
+    for i in range(nr_records):
+        origins = [f"crossref.bib/{i:06d}", f"dblp.bib/{i:06d}"]
+        prior[Fields.STATUS].append([origins[1], RecordState.md_imported])
+        prior[Fields.STATUS].append([origins[0], RecordState.md_prepared])
+        records[f"R{i:06d}"] = {
+            Fields.ID: f"R{i:06d}",
+            Fields.ORIGIN: origins,
+            Fields.STATUS: RecordState.md_prepared,
+        }
+    return prior, records
+
+
+def test_status_transitions(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the status transitions"""
+
+    checker = colrev.ops.checker.Checker(review_manager=base_repo_review_manager)
+    prior, records = _get_status_data_test_records(2)
+    records["R000001"][Fields.STATUS] = RecordState.md_imported
+    records["R000002"] = {
+        Fields.ID: "R000002",
+        Fields.ORIGIN: ["new.bib/1"],
+        Fields.STATUS: RecordState.md_imported,
+    }
+    status_data = checker._retrieve_status_data(prior=prior, records=records)
+    assert status_data["status_transitions"] == [
+        {"R000000": OperationsType.prep},
+        {"R000001": "load"},
+        {"R000002": "load"},
+    ]
+    assert status_data["invalid_state_transitions"] == []
+
+    records["R000000"][Fields.STATUS] = RecordState.rev_included
+    status_data = checker._retrieve_status_data(prior=prior, records=records)
+    assert status_data["start_states"] == [RecordState.md_imported]
+    assert status_data["invalid_state_transitions"] == [
+        "R000000: md_imported to rev_included"
+    ]
+
+
+@pytest.mark.slow
+def test_status_transitions_large(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the status transitions of a large project (100k origins)"""
+
+    checker = colrev.ops.checker.Checker(review_manager=base_repo_review_manager)
+    prior, records = _get_status_data_test_records(50000)
+
+    status_data = checker._retrieve_status_data(prior=prior, records=records)
+
+    assert len(status_data["status_transitions"]) == 50000
+    assert status_data["invalid_state_transitions"] == []
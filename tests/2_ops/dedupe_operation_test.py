@@ -7,6 +7,9 @@ from pathlib import Path
 import pytest
 
 import colrev.review_manager
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 @pytest.fixture(scope="session", name="dedupe_test_setup")
@@ -106,3 +109,60 @@ def test_dedupe_skip_prescreen(
     dedupe_test_setup.settings.prescreen.prescreen_package_endpoints = []
     dedupe_operation.main()
     # TODO : add testing of results
+
+
+def test_get_records_to_merge(
+    dedupe_test_setup: colrev.review_manager.ReviewManager, monkeypatch
+) -> None:
+    """Test the clusters and primary records of the merges"""
+
+    dedupe_operation = dedupe_test_setup.get_dedupe_operation()
+
+    id_sets = [["a", "b"], ("c", "d"), ["b", "c"], ["e"], ["f", "g"]]
+    # pylint: disable=protected-access
+    assert [["a", "b", "c", "d"], ["f", "g"]] == dedupe_operation._get_id_clusters(
+        id_sets
+    )
+    assert [["a", "b", "c", "d"], ["f", "g"]] == dedupe_operation.connected_components(
+        [["d", "c"], ["b", "a"], ["c", "b"], ["g", "f"]]
+    )
+
+    records = {
+        rid: {Fields.ID: rid, Fields.STATUS: status}
+        for rid, status in [
+            ("a", RecordState.md_prepared),
+            ("b", RecordState.md_processed),
+            ("c", RecordState.md_prepared),
+            ("d", RecordState.md_prepared),
+        ]
+    }
+    pairs = [
+        (main_record.data[Fields.ID], dupe_record.data[Fields.ID])
+        for main_record, dupe_record in dedupe_operation._get_records_to_merge(
+            records=records, id_clusters=[["a", "b", "c", "d"]]
+        )
+    ]
+    assert [("b", "a"), ("b", "c"), ("b", "d")] == pairs
+
+    # Cross-level records are not selected as primary records (mixed clusters)
+    monkeypatch.setattr(dedupe_operation.review_manager, "force_mode", False)
+    records = {
+        rid: {Fields.ID: rid, Fields.STATUS: status, Fields.ENTRYTYPE: entrytype}
+        for rid, status, entrytype in [
+            ("p", RecordState.md_processed, ENTRYTYPES.PROCEEDINGS),
+            ("q", RecordState.md_prepared, ENTRYTYPES.INPROCEEDINGS),
+            ("r", RecordState.md_prepared, ENTRYTYPES.INPROCEEDINGS),
+            ("s", RecordState.md_processed, ENTRYTYPES.BOOK),
+            ("t", RecordState.md_prepared, ENTRYTYPES.BOOK),
+            ("u", RecordState.md_prepared, ENTRYTYPES.INBOOK),
+            ("v", RecordState.md_prepared, ENTRYTYPES.INBOOK),
+        ]
+    }
+    pairs = [
+        (main_record.data[Fields.ID], dupe_record.data[Fields.ID])
+        for main_record, dupe_record in dedupe_operation._get_records_to_merge(
+            records=records,
+            id_clusters=[["p", "q", "r"], ["s", "t", "u", "v"], ["p", "q"]],
+        )
+    ]
+    assert [("q", "r"), ("s", "t"), ("u", "v")] == pairs
@@ -493,3 +493,70 @@ def test_search_feed_prep_mode(search_feed, caplog) -> None:  # type: ignore
     )
     assert record_dict[Fields.ORIGIN] == ["test.bib/000001"]
     search_feed.prep_mode = False
+
+
+def test_search_feed_get_main_record(search_feed) -> None:  # type: ignore
+    """Test the retrieval of main records based on the origin index"""
+
+    search_feed.records = {
+        "0001": {Fields.ID: "0001", Fields.ORIGIN: ["test.bib/000001"]},
+        "0002": {
+            Fields.ID: "0002",
+            Fields.ORIGIN: ["other.bib/000001", "test.bib/000002"],
+        },
+    }
+    assert "0002" == search_feed._get_main_record("test.bib/000002").data[Fields.ID]
+    with pytest.raises(colrev.exceptions.RecordNotFoundException):
+        search_feed._get_main_record("test.bib/000003")
+
+    # Changes of the origins (e.g., merges) are considered
+    search_feed.records["0001"][Fields.ORIGIN].append("test.bib/000002")
+    del search_feed.records["0002"]
+    search_feed.records["0003"] = {
+        Fields.ID: "0003",
+        Fields.ORIGIN: ["test.bib/000003"],
+    }
+    assert "0001" == search_feed._get_main_record("test.bib/000002").data[Fields.ID]
+    assert "0003" == search_feed._get_main_record("test.bib/000003").data[Fields.ID]
+
+    # Origins added to existing records (without changes of the records dict)
+    search_feed.records["0003"][Fields.ORIGIN].append("test.bib/000004")
+    assert "0003" == search_feed._get_main_record("test.bib/000004").data[Fields.ID]
+
+
+def test_search_feed_have_changed(search_feed) -> None:  # type: ignore
+    """Test the change detection (ignoring changes from saving/loading records)"""
+
+    record_dict = {
+        Fields.ID: "000001",
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Analyzing the past to prepare for the future",
+        Fields.AUTHOR: "Webster, J and Watson, R",
+        Fields.DOI: "10.111/2222",
+        Fields.CITED_BY: "12",
+    }
+    loaded_record_dict = {
+        **record_dict,
+        Fields.ENTRYTYPE: "Article",
+        Fields.TITLE: "Analyzing the past to prepare\n   for the future ",
+        Fields.AUTHOR: "J Webster and R Watson",
+        Fields.DOI: "10.111/2222",
+        Fields.JOURNAL: "",
+    }
+    assert not search_feed._have_changed(
+        colrev.record.record.Record(record_dict),
+        colrev.record.record.Record(loaded_record_dict),
+    )
+    loaded_record_dict[Fields.CITED_BY] = "13"
+    assert search_feed._have_changed(
+        colrev.record.record.Record(record_dict),
+        colrev.record.record.Record(loaded_record_dict),
+    )
+    # Records requiring a full round trip (unbalanced braces)
+    record_dict[Fields.TITLE] = "Analyzing} the past to prepare for the future"
+    loaded_record_dict[Fields.TITLE] = record_dict[Fields.TITLE]
+    loaded_record_dict[Fields.CITED_BY] = "12"
+    assert not search_feed._have_changed(
+        colrev.record.record.Record(record_dict),
+        colrev.record.record.Record(loaded_record_dict),
+    )
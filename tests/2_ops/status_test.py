@@ -4,6 +4,8 @@ from pathlib import Path
 
 import colrev.ops.check
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_get_analytics(  # type: ignore
@@ -74,6 +76,20 @@ def test_status_stats(  # type: ignore
     print(status_stats)
     assert status_stats.atomic_steps == 9
 
+    # The frequencies correspond to the status of the records
+    status_list = [r[Fields.STATUS] for r in records.values()]
+    assert status_list.count(RecordState.md_processed) == (
+        status_stats.currently.md_processed
+    )
+    assert len(
+        [
+            x
+            for x in status_list
+            if x in RecordState.get_post_x_states(state=RecordState.md_prepared)
+        ]
+    ) == (status_stats.overall.md_prepared)
+    assert 1 == status_stats.overall.md_retrieved
+
 
 def test_get_review_status_report(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Test the curation_full_outlet_dedupe"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import colrev.ops.dedupe
+import colrev.packages.curation_full_outlet_dedupe.src.curation_dedupe
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+
+
+@pytest.fixture(name="curation_dedupe")
+def get_curation_dedupe(
+    dedupe_operation: colrev.ops.dedupe.Dedupe,
+) -> colrev.packages.curation_full_outlet_dedupe.src.curation_dedupe.CurationDedupe:
+    """Get the CurationDedupe fixture"""
+    settings = {
+        "endpoint": "colrev.curation_full_outlet_dedupe",
+        "selected_source": "data/search/pdfs.bib",
+    }
+    return (
+        colrev.packages.curation_full_outlet_dedupe.src.curation_dedupe.CurationDedupe(
+            dedupe_operation=dedupe_operation, settings=settings
+        )
+    )
+
+
+def test_calculate_similarities(  # type: ignore
+    curation_dedupe,
+) -> None:
+    """Test the (vectorized) similarity matrix"""
+
+    references = pd.DataFrame.from_records(
+        [
+            {Fields.ID: "0", Fields.AUTHOR: "Smith, A", Fields.TITLE: "Digital work"},
+            {Fields.ID: "1", Fields.AUTHOR: "Smith, A", Fields.TITLE: "Digital work"},
+            {Fields.ID: "2", Fields.AUTHOR: "Smith, A.", Fields.TITLE: "DIGITAL WORK"},
+            {Fields.ID: "3", Fields.AUTHOR: "Meyer, B", Fields.TITLE: "Platforms"},
+            {Fields.ID: "4", Fields.AUTHOR: "Meyer, B", Fields.TITLE: "Platform"},
+        ]
+    )
+    similarity_array = np.zeros([5, 5])
+    similarity_array[4, 3] = -1
+
+    similarity_array, tuples_to_process = curation_dedupe._calculate_similarities(
+        similarity_array=similarity_array,
+        references=references,
+        min_similarity=0.9,
+    )
+
+    assert [["2", "1", 0.9765, "not_processed"]] == tuples_to_process
+    # The first entry is not compared and entries set to -1 are not overwritten
+    assert not similarity_array[:, 0].any() and not similarity_array[0, :].any()
+    assert -1 == similarity_array[4, 3]
+    assert not np.triu(similarity_array).any()
+    for i, j in [(3, 1), (3, 2), (4, 1), (4, 2)]:
+        assert similarity_array[i, j] == curation_dedupe._get_similarity(
+            df_a=references.iloc[i], df_b=references.iloc[j]
+        )
+
+
+def test_get_toc_index(curation_dedupe) -> None:  # type: ignore
+    """Test the toc index"""
+
+    records_list = [
+        {
+            Fields.ID: "0",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "1",
+            Fields.NUMBER: "1",
+        },
+        {
+            Fields.ID: "1",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "1",
+            Fields.NUMBER: "2",
+        },
+        {
+            Fields.ID: "2",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "MIS Quarterly",
+            Fields.VOLUME: "1",
+            Fields.NUMBER: "1",
+        },
+        {
+            Fields.ID: "3",
+            Fields.ENTRYTYPE: ENTRYTYPES.INPROCEEDINGS,
+            Fields.BOOKTITLE: "ICIS",
+            Fields.YEAR: "2020",
+        },
+    ]
+    toc_items = curation_dedupe._get_toc_items(records_list=records_list)
+    toc_index = curation_dedupe._get_toc_index(
+        records_list=records_list, toc_items=toc_items
+    )
+
+    for toc_item in toc_items:
+        assert [
+            r
+            for r in records_list
+            if all(r.get(k, "NA") == v for k, v in toc_item.items())
+        ] == curation_dedupe._get_toc_records(toc_index=toc_index, toc_item=toc_item)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Test the (default) dedupe package"""
+from pathlib import Path
+
+import colrev.ops.dedupe
+import colrev.packages.dedupe.src.dedupe
+import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+# pylint: disable=protected-access
+
+
+def test_incremental_dedupe(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test the dedupe of new records against the blocking index"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    helpers.retrieve_test_file(
+        source=Path("data/dedupe/records.bib"),
+        target=Path("data/records.bib"),
+    )
+    base_repo_review_manager.dataset.add_changes(Path("data/records.bib"))
+    base_repo_review_manager.dataset.create_commit(
+        msg="Import dedupe test cases", manual_author=True
+    )
+
+    dedupe_operation = base_repo_review_manager.get_dedupe_operation()
+    dedupe = colrev.packages.dedupe.src.dedupe.Dedupe(
+        dedupe_operation=dedupe_operation, settings={"endpoint": "colrev.dedupe"}
+    )
+    dedupe.run_dedupe()
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    assert "Staehr2010a" not in records
+    index_df = dedupe._load_blocking_index()
+    assert set(records) == set(index_df.index)
+    assert {"old_search"} == set(index_df["search_set"])
+
+    # New records are prepared and blocked against the indexed records
+    new_record = records["Stahl2008"].copy()
+    new_record[Fields.ID] = "Stahl2008x"
+    new_record[Fields.ORIGIN] = ["new.bib/000001"]
+    new_record[Fields.STATUS] = RecordState.md_prepared
+    records["Stahl2008x"] = new_record
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.dataset.create_commit(
+        msg="Add new record", manual_author=True
+    )
+
+    get_records_for_dedupe_spy = mocker.spy(
+        colrev.ops.dedupe.Dedupe, "get_records_for_dedupe"
+    )
+    block_spy = mocker.spy(colrev.packages.dedupe.src.dedupe, "block")
+    dedupe.run_dedupe()
+
+    prepared_df = get_records_for_dedupe_spy.call_args.kwargs["records_df"]
+    assert ["Stahl2008x"] == prepared_df.index.tolist()
+    blocked_df = block_spy.call_args.args[0]
+    assert "Stahl2008" in blocked_df.index
+    assert blocked_df.shape[0] < len(records)
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    assert "Stahl2008x" not in records
+    assert "new.bib/000001" in records["Stahl2008"][Fields.ORIGIN]
+    index_df = dedupe._load_blocking_index()
+    assert set(records) == set(index_df.index)
@@ -128,3 +128,42 @@ def test_prep_exclude_languages(
     returned_record = elp_elp.prepare(record=record)
     actual = returned_record.data
     assert expected == actual
+
+
+@pytest.mark.slow
+def test_prep_exclude_languages_precompute_batch(
+    elp_elp: colrev.packages.exclude_languages.src.exclude_languages.ExcludeLanguagesPrep,
+) -> None:
+    """Test the batch language detection of the prep_exclude_languages"""
+    titles = [
+        "An Integrated Framework for Understanding Digital Work in Organizations",
+        "Digitale Soziale Sicherung: Potenzial fur die Plattformarbeit",
+    ]
+    records = [
+        colrev.record.record_prep.PrepRecord({Fields.TITLE: title}) for title in titles
+    ]
+    elp_elp.precompute_batch(records)
+    # pylint: disable=protected-access
+    assert set(titles) == set(elp_elp._title_languages)
+
+    for record in records:
+        expected = elp_elp.language_service.compute_language(
+            text=record.data[Fields.TITLE]
+        )
+        assert expected == elp_elp.prepare(record=record).data[Fields.LANGUAGE]
+
+
+def test_prep_exclude_languages_precomputed_empty(
+    elp_elp: colrev.packages.exclude_languages.src.exclude_languages.ExcludeLanguagesPrep,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker,  # type: ignore
+) -> None:
+    """Test that precomputed (empty) languages are not computed again"""
+    title = "An Integrated Framework for Understanding Digital Work in Organizations"
+    monkeypatch.setattr(elp_elp, "_title_languages", {title: ""})
+    compute_language_mock = mocker.patch.object(
+        elp_elp.language_service, "compute_language", return_value="eng"
+    )
+    record = colrev.record.record_prep.PrepRecord({Fields.TITLE: title})
+    elp_elp.prepare(record=record)
+    compute_language_mock.assert_not_called()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Test the pubmed SearchSource"""
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import colrev.ops.prep
+import colrev.packages.pubmed.src.pubmed
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.constants import SearchType
+
+# pylint: disable=protected-access
+
+EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+
+
+@pytest.fixture(scope="package", name="pubmed_search_source")
+def fixture_pubmed_search_source(
+    prep_operation: colrev.ops.prep.Prep,
+) -> colrev.packages.pubmed.src.pubmed.PubMedSearchSource:
+    """Fixture for pubmed SearchSource"""
+    settings = {
+        "endpoint": "colrev.pubmed",
+        "filename": Path("data/search/pubmed.bib"),
+        "search_type": SearchType.API,
+        "search_parameters": {"query": "eating"},
+        "comment": "",
+    }
+    return colrev.packages.pubmed.src.pubmed.PubMedSearchSource(
+        source_operation=prep_operation, settings=settings
+    )
+
+
+def test_pubmed_query_ids(  # type: ignore
+    pubmed_search_source: colrev.packages.pubmed.src.pubmed.PubMedSearchSource,
+    helpers,
+    tmp_path,
+    mocker,
+) -> None:
+    """Test the batched retrieval of records (one efetch request)"""
+
+    mocker.patch.object(
+        Filepaths, "PREP_REQUESTS_CACHE_FILE", tmp_path / "prep_requests_cache"
+    )
+
+    xml_str = helpers.retrieve_test_file_content(
+        source=Path("3_packages_search/api_output/pubmed/efetch.xml")
+    )
+    with requests_mock.Mocker() as req_mock:
+        req_mock.get(
+            f"{EUTILS_URL}efetch.fcgi?db=pubmed&id=10075143,99999999,10024335"
+            "&rettype=xml&retmode=text",
+            content=xml_str.encode("utf-8"),
+        )
+        actual = pubmed_search_source._pubmed_query_ids(
+            pubmed_ids=["10075143", "99999999", "10024335"]
+        )
+        assert 1 == req_mock.call_count
+
+    assert ["10075143", None, "10024335"] == [r.get("pubmedid") for r in actual]
+    assert {"pubmed_id": "99999999"} == actual[1]
+    assert {
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Distinct and combined vascular effects of ACE blockade "
+        "and HMG-CoA reductase inhibition in hypertensive subjects",
+        Fields.AUTHOR: "Nazzaro, P and Manzari, M",
+        Fields.JOURNAL: "Hypertension",
+        Fields.VOLUME: "33",
+        Fields.NUMBER: "2",
+        Fields.YEAR: "1999",
+        "pubmedid": "10024335",
+        Fields.DOI: "10.1161/01.HYP.33.2.719",
+    } == actual[2]
+    assert "Eating behavior in adolescents" == actual[0][Fields.TITLE]
+    assert "Meyer, Anna" == actual[0][Fields.AUTHOR]
+
+
+def test_pubmed_query_return_from_history(  # type: ignore
+    pubmed_search_source: colrev.packages.pubmed.src.pubmed.PubMedSearchSource,
+    helpers,
+    mocker,
+) -> None:
+    """Test the retrieval of search results from the history server"""
+
+    mocker.patch.object(pubmed_search_source, "_efetch_batch_size", 1)
+    mocker.patch.dict(pubmed_search_source.search_source.search_parameters)
+    pubmed_search_source.search_source.search_parameters["use_history"] = True
+    xml_str = helpers.retrieve_test_file_content(
+        source=Path("3_packages_search/api_output/pubmed/efetch.xml")
+    )
+    with requests_mock.Mocker() as req_mock:
+        req_mock.get(
+            f"{EUTILS_URL}esearch.fcgi?db=pubmed&term=eating&usehistory=y",
+            content=helpers.retrieve_test_file_content(
+                source=Path("3_packages_search/api_output/pubmed/esearch.xml")
+            ).encode("utf-8"),
+        )
+        req_mock.get(f"{EUTILS_URL}efetch.fcgi", content=xml_str.encode("utf-8"))
+        records = list(pubmed_search_source._get_pubmed_query_return())
+
+        efetch_queries = [r.qs for r in req_mock.request_history[1:]]
+    assert 4 == len(records)
+    assert [["0"], ["1"]] == [q["retstart"] for q in efetch_queries]
+    assert all(
+        q["webenv"] == ["mcid_0123456789"] and q["query_key"] == ["1"]
+        for q in efetch_queries
+    )